@@ -0,0 +1,86 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+""" 
+    Startup-time benchmark for the balancerpy package
+
+    Times `import balancerpy` (and `from balancerpy import *`) in fresh interpreters, 
+    interleaved with a baseline `import numpy` (the package's one heavy dependency, 
+    timed the same way in the same rounds so machine noise hits both), and reports 
+    the median of each and its ratio to the baseline median. Exits non-zero when a 
+    ratio exceeds --max-ratio or when uniswappy was imported at startup
+
+    usage: python bench_import.py [--runs N] [--max-ratio R]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+BASELINE = 'import numpy'
+
+STATEMENTS = {
+    'import balancerpy': 'import balancerpy',
+    'from balancerpy import *': 'from balancerpy import *',
+}
+
+PROBE = """
+import sys, time
+t0 = time.perf_counter()
+{stmt}
+t1 = time.perf_counter()
+print((t1 - t0) * 1e3, int('uniswappy' in sys.modules))
+"""
+
+def time_once(stmt):
+    out = subprocess.run([sys.executable, '-c', PROBE.format(stmt=stmt)], 
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), bool(int(out[1]))
+
+def time_imports(runs):
+    stmts = [BASELINE] + list(STATEMENTS.values())
+    times = {stmt: [] for stmt in stmts}
+    loaded_uniswappy = {stmt: False for stmt in stmts}
+    for _ in range(runs):
+        for stmt in stmts:
+            elapsed, loaded = time_once(stmt)
+            times[stmt].append(elapsed)
+            loaded_uniswappy[stmt] |= loaded
+    return {stmt: statistics.median(ts) for stmt, ts in times.items()}, loaded_uniswappy
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=11)
+    parser.add_argument('--max-ratio', type=float, default=3.0)
+    args = parser.parse_args()
+
+    medians, loaded_uniswappy = time_imports(args.runs)
+    base_ms = medians[BASELINE]
+    print(f"{BASELINE:<28} median {base_ms:8.1f} ms  (baseline)")
+    failed = False
+    for label, stmt in STATEMENTS.items():
+        ratio = medians[stmt] / base_ms
+        over_budget = ratio > args.max_ratio
+        failed |= over_budget or loaded_uniswappy[stmt]
+        print(f"{label:<28} median {medians[stmt]:8.1f} ms  {ratio:5.2f}x baseline (max {args.max_ratio:.1f}x)  "
+              f"uniswappy loaded: {loaded_uniswappy[stmt]}  {'FAIL' if over_budget or loaded_uniswappy[stmt] else 'ok'}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
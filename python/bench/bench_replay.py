@@ -0,0 +1,96 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+""" 
+    Throughput benchmark for ReplayEngine
+
+    Writes a synthetic event file (LOG_SWAP / LOG_JOIN / LOG_EXIT against a DAI-WETH 
+    pool), replays it with checkpoints, then replays the first half, resumes from the 
+    checkpoint and checks that the resumed pool ends in the same state
+
+    usage: python bench_replay.py [--events N] [--math-mode float|decimal|integer] [--dir DIR]
+"""
+
+import argparse
+import os
+import tempfile
+import numpy as np
+from balancerpy import ERC20, BalancerVault, BalancerFactory, BalancerExchangeData, Join, ReplayEngine
+
+AMT_DAI = 10000000
+AMT_ETH = 67738.6361731024
+
+def make_pool(math_mode):
+    dai = ERC20("DAI", "0x111")
+    dai.deposit(None, AMT_DAI)
+    weth = ERC20("WETH", "0x09")
+    weth.deposit(None, AMT_ETH)
+    vault = BalancerVault()
+    vault.add_token(dai, 10)
+    vault.add_token(weth, 40)
+    lp = BalancerFactory("WETH pool factory", "0x2").deploy(BalancerExchangeData(vault = vault, symbol = "LP", address = "0x011", math_mode = math_mode))
+    Join().apply(lp, "user", 100)
+    return lp
+
+def write_events(path, n_events, seed = 42):
+    rng = np.random.default_rng(seed)
+    kinds = rng.choice(3, size = n_events, p = [0.96, 0.02, 0.02])
+    dai_in = rng.random(n_events) < 0.5
+    amts_dai = rng.uniform(1, 10000, n_events)
+    amts_eth = amts_dai / 590
+    with open(path, 'w') as f:
+        f.write('event,caller,token_in,token_out,amount_in,amount_out\n')
+        for kind, is_dai, amt_dai, amt_eth in zip(kinds.tolist(), dai_in.tolist(), amts_dai.tolist(), amts_eth.tolist()):
+            if kind == 0 and is_dai:
+                f.write(f'LOG_SWAP,trader,DAI,WETH,{amt_dai!r},\n')
+            elif kind == 0:
+                f.write(f'LOG_SWAP,trader,WETH,DAI,{amt_eth!r},\n')
+            elif kind == 1:
+                f.write(f'LOG_JOIN,user,DAI,,{amt_dai!r},\n')
+            else:
+                f.write(f'LOG_EXIT,user,,DAI,,{amt_dai / 2!r}\n')
+
+def pool_state(lp):
+    return lp.state.reserves.tolist() + lp.state.fees.tolist() + [lp.pool_shares]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1000000)
+    parser.add_argument('--math-mode', default='float')
+    parser.add_argument('--dir', default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        path = os.path.join(tmp, 'events.csv')
+        write_events(path, args.events)
+        print(f"event file: {args.events} events, {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        every = max(1, args.events // 10)
+        full = make_pool(args.math_mode)
+        out = ReplayEngine(full, os.path.join(tmp, 'full.ckpt'), checkpoint_every = every).run(path)
+        print(f"replay     {out['replayed']:>9} events  {out['elapsed']:7.2f} s  {out['events_per_sec']:10.0f} events/s")
+
+        ckpt = os.path.join(tmp, 'half.ckpt')
+        ReplayEngine(make_pool(args.math_mode), ckpt, checkpoint_every = every).run(path, max_events = args.events // 2)
+        resumed = make_pool(args.math_mode)
+        out = ReplayEngine(resumed, ckpt, checkpoint_every = every).run(path, resume = True)
+        print(f"resume     {out['replayed']:>9} events  {out['elapsed']:7.2f} s  {out['events_per_sec']:10.0f} events/s  "
+              f"same final state: {pool_state(resumed) == pool_state(full)}")
+
+if __name__ == '__main__':
+    main()
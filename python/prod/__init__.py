@@ -1,10 +1,70 @@
-from balancerpy.erc import *
-from balancerpy.vault import *
-from balancerpy.cwpt.factory import *
-from balancerpy.cwpt.exchg import *
-from balancerpy.utils.interfaces import *
-from balancerpy.utils.data import *
-from balancerpy.process.liquidity import *
-from balancerpy.process.swap import *
-from balancerpy.process.join import *
-from balancerpy.enums import *
\ No newline at end of file
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import importlib
+
+# Public names resolved lazily (PEP 562) from their subpackage on first attribute 
+# access, so importing balancerpy does not load every subpackage up front; 
+# subpackages themselves (eg, balancerpy.erc) are imported on first access too
+_LAZY_EXPORTS = {
+    '.erc': ('ERC20', 'DictLedger', 'ArrayLedger'),
+    '.vault': ('BalanceView', 'BalancerVault', 'WeightSchedule'),
+    '.cwpt.factory': ('BalancerFactory',),
+    '.cwpt.router': ('BalancerRouter',),
+    '.cwpt.exchg': ('BalancerExchange', 'BalancerMath', 'BalancerMathFloat', 'BalancerMathArray', 'BalancerMathInt', 'BalancerMathGreeks'),
+    '.cwpt.exchg.result': ('BalancerMathResult', 'BalancerMathGreeksResult'),
+    '.quote': ('CWPQuote', 'CWPSlippage'),
+    '.arb': ('CWPArbitrage',),
+    '.valuation': ('CWPValuation',),
+    '.utils.interfaces': ('IExchange', 'IExchangeFactory'),
+    '.utils.data': ('ExchangeData', 'FactoryData', 'BalancerExchangeData', 'BalancerPoolData'),
+    '.sim': ('MonteCarloRunner',),
+    '.process.liquidity': ('AddLiquidity', 'RemoveLiquidity'),
+    '.process.swap': ('Swap',),
+    '.process.join': ('Join',),
+    '.events': ('EventRecorder',),
+    '.history': ('HistorySink', 'HistoryReader'),
+    '.replay': ('ReplayEngine',),
+    '.enums': ('Proc', 'MathMode', 'Validation', 'EventKind'),
+}
+
+_LAZY_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+__all__ = list(_LAZY_MODULES)
+
+def __getattr__(name):
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        try:
+            package = importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as err:
+            if err.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        # namespace packages (cwpt, utils, process) have no __init__ to import their 
+        # subpackages, so load the exporting ones (eg, balancerpy.cwpt.exchg)
+        for module in _LAZY_EXPORTS:
+            if module.startswith(f'.{name}.'):
+                importlib.import_module(module, __name__)
+        return package
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
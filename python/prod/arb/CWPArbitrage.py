@@ -0,0 +1,155 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from ..cwpt.exchg import BalancerMathArray
+
+class CWPArbitrage():
+    
+    """ 
+        Constant weighted product liquidity pool arbitrage against an external price; 
+        the optimal trade is solved in closed form rather than by searching 
+        
+        Trading aI into a pool whose out token is worth p units of the in token 
+        earns p * aO(aI) - aI, which peaks where p * daO/daI = 1, ie
+        
+            aI* = bI * ( ( p * bO * r * g / bI )^( 1 / (r + 1) ) - 1 ) / g,   r = wI / wO,   g = 1 - sF
+        
+        (zero when p * bO * r * g / bI <= 1, ie the pool price plus fee is already 
+        within the external price). All arguments broadcast as NumPy arrays, so many 
+        pools and price points are sized in one evaluation
+    """       
+    
+    @staticmethod
+    def calc_optimal_in(
+            price_out,
+            token_balance_in,
+            token_weight_in,
+            token_balance_out,
+            token_weight_out,
+            swap_fee):
+        
+        """ calc_optimal_in
+
+            Profit-maximizing amount in for one trade direction
+                
+            Parameters
+            -----------------
+            price_out : array_like
+                External price of the out token, denominated in the in token
+            token_balance_in : array_like
+                Pool balance of input token
+            token_weight_in : array_like
+                Denormalized weight of input token
+            token_balance_out : array_like
+                Pool balance of output token
+            token_weight_out : array_like
+                Denormalized weight of output token
+            swap_fee : array_like
+                Pool swap fee
+
+            Returns
+            -----------------
+            out : tuple
+                (amt_in, amt_out, profit) arrays; profit in units of the in token
+        """            
+        
+        ratio = np.divide(token_weight_in, token_weight_out)
+        gamma = 1.0 - np.asarray(swap_fee, dtype=np.float64)
+        edge = np.log(np.multiply(price_out, token_balance_out) * ratio * gamma / token_balance_in)
+        amt_in = np.maximum(np.expm1(edge / (ratio + 1.0)), 0.0) * token_balance_in / gamma
+        amt_out = BalancerMathArray.calc_out_given_in(amt_in, token_balance_in, token_weight_in, 
+                                                      token_balance_out, token_weight_out, swap_fee).result
+        return amt_in, amt_out, np.multiply(price_out, amt_out) - amt_in
+    
+    def calc_arb(self, price, bal_x, wt_x, bal_y, wt_y, swap_fee):
+        
+        """ calc_arb
+
+            Optimal arbitrage of x/y pools against external prices, in whichever 
+            direction is profitable (vectorized)
+                
+            Parameters
+            -----------------
+            price : array_like
+                External price of token x, denominated in token y
+            bal_x : array_like
+                Pool balance of token x
+            wt_x : array_like
+                Denormalized weight of token x
+            bal_y : array_like
+                Pool balance of token y
+            wt_y : array_like
+                Denormalized weight of token y
+            swap_fee : array_like
+                Pool swap fee
+
+            Returns
+            -----------------
+            out : dict
+                dx and dy (signed change of the pool balances; positive flows into 
+                the pool) and profit (in units of token y), as arrays
+        """            
+        
+        price = np.asarray(price, dtype=np.float64)
+        y_in, x_out, profit_y = self.calc_optimal_in(price, bal_y, wt_y, bal_x, wt_x, swap_fee)
+        x_in, y_out, profit_x = self.calc_optimal_in(1.0 / price, bal_x, wt_x, bal_y, wt_y, swap_fee)
+        buy_x = profit_y > 0
+        dx = np.where(buy_x, -x_out, x_in)
+        dy = np.where(buy_x, y_in, -y_out)
+        profit = np.maximum(np.where(buy_x, profit_y, profit_x * price), 0.0)
+        return {'dx': dx, 'dy': dy, 'profit': profit}
+    
+    def get_arb(self, lp, tkn_x, tkn_y, price):
+        
+        """ get_arb
+
+            Optimal arbitrage trade of an exchange against an external price 
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            tkn_x : ERC20
+                Priced token from CWPT set     
+            tkn_y : ERC20
+                Denomination token from CWPT set   
+            price : float
+                External price of tkn_x, denominated in tkn_y
+
+            Returns
+            -----------------
+            out : dict
+                tkn_in and tkn_out (None when no trade is profitable), tkn_in_amt, 
+                tkn_out_amt and profit (in units of tkn_y)
+        """            
+        
+        assert lp.vault.get_token(tkn_x.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        assert lp.vault.get_token(tkn_y.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        
+        tkn_wts = lp.vault.get_denorm_weights()
+        balances = lp.vault.get_balances_view()
+        arb = self.calc_arb(price, balances[tkn_x.token_name], tkn_wts[tkn_x.token_name],
+                            balances[tkn_y.token_name], tkn_wts[tkn_y.token_name], lp.swap_fee)
+        dx, dy, profit = float(arb['dx']), float(arb['dy']), float(arb['profit'])
+        
+        if profit <= 0:
+            return {'tkn_in': None, 'tkn_out': None, 'tkn_in_amt': 0.0, 'tkn_out_amt': 0.0, 'profit': 0.0}
+        if dy > 0:
+            return {'tkn_in': tkn_y, 'tkn_out': tkn_x, 'tkn_in_amt': dy, 'tkn_out_amt': -dx, 'profit': profit}
+        return {'tkn_in': tkn_x, 'tkn_out': tkn_y, 'tkn_in_amt': dx, 'tkn_out_amt': -dy, 'profit': profit}
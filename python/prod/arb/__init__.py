@@ -0,0 +1 @@
+from .CWPArbitrage import CWPArbitrage
\ No newline at end of file
@@ -16,7 +16,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
-from decimal import Decimal
 from ...erc import ERC20
 from ...vault import BalancerVault
 from ..factory import BalancerFactory
@@ -24,12 +23,28 @@ from ...utils.interfaces import IExchange
 from ...utils.data import BalancerExchangeData
 from ...utils.data import FactoryData
 from .BalancerMath import BalancerMath 
+from .BalancerMathFloat import BalancerMathFloat
+from .BalancerMathArray import BalancerMathArray
+from .BalancerMathInt import BalancerMathInt
+from .state import PoolState
+from .state import PoolSnapshot
+from .state import ProviderRegistry
+from ...enums import MathMode
+from ...enums import Validation
+from ...enums import EventKind
 from .balancer_constants import EXIT_FEE
 from .balancer_constants import MAX_OUT_RATIO
+from .balancer_constants import MIN_FEE
+from .balancer_constants import MAX_FEE
+import numpy as np
 import math
+from contextlib import contextmanager
 
 SWAP_FEE = 0.0025
 MINIMUM_SHARES = 1e-15
+VALIDATION_LEVELS = (Validation.OFF, Validation.CHEAP, Validation.FULL)
+AUDIT_TOLERANCE = 1e-9
+MATH_BACKENDS = {MathMode.DECIMAL: BalancerMath, MathMode.FLOAT: BalancerMathFloat, MathMode.INTEGER: BalancerMathInt}
 
 class BalancerExchange(IExchange):
     
@@ -41,9 +56,29 @@ class BalancerExchange(IExchange):
         self.factory_struct : FactoryData
             Factory data
         self.exchg_struct : BalancerExchangeData
-            Balancer exchange data                  
+            Balancer exchange data    
+            
+        Math backend is taken from exchg_struct.math_mode, or from 
+        BalancerExchange.default_math_mode when unset (see MathMode); post-swap 
+        checks follow exchg_struct.validation (see Validation, set_validation); swap 
+        fee is exchg_struct.swap_fee, defaulting to SWAP_FEE (see set_swap_fee)
+        
+        Reserves, weights and fees are held in a PoolState (contiguous numpy arrays
+        indexed by token); tkn_reserves, tkn_weights and tkn_fees are read-only 
+        name-based dictionary facades over those arrays. pool_providers is a ProviderRegistry 
+        (user to slot of a share array), so per-provider claims and whole-pool exits 
+        run as array operations           
     """     
     
+    __slots__ = ('factory', 'vault', 'name', 'symbol', 'pool_shares', 'addr', 'state', 
+                 'collected_fees', 'pool_providers', 'last_pool_deposit', 'joined', 
+                 'math_mode', 'math', 'validation', 'swap_fee', 
+                 '_pair_cache', '_tkn_cache', '_cache_key', 
+                 '_reserves_view', '_weights_view', '_fees_view', '_journal', 'recorder')
+    
+    default_math_mode = MathMode.DECIMAL
+    default_validation = Validation.CHEAP
+    
     def __init__(self, factory_struct: FactoryData, exchg_struct: BalancerExchangeData):
         self.factory = factory_struct
         self.vault = exchg_struct.vault
@@ -51,13 +86,19 @@ class BalancerExchange(IExchange):
         self.symbol = exchg_struct.symbol
         self.pool_shares = 0
         self.addr = exchg_struct.address   
-        self.tkn_reserves = {}
-        self.tkn_weights = {}
-        self.tkn_fees = {}
+        self._set_state(PoolState(self.vault.get_names_view()))
         self.collected_fees = {}
-        self.pool_providers = {} 
+        self.pool_providers = ProviderRegistry()
         self.last_pool_deposit = 0
         self.joined = False 
+        self._pair_cache = {}
+        self._tkn_cache = {}
+        self._cache_key = None
+        self._journal = None
+        self.recorder = None
+        self.set_swap_fee(SWAP_FEE if exchg_struct.swap_fee == None else exchg_struct.swap_fee)
+        self.set_math_mode(exchg_struct.math_mode)
+        self.set_validation(exchg_struct.validation)
       
     
     def summary(self):
@@ -67,13 +108,398 @@ class BalancerExchange(IExchange):
             print(f"Reserves: {reserve_str}")
             print(f"Pool Shares: {self.pool_shares} \n")             
         else:
-            reserve_str = ", ".join([f'{tkn_nm} = {self.tkn_reserves[tkn_nm]}' for tkn_nm in self.tkn_reserves]) 
+            reserve_str = ", ".join([f'{tkn_nm} = {self._format_amount(self.tkn_reserves[tkn_nm])}' for tkn_nm in self.tkn_reserves]) 
             weights_str = ", ".join([f'{tkn_nm} = {self.tkn_weights[tkn_nm]}' for tkn_nm in self.tkn_weights]) 
             print(f"Balancer Exchange: {self.name} ({self.symbol})")
             print(f"Reserves: {reserve_str}")
             print(f"Weights: {weights_str}")
             print(f"Pool Shares: {self.pool_shares} \n") 
 
+    @staticmethod
+    def _format_amount(value):
+        
+        # reserves are held as float64; print whole amounts as integers, as the dict-backed reserves did
+        value = float(value)
+        return int(value) if value.is_integer() else value
+
+    @property
+    def tkn_reserves(self):
+        """ Read-only reserves by token name; lists every vault token (0 until joined) """
+        return self._reserves_view
+    
+    @property
+    def tkn_weights(self):
+        self._sync_weights()
+        return self._weights_view
+    
+    @property
+    def tkn_fees(self):
+        """ Read-only collected fees by token name; lists every vault token (0 until a fee is taken) """
+        return self._fees_view
+    
+    def _set_state(self, state):
+        
+        """ _set_state
+
+            Attach pool state and its name-based facades
+                
+            Parameters
+            ---------------
+            state : PoolState
+                Array-backed pool state
+        """  
+        
+        self.state = state
+        self._reserves_view = state.view(state.reserves)
+        self._weights_view = state.view(state.norm_wts)
+        self._fees_view = state.view(state.fees)
+        
+    def _sync_weights(self):
+        
+        """ _sync_weights
+
+            Reload weight arrays if vault weights changed since last load
+        """  
+        
+        if self.state.version != self.vault.version:
+            self.state.load_weights(self.vault)
+    
+    def snapshot(self):
+        
+        """ snapshot
+
+            Capture token balances (and per-address token ledgers, if any), reserves, 
+            fees, shares and provider ledger so they can be put back with restore
+                
+            Returns
+            ---------------
+            snap : PoolSnapshot
+                Captured pool state
+        """  
+        
+        return PoolSnapshot(tuple(tkn.token_total for tkn in self.vault.tkns), 
+                            self.state.reserves.copy(), self.state.fees.copy(), 
+                            self.pool_shares, self.pool_providers.copy(), 
+                            self.last_pool_deposit, self.joined, 
+                            tuple(None if tkn.ledger is None else tkn.ledger.copy() for tkn in self.vault.tkns))
+    
+    def restore(self, snap):
+        
+        """ restore
+
+            Roll the pool back to a snapshot taken on this exchange; the snapshot 
+            stays valid and can be restored again. State is written in place (the 
+            pool_providers registry and token ledgers keep their identity), and inside 
+            a transaction the restore itself is journaled, so it is undone on rollback
+                
+            Parameters
+            ---------------
+            snap : PoolSnapshot
+                Captured pool state
+        """  
+        
+        assert len(snap.tkn_totals) == len(self.vault.tkns), 'Balancer V1: SNAPSHOT NOT OF POOL'
+        
+        if self._journal is not None:
+            self._journal.append((self._restore, (self.snapshot(),)))
+        self._restore(snap)
+        
+    def _restore(self, snap):
+        for tkn, tkn_total, tkn_ledger in zip(self.vault.tkns, snap.tkn_totals, snap.tkn_ledgers):
+            tkn.token_total = tkn_total
+            if tkn_ledger is not None and tkn.ledger is not None:
+                tkn.ledger.balances = tkn_ledger.copy().balances
+        self.state.reserves[:] = snap.reserves
+        self.state.fees[:] = snap.fees
+        self.pool_shares = snap.pool_shares
+        self.pool_providers.load(snap.pool_providers)
+        self.last_pool_deposit = snap.last_pool_deposit
+        self.joined = snap.joined
+        
+    def fork(self):
+        
+        """ fork
+
+            Independent copy of the exchange for what-if evaluation; token metadata, 
+            weights, math backend and factory are shared (vault weights copy-on-write), 
+            while balances, reserves, fees, shares and provider ledger are copied. 
+            The fork is not registered with the factory. Exchange methods resolve 
+            tokens by name through the vault, so the parent's ERC20 objects can be 
+            passed to the fork and act on the fork's own balances
+                
+            Returns
+            ---------------
+            lp : BalancerExchange
+                Forked exchange
+        """  
+        
+        lp = BalancerExchange.__new__(BalancerExchange)
+        for attr in BalancerExchange.__slots__:
+            setattr(lp, attr, getattr(self, attr))
+        lp.vault = self.vault.fork()
+        lp._set_state(self.state.copy())
+        lp.pool_providers = self.pool_providers.copy()
+        lp.collected_fees = dict(self.collected_fees)
+        lp._pair_cache = dict(self._pair_cache)
+        lp._tkn_cache = dict(self._tkn_cache)
+        lp._journal = None
+        lp.recorder = None
+        return lp
+    
+    @contextmanager
+    def transaction(self):
+        
+        """ transaction
+
+            Context in which balance, reserve, fee and share mutations are journaled 
+            in an undo log; if the block raises (eg, a failed 'Balancer V1' assertion), 
+            the log is replayed in reverse and the pool is left as it was on entry. 
+            Nested transactions roll back to their own entry point
+                
+            Returns
+            ---------------
+            lp : BalancerExchange
+                This exchange
+        """  
+        
+        outer = self._journal is None
+        if outer:
+            self._journal = []
+        mark = len(self._journal)
+        try:
+            yield self
+        except BaseException:
+            self._rollback(mark)
+            raise
+        finally:
+            if outer:
+                self._journal = None
+                
+    def _rollback(self, mark):
+        
+        """ _rollback
+
+            Undo journaled mutations back to a journal position
+                
+            Parameters
+            ---------------
+            mark : int
+                Journal length at transaction entry
+        """  
+        
+        journal = self._journal
+        while len(journal) > mark:
+            undo, args = journal.pop()
+            undo(*args)
+            
+    def _log_attr(self, attr):
+        if self._journal is not None:
+            self._journal.append((setattr, (self, attr, getattr(self, attr))))
+            
+    def _log_provider(self, to):
+        if to in self.pool_providers:
+            self._journal.append((self.pool_providers.__setitem__, (to, self.pool_providers[to])))
+        else:
+            self._journal.append((self.pool_providers.pop, (to, None)))
+            
+    def _deposit(self, tkn, to, value):
+        if self._journal is not None:
+            self._journal.append((setattr, (tkn, 'token_total', tkn.token_total)))
+            if tkn.ledger is not None and to is not None:
+                self._journal.append((tkn.ledger.add, (to, value)))
+        tkn.deposit(to, value)
+        
+    def _transfer(self, tkn, to, value):
+        if self._journal is not None:
+            self._journal.append((setattr, (tkn, 'token_total', tkn.token_total)))
+            if tkn.ledger is not None and to is not None:
+                self._journal.append((tkn.ledger.add, (to, -value)))
+        tkn.transfer(to, value)
+        
+    def _credit_all(self, ledger, users, values):
+        if hasattr(ledger, 'adds'):
+            ledger.adds(users, values)
+            if self._journal is not None:
+                self._journal.append((ledger.adds, (users, -values)))
+        else:
+            for user, value in zip(users, values.tolist()):
+                ledger.add(user, value)
+                if self._journal is not None:
+                    self._journal.append((ledger.add, (user, -value)))
+            
+    def set_recorder(self, recorder = None):
+        
+        """ set_recorder
+
+            Attach (or detach, with None) an event recorder logging swaps, joins, 
+            exits, mints and burns of this exchange
+                
+            Parameters
+            ---------------
+            recorder : EventRecorder
+                Columnar event log
+        """  
+        
+        if recorder is not None:
+            recorder.tkn_nms = self.state.tkn_nms
+        self.recorder = recorder
+        
+    def _record(self, kind, tkn_in_nm, tkn_out_nm, amt_in, amt_out, fee, shares):
+        index = self.state.tkn_index
+        if self._journal is not None:
+            self._journal.append((self.recorder.truncate, (self.recorder.size,)))
+        self.recorder.record(kind, index.get(tkn_in_nm, -1), index.get(tkn_out_nm, -1), amt_in, amt_out, fee, shares)
+        
+    def set_math_mode(self, math_mode = None):
+        
+        """ set_math_mode
+
+            Select math backend used for quotes, swaps, joins and exits
+                
+            Parameters
+            ---------------
+            math_mode : MathMode
+                MathMode.DECIMAL (reference), MathMode.FLOAT (fast-path) or 
+                MathMode.INTEGER (wei fixed-point, as on-chain); None selects BalancerExchange.default_math_mode
+        """   
+        
+        math_mode = self.default_math_mode if math_mode == None else math_mode
+        assert math_mode in MATH_BACKENDS, 'Balancer: UNKNOWN MATH MODE'
+        self.math_mode = math_mode
+        self.math = MATH_BACKENDS[math_mode]
+        self._cache_key = None
+        
+    def set_swap_fee(self, swap_fee):
+        
+        """ set_swap_fee
+
+            Set pool swap fee, bounded by MIN_FEE and MAX_FEE; stored as a float 
+            (Decimal and integer backends convert it through math.to_num)
+                
+            Parameters
+            ---------------
+            swap_fee : float
+                Swap fee charged by this pool (Decimal accepted)
+        """   
+        
+        assert swap_fee >= MIN_FEE, 'Balancer V1: ERR_MIN_FEE'
+        assert swap_fee <= MAX_FEE, 'Balancer V1: ERR_MAX_FEE'
+        self.swap_fee = float(swap_fee)
+        
+    def get_pair_constants(self, tkn_in, tkn_out):
+        
+        """ get_pair_constants
+
+            Swap constants of a token pair converted to the math backend; memoized per 
+            pair and invalidated when vault weights/bounds, swap fee or math mode change
+                
+            Parameters
+            ---------------
+            tkn_in : ERC20
+                Input token           
+            tkn_out : ERC20
+                Output token   
+                
+            Returns
+            ---------------
+            constants : tuple
+                (token_weight_in, token_weight_out, swap_fee)
+        """   
+        
+        if self._cache_key != (self.vault.version, self.swap_fee):
+            self._reset_constants()
+        
+        pair = (tkn_in.token_name, tkn_out.token_name)
+        constants = self._pair_cache.get(pair)
+        if constants is None:
+            tkn_denorm_wts = self.vault.get_denorm_weights()
+            constants = (self.math.to_num(tkn_denorm_wts[pair[0]]), 
+                         self.math.to_num(tkn_denorm_wts[pair[1]]), 
+                         self.math.to_num(self.swap_fee))
+            self._pair_cache[pair] = constants
+        return constants
+    
+    def get_token_constants(self, tkn):
+        
+        """ get_token_constants
+
+            Join/exit constants of a token converted to the math backend; memoized per 
+            token and invalidated when vault weights/bounds, swap fee or math mode change
+                
+            Parameters
+            ---------------
+            tkn : ERC20
+                Token joining or exiting   
+                
+            Returns
+            ---------------
+            constants : tuple
+                (token_weight, total_weight, swap_fee)
+        """   
+        
+        if self._cache_key != (self.vault.version, self.swap_fee):
+            self._reset_constants()
+        
+        constants = self._tkn_cache.get(tkn.token_name)
+        if constants is None:
+            tkn_denorm_wts = self.vault.get_denorm_weights()
+            constants = (self.math.to_num(tkn_denorm_wts[tkn.token_name]), 
+                         self.math.to_num(self.vault.get_total_denorm_weight()), 
+                         self.math.to_num(self.swap_fee))
+            self._tkn_cache[tkn.token_name] = constants
+        return constants
+    
+    def _reset_constants(self):
+        
+        """ _reset_constants
+
+            Drop memoized pair/token constants and record current cache key
+        """   
+        
+        self._pair_cache.clear()
+        self._tkn_cache.clear()
+        self._cache_key = (self.vault.version, self.swap_fee)
+        
+    def set_validation(self, validation = None):
+        
+        """ set_validation
+
+            Select consistency checks run after every swap
+                
+            Parameters
+            ---------------
+            validation : Validation
+                Validation.OFF (no checks), Validation.CHEAP (O(1) input and output 
+                delta checks) or Validation.FULL (cheap checks, balance product check 
+                and audit); None selects BalancerExchange.default_validation
+        """   
+        
+        validation = self.default_validation if validation == None else validation
+        assert validation in VALIDATION_LEVELS, 'Balancer: UNKNOWN VALIDATION LEVEL'
+        self.validation = validation
+        
+    def audit(self):
+        
+        """ audit
+
+            Full consistency audit of the pool; checks every reserve against its vault 
+            token balance, pool shares against provider accounts, and collected fees
+                
+            Returns
+            ---------------
+            ok : boolean
+                True when audit passes (asserts otherwise)
+        """   
+        
+        balances = self.vault.get_balances_view()
+        for tkn_nm, k in self.state.tkn_index.items():
+            reserve = self.state.reserves[k]
+            assert abs(balances[tkn_nm] - reserve) <= AUDIT_TOLERANCE*max(1, abs(reserve)), 'Balancer V1: LP BALANCES NOT ALIGNED TO TKN BALANCES'
+        
+        provider_shares = self.pool_providers.total()
+        assert abs(provider_shares - self.pool_shares) <= AUDIT_TOLERANCE*max(1, self.pool_shares), 'Balancer V1: POOL SHARES NOT ALIGNED TO PROVIDER SHARES'
+        assert (self.state.fees >= 0).all(), 'Balancer V1: NEGATIVE FEES'
+        return True
             
     def join_pool(self, vault : BalancerVault, amt_shares_in: float, to: str):
         
@@ -92,11 +518,21 @@ class BalancerExchange(IExchange):
         """          
         
         if(not self.joined):
+            if self._journal is not None:
+                self._journal.append((setattr, (self, 'vault', self.vault)))
+                self._journal.append((self._set_state, (self.state.copy(),)))
+                self._journal.append((setattr, (self, 'joined', self.joined)))
             self.vault = vault
-            self.tkn_reserves = vault.get_balances().copy()
-            self.tkn_weights = vault.get_norm_weights().copy()
+            if self.state.tkn_nms != vault.get_names_view():
+                self._set_state(PoolState(vault.get_names_view()))
+            self.state.load_balances(vault)
+            self.state.load_weights(vault)
             self._mint(to, amt_shares_in)
             self.joined = True
+            if self.recorder is not None:
+                self.recorder.tkn_nms = self.state.tkn_nms
+                for tkn_nm, k in self.state.tkn_index.items():
+                    self._record(EventKind.JOIN, tkn_nm, None, float(self.state.reserves[k]), 0.0, 0.0, 0.0)
         else:
             assert not self.joined, 'Balancer V1: POOL ALREADY JOINED' 
     
@@ -117,25 +553,29 @@ class BalancerExchange(IExchange):
         """           
         
         assert self.vault.get_token(tkn_in.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
-        
-        total_weight = self.vault.get_total_denorm_weight()
-        tkn_denorm_wts = self.vault.get_denorm_weights()
-        join_swap = BalancerMath.calc_pool_out_given_single_in(
-            token_balance_in=Decimal(tkn_in.token_total),
-            token_weight_in=Decimal(tkn_denorm_wts[tkn_in.token_name]),
-            pool_supply=Decimal(self.pool_shares),
-            total_weight=Decimal(total_weight),
-            token_amount_in=Decimal(amt_tkn_in),
-            swap_fee=Decimal(SWAP_FEE)
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        
+        tkn_weight, total_weight, swap_fee = self.get_token_constants(tkn_in)
+        join_swap = self.math.calc_pool_out_given_single_in(
+            token_balance_in=self.math.to_num(tkn_in.token_total),
+            token_weight_in=tkn_weight,
+            pool_supply=self.math.to_num(self.pool_shares),
+            total_weight=total_weight,
+            token_amount_in=self.math.to_num(amt_tkn_in),
+            swap_fee=swap_fee
             )
         
         ## *** need to error check for pool_amount_out_expected ***
+        shares_out = self.math.to_float(join_swap.result)
+        tkn_fee_in = self.math.to_float(join_swap.fee)
         
-        self.vault.get_token(tkn_in.token_name).deposit(to, amt_tkn_in)        
-        self.mint(float(join_swap.result), amt_tkn_in, tkn_in, to)
-        self._tally_fees(tkn_in, float(join_swap.fee))
+        self._deposit(self.vault.get_token(tkn_in.token_name), to, amt_tkn_in)        
+        self.mint(shares_out, amt_tkn_in, tkn_in, to)
+        self._tally_fees(tkn_in, tkn_fee_in)
+        if self.recorder is not None:
+            self._record(EventKind.JOIN, tkn_in.token_name, None, amt_tkn_in, 0.0, tkn_fee_in, 0.0)
         
-        return {'shares_in_amt': float(join_swap.result), 'tkn_in_nm': tkn_in.token_name, 'tkn_in_fee':float(join_swap.fee)}
+        return {'shares_in_amt': shares_out, 'tkn_in_nm': tkn_in.token_name, 'tkn_in_fee':tkn_fee_in}
         
     def join_swap_pool_amount_out(self, amt_shares_in, tkn_in, to):  
         
@@ -154,25 +594,27 @@ class BalancerExchange(IExchange):
         """            
         
         assert self.vault.get_token(tkn_in.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
-        
-        total_weight = self.vault.get_total_denorm_weight()
-        tkn_denorm_wts = self.vault.get_denorm_weights()
-        join_swap = BalancerMath.calc_single_in_given_pool_out(
-            token_balance_in=Decimal(tkn_in.token_total),
-            token_weight_in=Decimal(Decimal(tkn_denorm_wts[tkn_in.token_name])),
-            pool_supply=Decimal(self.pool_shares),
-            total_weight=Decimal(total_weight),
-            pool_amount_out=Decimal(amt_shares_in),
-            swap_fee=Decimal(SWAP_FEE)
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        
+        tkn_weight, total_weight, swap_fee = self.get_token_constants(tkn_in)
+        join_swap = self.math.calc_single_in_given_pool_out(
+            token_balance_in=self.math.to_num(tkn_in.token_total),
+            token_weight_in=tkn_weight,
+            pool_supply=self.math.to_num(self.pool_shares),
+            total_weight=total_weight,
+            pool_amount_out=self.math.to_num(amt_shares_in),
+            swap_fee=swap_fee
             )
         
         ## *** need to error check for pool_amount_out_expected ***
-        tkn_amt_in = float(join_swap.result)
-        tkn_fee_in = float(join_swap.fee)
+        tkn_amt_in = self.math.to_float(join_swap.result)
+        tkn_fee_in = self.math.to_float(join_swap.fee)
         
-        self.vault.get_token(tkn_in.token_name).deposit(to, tkn_amt_in)        
+        self._deposit(self.vault.get_token(tkn_in.token_name), to, tkn_amt_in)        
         self.mint(amt_shares_in, tkn_amt_in, tkn_in, to)
         self._tally_fees(tkn_in, tkn_fee_in)
+        if self.recorder is not None:
+            self._record(EventKind.JOIN, tkn_in.token_name, None, tkn_amt_in, 0.0, tkn_fee_in, 0.0)
         
         return {'tkn_in_amt': tkn_amt_in, 'tkn_in_nm': tkn_in.token_name, 'tkn_in_fee':tkn_fee_in}   
    
@@ -194,27 +636,31 @@ class BalancerExchange(IExchange):
         """          
         
         assert self.vault.get_token(tkn_out.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        tkn_out = self.vault.get_token(tkn_out.token_name)
         assert amt_tkn_out < self.tkn_reserves[tkn_out.token_name]*float(MAX_OUT_RATIO), 'Balancer: MAX OUT RATIO'
         
-        total_weight = self.vault.get_total_denorm_weight()
-        tkn_denorm_wts = self.vault.get_denorm_weights()
-        exit_swap = BalancerMath.calc_pool_in_given_single_out(
-                token_balance_out=Decimal(tkn_out.token_total),
-                token_weight_out=Decimal(tkn_denorm_wts[tkn_out.token_name]),
-                pool_supply=Decimal(self.pool_shares),
-                total_weight=Decimal(total_weight),
-                token_amount_out=Decimal(amt_tkn_out),
-                swap_fee=Decimal(SWAP_FEE)
+        tkn_weight, total_weight, swap_fee = self.get_token_constants(tkn_out)
+        exit_swap = self.math.calc_pool_in_given_single_out(
+                token_balance_out=self.math.to_num(tkn_out.token_total),
+                token_weight_out=tkn_weight,
+                pool_supply=self.math.to_num(self.pool_shares),
+                total_weight=total_weight,
+                token_amount_out=self.math.to_num(amt_tkn_out),
+                swap_fee=swap_fee
             )
         
-        assert float(exit_swap.result) != 0, 'Balancer V1: MATH EXIT ERROR'
+        shares_in = self.math.to_float(exit_swap.result)
+        tkn_fee_out = self.math.to_float(exit_swap.fee)
+        assert shares_in != 0, 'Balancer V1: MATH EXIT ERROR'
         
         ## *** need to error check enough supply to perform removal ***
         
-        self.burn(float(exit_swap.result), amt_tkn_out, tkn_out, to)
-        self._tally_fees(tkn_out, float(exit_swap.fee)) 
+        self.burn(shares_in, amt_tkn_out, tkn_out, to)
+        self._tally_fees(tkn_out, tkn_fee_out) 
+        if self.recorder is not None:
+            self._record(EventKind.EXIT, None, tkn_out.token_name, 0.0, amt_tkn_out, tkn_fee_out, 0.0)
         
-        return {'shares_out_amt': float(exit_swap.result), 'tkn_out_nm': tkn_out.token_name, 'tkn_out_fee':float(exit_swap.fee)} 
+        return {'shares_out_amt': shares_in, 'tkn_out_nm': tkn_out.token_name, 'tkn_out_fee':tkn_fee_out} 
     
     def exit_swap_pool_amount_in(self, amt_shares_out, tkn_out, to):   
         
@@ -233,27 +679,31 @@ class BalancerExchange(IExchange):
         """          
         
         assert self.vault.get_token(tkn_out.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        tkn_out = self.vault.get_token(tkn_out.token_name)
         assert amt_shares_out < self.pool_shares*float(MAX_OUT_RATIO), 'Balancer: MAX OUT RATIO'
         
-        total_weight = self.vault.get_total_denorm_weight()
-        tkn_denorm_wts = self.vault.get_denorm_weights()
-        exit_swap = BalancerMath.calc_single_out_given_pool_in(
-                token_balance_out=Decimal(tkn_out.token_total),
-                token_weight_out=Decimal(tkn_denorm_wts[tkn_out.token_name]),
-                pool_supply=Decimal(self.pool_shares),
-                total_weight=Decimal(total_weight),
-                pool_amount_in=Decimal(amt_shares_out),
-                swap_fee=Decimal(SWAP_FEE)
+        tkn_weight, total_weight, swap_fee = self.get_token_constants(tkn_out)
+        exit_swap = self.math.calc_single_out_given_pool_in(
+                token_balance_out=self.math.to_num(tkn_out.token_total),
+                token_weight_out=tkn_weight,
+                pool_supply=self.math.to_num(self.pool_shares),
+                total_weight=total_weight,
+                pool_amount_in=self.math.to_num(amt_shares_out),
+                swap_fee=swap_fee
             )        
         
-        assert float(exit_swap.result) != 0, 'Balancer V1: MATH EXIT ERROR'
+        tkn_amt_out = self.math.to_float(exit_swap.result)
+        tkn_fee_out = self.math.to_float(exit_swap.fee)
+        assert tkn_amt_out != 0, 'Balancer V1: MATH EXIT ERROR'
         
         ## *** need to error check enough supply to perform removal ***
         
-        self.burn(amt_shares_out, float(exit_swap.result), tkn_out, to)
-        self._tally_fees(tkn_out, float(exit_swap.fee)) 
+        self.burn(amt_shares_out, tkn_amt_out, tkn_out, to)
+        self._tally_fees(tkn_out, tkn_fee_out) 
+        if self.recorder is not None:
+            self._record(EventKind.EXIT, None, tkn_out.token_name, 0.0, tkn_amt_out, tkn_fee_out, 0.0)
         
-        return {'tkn_out_amt': float(exit_swap.result), 'tkn_out_nm': tkn_out.token_name, 'tkn_out_fee':float(exit_swap.fee)}     
+        return {'tkn_out_amt': tkn_amt_out, 'tkn_out_nm': tkn_out.token_name, 'tkn_out_fee':tkn_fee_out}     
         
     def burn(self, shares, amt_tkn_out, tkn_out, _from):
         
@@ -274,7 +724,7 @@ class BalancerExchange(IExchange):
         assert self.vault.get_token(tkn_out.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
         
         self._burn(_from, shares)
-        self.vault.get_token(tkn_out.token_name).transfer(_from, amt_tkn_out)
+        self._transfer(self.vault.get_token(tkn_out.token_name), _from, amt_tkn_out)
         new_balance = self.vault.get_token(tkn_out.token_name).token_total
         self._update(new_balance, tkn_out.token_name) 
         
@@ -294,8 +744,13 @@ class BalancerExchange(IExchange):
         
         exit_fee = shares_out * EXIT_FEE
         available_shares = self.pool_providers.get(_from)
+        if self._journal is not None:
+            self._log_provider(_from)
+            self._log_attr('pool_shares')
         self.pool_providers[_from] = available_shares - shares_out - exit_fee
         self.pool_shares -= shares_out - exit_fee       
+        if self.recorder is not None:
+            self._record(EventKind.BURN, None, None, 0.0, 0.0, exit_fee, shares_out)
     
     # remove liquidity: all asset withdrawal
     def exit_pool(self, amt_shares_out, _from):  
@@ -319,17 +774,96 @@ class BalancerExchange(IExchange):
         self._burn(_from, amt_shares_out)
         
         tkn_amts_out = {}
-        for tkn_nm in self.tkn_reserves:
-            amt_tkn_out = ratio_out * self.tkn_reserves[tkn_nm]            
+        amts_tkn_out = ratio_out * self.state.reserves
+        for tkn_nm, k in self.state.tkn_index.items():
+            amt_tkn_out = float(amts_tkn_out[k])            
             assert amt_tkn_out != 0, 'Balancer: MATH EXIT ERROR'  
-            self.vault.get_token(tkn_nm).transfer(_from, amt_tkn_out)
+            self._transfer(self.vault.get_token(tkn_nm), _from, amt_tkn_out)
             new_balance = self.vault.get_token(tkn_nm).token_total
             self._update(new_balance, tkn_nm)  
             tkn_amts_out[tkn_nm] = amt_tkn_out
+            if self.recorder is not None:
+                self._record(EventKind.EXIT, None, tkn_nm, 0.0, amt_tkn_out, 0.0, 0.0)
             
-        self.joined = False if self.pool_shares == 0 else self.joined   
+        if self.pool_shares == 0:
+            self._log_attr('joined')
+            self.joined = False
             
         return tkn_amts_out   
+    
+    def get_provider_claims(self):
+        
+        """ get_provider_claims
+
+            Pro-rata claim of every provider on the pool reserves and collected 
+            fees, in one array operation over the provider registry
+                
+            Returns
+            ---------------
+            out : dict
+                users (list), shares (n_users,), claims and fees (n_users, n_tkns; 
+                columns in tkn_nms order) and tkn_nms
+        """  
+        
+        users, idx = self.pool_providers.active()
+        shares = self.pool_providers.shares[idx]
+        ratio = shares / self.pool_shares if self.pool_shares else np.zeros_like(shares)
+        return {'users': users, 'shares': shares, 'tkn_nms': self.state.tkn_nms,
+                'claims': np.outer(ratio, self.state.reserves), 'fees': np.outer(ratio, self.state.fees)}
+    
+    def exit_pool_all(self, fraction = 1.0):
+        
+        """ exit_pool_all
+
+            Every provider redeems the same fraction of their shares for all assets 
+            (exit_pool for all providers at once, as array operations)
+                
+            Parameters
+            ---------------
+            fraction : float
+                Fraction of each provider's shares redeemed (1.0 exits the whole pool)
+                
+            Returns
+            ---------------
+            out : dict
+                users (list), shares_out (n_users,), tkn_amts_out (n_users, n_tkns; 
+                columns in tkn_nms order) and tkn_nms
+        """  
+        
+        assert 0 < fraction <= 1, 'Balancer V1: INVALID EXIT FRACTION'
+        assert self.joined and self.pool_shares > 0, 'Balancer V1: POOL NOT JOINED'
+        
+        registry = self.pool_providers
+        users, idx = registry.active()
+        shares_out = registry.shares[idx] * fraction
+        tkn_amts_out = np.outer(shares_out / self.pool_shares, self.state.reserves)
+        exit_fees = shares_out * EXIT_FEE
+        
+        if self._journal is not None:
+            self._journal.append((registry.set_shares, (idx, registry.shares[idx].copy())))
+            self._log_attr('pool_shares')
+            self._log_attr('joined')
+        registry.shares[idx] -= shares_out + exit_fees
+        self.pool_shares -= float(shares_out.sum() - exit_fees.sum())
+        if fraction == 1:
+            self.pool_shares = 0
+        
+        for k, tkn in enumerate(self.vault.tkns):
+            amts_out = tkn_amts_out[:, k]
+            amt_out = float(self.state.reserves[k]) if fraction == 1 else float(amts_out.sum())
+            self._transfer(tkn, None, amt_out)
+            if tkn.ledger is not None:
+                self._credit_all(tkn.ledger, users, amts_out)
+            self._update(tkn.token_total, tkn.token_name)
+            if self.recorder is not None:
+                self._record(EventKind.EXIT, None, tkn.token_name, 0.0, amt_out, 0.0, 0.0)
+        
+        if self.recorder is not None:
+            self._record(EventKind.BURN, None, None, 0.0, 0.0, float(exit_fees.sum()), float(shares_out.sum()))
+        if self.pool_shares == 0:
+            self.joined = False
+            
+        return {'users': users, 'shares_out': shares_out, 'tkn_amts_out': tkn_amts_out, 'tkn_nms': self.state.tkn_nms}
       
     def swap_exact_amount_in(self, amt_tkn_in, tkn_in, tkn_out, to):
         
@@ -350,11 +884,16 @@ class BalancerExchange(IExchange):
         """          
         
         assert self.vault.get_token(tkn_in.token_name) and self.vault.get_token(tkn_out.token_name), "Balancer: TOKEN NOT PART OF GROUP"
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        tkn_out = self.vault.get_token(tkn_out.token_name)
         
         amount_out_expected = self.get_amount_out(amt_tkn_in, tkn_in, tkn_out)
         assert amount_out_expected['tkn_out_amt'] <= tkn_out.token_total, 'Balancer V1: INSUFFICIENT_OUTPUT_AMOUNT'   
-        self.vault.get_token(tkn_in.token_name).deposit(to, amt_tkn_in)
+        self._deposit(self.vault.get_token(tkn_in.token_name), to, amt_tkn_in)
         self.swap(amount_out_expected['tkn_out_amt'], amount_out_expected['tkn_in_fee'], tkn_out, tkn_in, to)
+        if self.recorder is not None:
+            self._record(EventKind.SWAP, tkn_in.token_name, tkn_out.token_name, amt_tkn_in, 
+                         amount_out_expected['tkn_out_amt'], amount_out_expected['tkn_in_fee'], 0.0)
         return amount_out_expected
     
     def swap_exact_amount_out(self, amt_tkn_out, tkn_out, tkn_in, to):
@@ -376,13 +915,197 @@ class BalancerExchange(IExchange):
         """          
         
         assert self.vault.get_token(tkn_in.token_name) and self.vault.get_token(tkn_out.token_name), "Balancer: TOKEN NOT PART OF GROUP"
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        tkn_out = self.vault.get_token(tkn_out.token_name)
         
         amount_in_expected = self.get_amount_in(amt_tkn_out, tkn_out, tkn_in)
         assert amount_in_expected['tkn_in_amt'] <= tkn_in.token_total, 'Balancer V1: INSUFFICIENT_OUTPUT_AMOUNT'   
-        self.vault.get_token(tkn_out.token_name).deposit(to, amt_tkn_out)
+        self._deposit(self.vault.get_token(tkn_out.token_name), to, amt_tkn_out)
         self.swap(amount_in_expected['tkn_in_amt'], amount_in_expected['tkn_out_fee'], tkn_in, tkn_out, to)
+        if self.recorder is not None:
+            self._record(EventKind.SWAP, tkn_out.token_name, tkn_in.token_name, amt_tkn_out, 
+                         amount_in_expected['tkn_in_amt'], amount_in_expected['tkn_out_fee'], 0.0)
         return amount_in_expected    
     
+    def swap_batch(self, swaps):
+        
+        """ swap_batch
+
+            Apply an ordered list of swap_exact_amount_in operations in one call; token 
+            membership is validated once and weights/fee come from the constants cache; 
+            the batch is atomic (see transaction)
+                
+            Parameters
+            ---------------
+            swaps : list
+                List of (amt_tkn_in, tkn_in, tkn_out, to) tuples, as passed to 
+                swap_exact_amount_in    
+                
+            Returns
+            ---------------
+            out : np.ndarray
+                Array of shape (len(swaps), 2) with tkn_out_amt and tkn_in_fee per swap                      
+        """ 
+        
+        bmath = self.math
+        tkns = self._batch_tokens([tkn for swap in swaps for tkn in swap[1:3]])
+        
+        out = np.empty((len(swaps), 2))
+        with self.transaction():
+            for k, (amt_tkn_in, tkn_in, tkn_out, to) in enumerate(swaps):
+                tkn_in = tkns[tkn_in.token_name]
+                tkn_out = tkns[tkn_out.token_name]
+                tkn_weight_in, tkn_weight_out, swap_fee = self.get_pair_constants(tkn_in, tkn_out)
+                res = bmath.calc_out_given_in(token_amount_in = bmath.to_num(amt_tkn_in),
+                                            token_balance_in = bmath.to_num(tkn_in.token_total),
+                                            token_weight_in = tkn_weight_in,
+                                            token_balance_out = bmath.to_num(tkn_out.token_total),
+                                            token_weight_out = tkn_weight_out,
+                                            swap_fee = swap_fee)
+                amt_tkn_out = bmath.to_float(res.result)
+                tkn_fee_in = bmath.to_float(res.fee)
+            
+                assert amt_tkn_out <= tkn_out.token_total, 'Balancer V1: INSUFFICIENT_OUTPUT_AMOUNT' 
+                assert amt_tkn_in > 0, 'Balancer V1: INSUFFICIENT_INPUT_AMOUNT' 
+            
+                self._deposit(tkn_in, to, amt_tkn_in)
+                self._transfer(tkn_out, to, amt_tkn_out)
+                self._update(tkn_in.token_total, tkn_in.token_name)
+                self._update(tkn_out.token_total, tkn_out.token_name)
+                self._tally_fees(tkn_in, tkn_fee_in)
+                if self.recorder is not None:
+                    self._record(EventKind.SWAP, tkn_in.token_name, tkn_out.token_name, amt_tkn_in, amt_tkn_out, tkn_fee_in, 0.0)
+                out[k, 0] = amt_tkn_out
+                out[k, 1] = tkn_fee_in
+            
+            if self.validation == Validation.FULL:
+                self.audit()
+        
+        return out
+    
+    def join_batch(self, joins):
+        
+        """ join_batch
+
+            Apply an ordered list of join_swap_extern_amount_in operations in one call; 
+            token membership is validated once and weights/fee come from the constants cache; 
+            the batch is atomic (see transaction)
+                
+            Parameters
+            ---------------
+            joins : list
+                List of (amt_tkn_in, tkn_in, to) tuples, as passed to 
+                join_swap_extern_amount_in    
+                
+            Returns
+            ---------------
+            out : np.ndarray
+                Array of shape (len(joins), 2) with shares_in_amt and tkn_in_fee per join                      
+        """ 
+        
+        bmath = self.math
+        tkns = self._batch_tokens([join[1] for join in joins])
+        
+        out = np.empty((len(joins), 2))
+        with self.transaction():
+            for k, (amt_tkn_in, tkn_in, to) in enumerate(joins):
+                tkn_in = tkns[tkn_in.token_name]
+                tkn_weight, total_weight, swap_fee = self.get_token_constants(tkn_in)
+                res = bmath.calc_pool_out_given_single_in(
+                    token_balance_in=bmath.to_num(tkn_in.token_total),
+                    token_weight_in=tkn_weight,
+                    pool_supply=bmath.to_num(self.pool_shares),
+                    total_weight=total_weight,
+                    token_amount_in=bmath.to_num(amt_tkn_in),
+                    swap_fee=swap_fee)
+                shares_out = bmath.to_float(res.result)
+                tkn_fee_in = bmath.to_float(res.fee)
+            
+                self._deposit(tkn_in, to, amt_tkn_in)        
+                self.mint(shares_out, amt_tkn_in, tkn_in, to)
+                self._tally_fees(tkn_in, tkn_fee_in)
+                if self.recorder is not None:
+                    self._record(EventKind.JOIN, tkn_in.token_name, None, amt_tkn_in, 0.0, tkn_fee_in, 0.0)
+                out[k, 0] = shares_out
+                out[k, 1] = tkn_fee_in
+            
+        return out
+    
+    def exit_batch(self, exits):
+        
+        """ exit_batch
+
+            Apply an ordered list of exit_swap_pool_amount_in operations in one call; 
+            token membership is validated once and weights/fee come from the constants cache; 
+            the batch is atomic (see transaction)
+                
+            Parameters
+            ---------------
+            exits : list
+                List of (amt_shares_out, tkn_out, to) tuples, as passed to 
+                exit_swap_pool_amount_in    
+                
+            Returns
+            ---------------
+            out : np.ndarray
+                Array of shape (len(exits), 2) with tkn_out_amt and tkn_out_fee per exit                      
+        """ 
+        
+        bmath = self.math
+        tkns = self._batch_tokens([exit[1] for exit in exits])
+        max_out_ratio = float(MAX_OUT_RATIO)
+        
+        out = np.empty((len(exits), 2))
+        with self.transaction():
+            for k, (amt_shares_out, tkn_out, to) in enumerate(exits):
+                tkn_out = tkns[tkn_out.token_name]
+                assert amt_shares_out < self.pool_shares*max_out_ratio, 'Balancer: MAX OUT RATIO'
+                tkn_weight, total_weight, swap_fee = self.get_token_constants(tkn_out)
+                res = bmath.calc_single_out_given_pool_in(
+                    token_balance_out=bmath.to_num(tkn_out.token_total),
+                    token_weight_out=tkn_weight,
+                    pool_supply=bmath.to_num(self.pool_shares),
+                    total_weight=total_weight,
+                    pool_amount_in=bmath.to_num(amt_shares_out),
+                    swap_fee=swap_fee)
+                tkn_amt_out = bmath.to_float(res.result)
+                tkn_fee_out = bmath.to_float(res.fee)
+                assert tkn_amt_out != 0, 'Balancer V1: MATH EXIT ERROR'
+            
+                self._burn(to, amt_shares_out)
+                self._transfer(tkn_out, to, tkn_amt_out)
+                self._update(tkn_out.token_total, tkn_out.token_name) 
+                self._tally_fees(tkn_out, tkn_fee_out) 
+                if self.recorder is not None:
+                    self._record(EventKind.EXIT, None, tkn_out.token_name, 0.0, tkn_amt_out, tkn_fee_out, 0.0)
+                out[k, 0] = tkn_amt_out
+                out[k, 1] = tkn_fee_out
+            
+        return out
+    
+    def _batch_tokens(self, tkns):
+        
+        """ _batch_tokens
+
+            Validate token membership once for a batch
+                
+            Parameters
+            ---------------
+            tkns : list
+                ERC20 tokens referenced by the batch    
+                
+            Returns
+            ---------------
+            tkn_dic : dict
+                Vault ERC20 tokens referenced by token name                      
+        """ 
+        
+        tkn_dic = {}
+        for tkn in tkns:
+            if tkn.token_name not in tkn_dic:
+                assert self.vault.check_tkn(tkn), 'Balancer V1: TOKEN NOT PART OF GROUP'
+                tkn_dic[tkn.token_name] = self.vault.get_token(tkn.token_name)
+        return tkn_dic
     
     def swap(self, amt_swap, amt_fee, tkn_out, tkn_in, to): 
         
@@ -402,34 +1125,41 @@ class BalancerExchange(IExchange):
                 User name/address                 
         """         
         
-        self.vault.get_token(tkn_out.token_name).transfer(to, amt_swap)
-        new_tkn_balances = self.vault.get_balances()
-        
-        res_balance_in = self.tkn_reserves[tkn_in.token_name]
-        res_balance_out = self.tkn_reserves[tkn_out.token_name]
+        vault_tkn_in = self.vault.get_token(tkn_in.token_name)
+        vault_tkn_out = self.vault.get_token(tkn_out.token_name)
+        self._transfer(vault_tkn_out, to, amt_swap)
         
-        new_balance_in = new_tkn_balances[tkn_in.token_name]
-        new_balance_out = new_tkn_balances[tkn_out.token_name]
+        new_balance_in = vault_tkn_in.token_total
+        new_balance_out = vault_tkn_out.token_total
         
-        if new_balance_in > res_balance_in - amt_swap:
-            amount_in = new_balance_in - res_balance_in
-        else:
-            amount_in = 0
+        if self.validation != Validation.OFF:
+            index = self.state.tkn_index
+            res_balance_in = self.state.reserves[index[tkn_in.token_name]]
+            res_balance_out = self.state.reserves[index[tkn_out.token_name]]
             
-        assert amount_in > 0, 'Balancer V1: INSUFFICIENT_INPUT_AMOUNT'        
-        
-        res_balance_in_adjusted = res_balance_in + amount_in 
-        res_balance_out_adjusted = res_balance_out - amt_swap
-              
-        lside = round(math.ceil(res_balance_in_adjusted * res_balance_out_adjusted), 8)
-        rside = round(math.ceil(new_balance_in * new_balance_out), 8)     
-        
-        assert lside  ==  rside , 'Balancer V1: LP BALANCES NOT ALIGNED TO TKN BALANCES'
+            if new_balance_in > res_balance_in - amt_swap:
+                amount_in = new_balance_in - res_balance_in
+            else:
+                amount_in = 0
+                
+            assert amount_in > 0, 'Balancer V1: INSUFFICIENT_INPUT_AMOUNT'        
+            
+            res_balance_out_adjusted = res_balance_out - amt_swap
+            assert abs(new_balance_out - res_balance_out_adjusted) <= AUDIT_TOLERANCE*max(1, abs(res_balance_out)), 'Balancer V1: LP BALANCES NOT ALIGNED TO TKN BALANCES'
+            
+            if self.validation == Validation.FULL:
+                res_balance_in_adjusted = res_balance_in + amount_in 
+                lside = round(math.ceil(res_balance_in_adjusted * res_balance_out_adjusted), 8)
+                rside = round(math.ceil(new_balance_in * new_balance_out), 8)     
+                assert lside  ==  rside , 'Balancer V1: LP BALANCES NOT ALIGNED TO TKN BALANCES'
         
         self._update(new_balance_in, tkn_in.token_name)
         self._update(new_balance_out, tkn_out.token_name)
         self._tally_fees(tkn_in, amt_fee)
         
+        if self.validation == Validation.FULL:
+            self.audit()
+        
     def mint(self, new_shares, amt_tkn_in, tkn_in, to): 
         
         """ mint
@@ -457,8 +1187,7 @@ class BalancerExchange(IExchange):
             new_shares = new_shares - MINIMUM_SHARES
             self._mint("0", MINIMUM_SHARES)        
         
-        new_balance = tkn_in.token_total
-        self._update(new_balance, tkn_in.token_name)
+        self._update(tkn_balance, tkn_in.token_name)
         self._mint(to, new_shares)
         
     def _mint(self, to, value):
@@ -475,6 +1204,10 @@ class BalancerExchange(IExchange):
                 User name/address                 
         """           
                 
+        if self._journal is not None:
+            self._log_provider(to)
+            self._log_attr('pool_shares')
+            self._log_attr('last_pool_deposit')
         if self.pool_providers.get(to):
             self.pool_providers[to] += value
         else:
@@ -482,6 +1215,8 @@ class BalancerExchange(IExchange):
 
         self.last_pool_deposit = value     
         self.pool_shares += value        
+        if self.recorder is not None:
+            self._record(EventKind.MINT, None, None, 0.0, 0.0, 0.0, value)
 
     def _update(self, new_balance, tkn_nm):
         
@@ -497,7 +1232,10 @@ class BalancerExchange(IExchange):
                 Name of token being updated                  
         """          
         
-        self.tkn_reserves[tkn_nm] = new_balance      
+        idx = self.state.tkn_index[tkn_nm]
+        if self._journal is not None:
+            self._journal.append((self.state.reserves.__setitem__, (idx, self.state.reserves[idx])))
+        self.state.reserves[idx] = new_balance      
 
     def _tally_fees(self, tkn, fee):
         
@@ -514,10 +1252,10 @@ class BalancerExchange(IExchange):
                 Fee being collected                
         """         
         
-        if tkn.token_name not in self.tkn_fees:
-            self.tkn_fees[tkn.token_name] = 0
-         
-        self.tkn_fees[tkn.token_name] += fee        
+        idx = self.state.tkn_index[tkn.token_name]
+        if self._journal is not None:
+            self._journal.append((self.state.fees.__setitem__, (idx, self.state.fees[idx])))
+        self.state.fees[idx] += fee        
         
         
     def get_amount_out(self, amt_tkn_in, tkn_in, tkn_out):  
@@ -537,16 +1275,18 @@ class BalancerExchange(IExchange):
         """          
         
         assert self.vault.get_token(tkn_in.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
-        
-        tkn_denorm_wts = self.vault.get_denorm_weights()
-        out = BalancerMath.calc_out_given_in(token_amount_in = Decimal(amt_tkn_in),
-                                        token_balance_in = Decimal(tkn_in.token_total),
-                                        token_weight_in = Decimal(tkn_denorm_wts[tkn_in.token_name]),
-                                        token_balance_out = Decimal(tkn_out.token_total),
-                                        token_weight_out = Decimal(tkn_denorm_wts[tkn_out.token_name]),
-                                        swap_fee = Decimal(SWAP_FEE))
-        
-        return {'tkn_out_amt': float(out.result), 'tkn_in_nm': tkn_in.token_name, 'tkn_in_fee': float(out.fee)}
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        tkn_out = self.vault.get_token(tkn_out.token_name)
+        
+        tkn_weight_in, tkn_weight_out, swap_fee = self.get_pair_constants(tkn_in, tkn_out)
+        out = self.math.calc_out_given_in(token_amount_in = self.math.to_num(amt_tkn_in),
+                                        token_balance_in = self.math.to_num(tkn_in.token_total),
+                                        token_weight_in = tkn_weight_in,
+                                        token_balance_out = self.math.to_num(tkn_out.token_total),
+                                        token_weight_out = tkn_weight_out,
+                                        swap_fee = swap_fee)
+        
+        return {'tkn_out_amt': self.math.to_float(out.result), 'tkn_in_nm': tkn_in.token_name, 'tkn_in_fee': self.math.to_float(out.fee)}
     
     def get_amount_in(self, amt_tkn_out, tkn_out, tkn_in):  
         
@@ -565,16 +1305,90 @@ class BalancerExchange(IExchange):
         """          
         
         assert self.vault.get_token(tkn_in.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        tkn_out = self.vault.get_token(tkn_out.token_name)
+        
+        tkn_weight_in, tkn_weight_out, swap_fee = self.get_pair_constants(tkn_in, tkn_out)
+        out = self.math.calc_in_given_out(token_balance_in=self.math.to_num(tkn_in.token_total),
+                                        token_weight_in=tkn_weight_in,
+                                        token_balance_out=self.math.to_num(tkn_out.token_total),
+                                        token_weight_out=tkn_weight_out,
+                                        token_amount_out=self.math.to_num(amt_tkn_out),
+                                        swap_fee=swap_fee)        
+        
+        return {'tkn_in_amt': self.math.to_float(out.result), 'tkn_out_nm': tkn_out.token_name, 'tkn_out_fee': self.math.to_float(out.fee)}    
+    
+    def get_amounts_out(self, amts_tkn_in, tkn_in, tkn_out):  
+        
+        """ get_amounts_out
+
+            Batch version of get_amount_out; quotes every input amount against the 
+            current pool state in one vectorized pass (see BalancerMathArray)
+                
+            Parameters
+            ---------------
+            amts_tkn_in : array_like
+                Amounts of token requested for quote            
+            tkn_in : ERC20
+                Input token                    
+            tkn_out : ERC20
+                Output token    
+                
+            Returns
+            ---------------
+            out : dict
+                tkn_out_amt and tkn_in_fee as numpy arrays shaped like amts_tkn_in               
+        """          
+        
+        assert self.vault.get_token(tkn_in.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        tkn_out = self.vault.get_token(tkn_out.token_name)
+        
+        tkn_denorm_wts = self.vault.get_denorm_weights()
+        out = BalancerMathArray.calc_out_given_in(token_amount_in = np.asarray(amts_tkn_in, dtype=np.float64),
+                                        token_balance_in = tkn_in.token_total,
+                                        token_weight_in = tkn_denorm_wts[tkn_in.token_name],
+                                        token_balance_out = tkn_out.token_total,
+                                        token_weight_out = tkn_denorm_wts[tkn_out.token_name],
+                                        swap_fee = self.swap_fee)
+        
+        return {'tkn_out_amt': out.result, 'tkn_in_nm': tkn_in.token_name, 'tkn_in_fee': out.fee}
+    
+    def get_amounts_in(self, amts_tkn_out, tkn_out, tkn_in):  
+        
+        """ get_amounts_in
+
+            Batch version of get_amount_in; quotes every output amount against the 
+            current pool state in one vectorized pass (see BalancerMathArray)
+                
+            Parameters
+            ---------------
+            amts_tkn_out : array_like
+                Amounts of token requested for quote            
+            tkn_out : ERC20
+                Input token                    
+            tkn_in : ERC20
+                Output token   
+                
+            Returns
+            ---------------
+            out : dict
+                tkn_in_amt and tkn_out_fee as numpy arrays shaped like amts_tkn_out                   
+        """          
+        
+        assert self.vault.get_token(tkn_in.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        tkn_in = self.vault.get_token(tkn_in.token_name)
+        tkn_out = self.vault.get_token(tkn_out.token_name)
         
         tkn_denorm_wts = self.vault.get_denorm_weights()      
-        out = BalancerMath.calc_in_given_out(token_balance_in=Decimal(tkn_in.token_total),
-                                        token_weight_in=Decimal(tkn_denorm_wts[tkn_in.token_name]),
-                                        token_balance_out=Decimal(tkn_out.token_total),
-                                        token_weight_out=Decimal(tkn_denorm_wts[tkn_out.token_name]),
-                                        token_amount_out=Decimal(amt_tkn_out),
-                                        swap_fee=Decimal(SWAP_FEE))        
+        out = BalancerMathArray.calc_in_given_out(token_balance_in=tkn_in.token_total,
+                                        token_weight_in=tkn_denorm_wts[tkn_in.token_name],
+                                        token_balance_out=tkn_out.token_total,
+                                        token_weight_out=tkn_denorm_wts[tkn_out.token_name],
+                                        token_amount_out=np.asarray(amts_tkn_out, dtype=np.float64),
+                                        swap_fee=self.swap_fee)        
         
-        return {'tkn_in_amt': float(out.result), 'tkn_out_nm': tkn_out.token_name, 'tkn_out_fee': float(out.fee)}    
+        return {'tkn_in_amt': out.result, 'tkn_out_nm': tkn_out.token_name, 'tkn_out_fee': out.fee}    
         
 
     def get_price(self, base_tkn, opp_tkn):
@@ -592,15 +1406,17 @@ class BalancerExchange(IExchange):
         """         
         
         assert self.vault.get_token(base_tkn.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        base_tkn = self.vault.get_token(base_tkn.token_name)
+        opp_tkn = self.vault.get_token(opp_tkn.token_name)
         
-        tkn_denorm_wts = self.vault.get_denorm_weights()
-        price = BalancerMath.calc_spot_price(token_balance_in = Decimal(base_tkn.token_total),
-                                            token_weight_in = Decimal(tkn_denorm_wts[base_tkn.token_name]),
-                                            token_balance_out = Decimal(opp_tkn.token_total),
-                                            token_weight_out = Decimal(tkn_denorm_wts[opp_tkn.token_name]),
-                                            swap_fee = Decimal(SWAP_FEE))
+        tkn_weight_in, tkn_weight_out, swap_fee = self.get_pair_constants(base_tkn, opp_tkn)
+        price = self.math.calc_spot_price(token_balance_in = self.math.to_num(base_tkn.token_total),
+                                            token_weight_in = tkn_weight_in,
+                                            token_balance_out = self.math.to_num(opp_tkn.token_total),
+                                            token_weight_out = tkn_weight_out,
+                                            swap_fee = swap_fee)
         
-        return float(price)        
+        return self.math.to_float(price)        
         
     def get_reserve(self, token):
         
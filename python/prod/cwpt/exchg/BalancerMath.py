@@ -30,6 +30,14 @@ from ..exchg.result import BalancerMathResult
 
 class BalancerMath:
 
+    @staticmethod
+    def to_num(value):
+        return Decimal(value)
+
+    @staticmethod
+    def to_float(value):
+        return float(value)
+
     # **********************************************************************************************
     # calcSpotPrice                                                                             //
     # sP = spotPrice                                                                            //
@@ -0,0 +1,145 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from ..exchg import balancer_constants
+from ..exchg.result import BalancerMathResult
+
+EXIT_FEE = float(balancer_constants.EXIT_FEE)
+
+class BalancerMathArray:
+
+    """ 
+        NumPy batch kernels of the Balancer weighted math; same formulas and argument 
+        names as BalancerMathFloat, but every argument may be a scalar or an array 
+        (broadcast together), and BalancerMathResult holds arrays of results and fees
+    """  
+
+    @staticmethod
+    def to_num(value):
+        return np.asarray(value, dtype=np.float64)
+
+    @staticmethod
+    def to_float(value):
+        return np.asarray(value, dtype=np.float64)
+
+    @staticmethod
+    def calc_spot_price(
+            token_balance_in,
+            token_weight_in,
+            token_balance_out,
+            token_weight_out,
+            swap_fee):
+        numer = np.divide(token_balance_in, token_weight_in)
+        denom = np.divide(token_balance_out, token_weight_out)
+        return (numer / denom) / (1.0 - np.asarray(swap_fee))
+
+    @staticmethod
+    def calc_out_given_in(
+            token_amount_in,
+            token_balance_in,
+            token_weight_in,
+            token_balance_out,
+            token_weight_out,
+            swap_fee) -> BalancerMathResult:
+        weight_ratio = np.divide(token_weight_in, token_weight_out)
+        fee = np.multiply(token_amount_in, swap_fee)
+        adjusted_in = token_amount_in - fee
+        log_y = -np.log1p(adjusted_in / token_balance_in)
+        token_amount_out = -np.expm1(weight_ratio * log_y) * token_balance_out
+        return BalancerMathResult(token_amount_out, fee)
+
+    @staticmethod
+    def calc_in_given_out(
+            token_balance_out,
+            token_balance_in,
+            token_amount_out,
+            token_weight_in,
+            token_weight_out,
+            swap_fee):
+        weight_ratio = np.divide(token_weight_out, token_weight_in)
+        log_y = -np.log1p(-np.divide(token_amount_out, token_balance_out))
+        token_amount_in_no_fee = np.expm1(weight_ratio * log_y) * token_balance_in
+        token_amount_in = token_amount_in_no_fee / (1.0 - np.asarray(swap_fee))
+        return BalancerMathResult(token_amount_in, token_amount_in * swap_fee)
+
+    @staticmethod
+    def calc_pool_out_given_single_in(
+            token_balance_in,
+            token_weight_in,
+            pool_supply,
+            total_weight,
+            token_amount_in,
+            swap_fee):
+        normalized_weight = np.divide(token_weight_in, total_weight)
+        zaz = (1.0 - normalized_weight) * swap_fee
+        fee = np.multiply(token_amount_in, zaz)
+        token_amount_in_after_fee = token_amount_in - fee
+        log_ratio = np.log1p(token_amount_in_after_fee / token_balance_in)
+        pool_amount_out = np.expm1(normalized_weight * log_ratio) * pool_supply
+        return BalancerMathResult(pool_amount_out, fee)
+
+    @staticmethod
+    def calc_single_in_given_pool_out(
+            token_balance_in,
+            token_weight_in,
+            pool_supply,
+            total_weight,
+            pool_amount_out,
+            swap_fee):
+        normalized_weight = np.divide(token_weight_in, total_weight)
+        log_ratio = np.log1p(np.divide(pool_amount_out, pool_supply))
+        token_amount_in_after_fee = np.expm1(log_ratio / normalized_weight) * token_balance_in
+        zar = (1.0 - normalized_weight) * swap_fee
+        token_amount_in = token_amount_in_after_fee / (1.0 - zar)
+        return BalancerMathResult(token_amount_in, token_amount_in * zar)
+
+    @staticmethod
+    def calc_single_out_given_pool_in(
+            token_balance_out,
+            token_weight_out,
+            pool_supply,
+            total_weight,
+            pool_amount_in,
+            swap_fee
+    ):
+        normalized_weight = np.divide(token_weight_out, total_weight)
+        pool_amount_in_after_exit_fee = np.multiply(pool_amount_in, 1.0 - EXIT_FEE)
+        log_ratio = np.log1p(-pool_amount_in_after_exit_fee / pool_supply)
+        token_amount_out_before_swap_fee = -np.expm1(log_ratio / normalized_weight) * token_balance_out
+        zaz = (1.0 - normalized_weight) * swap_fee
+        fee = token_amount_out_before_swap_fee * zaz
+        token_amount_out = token_amount_out_before_swap_fee - fee
+        return BalancerMathResult(token_amount_out, fee)
+
+    @staticmethod
+    def calc_pool_in_given_single_out(
+            token_balance_out,
+            token_weight_out,
+            pool_supply,
+            total_weight,
+            token_amount_out,
+            swap_fee
+    ):
+        normalized_weight = np.divide(token_weight_out, total_weight)
+        zar = (1.0 - normalized_weight) * swap_fee
+        token_amount_out_before_swap_fee = np.divide(token_amount_out, 1.0 - zar)
+        log_ratio = np.log1p(-token_amount_out_before_swap_fee / token_balance_out)
+        pool_amount_in_after_exit_fee = -np.expm1(normalized_weight * log_ratio) * pool_supply
+        pool_amount_in = pool_amount_in_after_exit_fee / (1.0 - EXIT_FEE)
+        return BalancerMathResult(pool_amount_in, token_amount_out_before_swap_fee * zar)
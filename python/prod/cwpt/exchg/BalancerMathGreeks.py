@@ -0,0 +1,223 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from ..exchg import balancer_constants
+from ..exchg.result import BalancerMathGreeksResult
+
+EXIT_FEE = float(balancer_constants.EXIT_FEE)
+
+class BalancerMathGreeks:
+
+    """ 
+        Analytic first derivatives of the Balancer weighted math, evaluated together with 
+        the result in one pass. Signatures and broadcasting follow BalancerMathArray; each 
+        call returns BalancerMathGreeksResult whose greeks dict maps every argument name 
+        to d(result)/d(argument). Join/exit derivatives against a token weight hold the 
+        total weight fixed (the effect of the weight on total_weight is its own entry)
+    """  
+
+    # sP = ( bI / wI ) / ( bO / wO ) * 1 / ( 1 - sF )
+    @staticmethod
+    def calc_spot_price(
+            token_balance_in,
+            token_weight_in,
+            token_balance_out,
+            token_weight_out,
+            swap_fee):
+        bI, wI, bO, wO, sF = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in 
+                                                  (token_balance_in, token_weight_in, token_balance_out, token_weight_out, swap_fee)])
+        spot_price = (bI / wI) / (bO / wO) / (1.0 - sF)
+        greeks = {'token_balance_in': spot_price / bI,
+                  'token_weight_in': -spot_price / wI,
+                  'token_balance_out': -spot_price / bO,
+                  'token_weight_out': spot_price / wO,
+                  'swap_fee': spot_price / (1.0 - sF)}
+        return BalancerMathGreeksResult(spot_price, np.zeros_like(spot_price), greeks)
+
+    # aO = bO * ( 1 - y^r ),  y = bI / ( bI + aI * ( 1 - sF ) ),  r = wI / wO
+    @staticmethod
+    def calc_out_given_in(
+            token_amount_in,
+            token_balance_in,
+            token_weight_in,
+            token_balance_out,
+            token_weight_out,
+            swap_fee):
+        aI, bI, wI, bO, wO, sF = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in 
+                                                      (token_amount_in, token_balance_in, token_weight_in, token_balance_out, token_weight_out, swap_fee)])
+        weight_ratio = wI / wO
+        fee = aI * sF
+        adjusted_in = aI - fee
+        log_y = -np.log1p(adjusted_in / bI)
+        y_pow = np.exp(weight_ratio * log_y)
+        token_amount_out = -np.expm1(weight_ratio * log_y) * bO
+        
+        d_log_y = -bO * weight_ratio * y_pow
+        greeks = {'token_amount_in': -d_log_y * (1.0 - sF) / (bI + adjusted_in),
+                  'token_balance_in': d_log_y * adjusted_in / (bI * (bI + adjusted_in)),
+                  'token_weight_in': -bO * y_pow * log_y / wO,
+                  'token_balance_out': token_amount_out / bO,
+                  'token_weight_out': bO * y_pow * log_y * weight_ratio / wO,
+                  'swap_fee': d_log_y * aI / (bI + adjusted_in)}
+        return BalancerMathGreeksResult(token_amount_out, fee, greeks)
+
+    # aI = bI * ( z^r - 1 ) / ( 1 - sF ),  z = bO / ( bO - aO ),  r = wO / wI
+    @staticmethod
+    def calc_in_given_out(
+            token_balance_out,
+            token_balance_in,
+            token_amount_out,
+            token_weight_in,
+            token_weight_out,
+            swap_fee):
+        bO, bI, aO, wI, wO, sF = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in 
+                                                      (token_balance_out, token_balance_in, token_amount_out, token_weight_in, token_weight_out, swap_fee)])
+        weight_ratio = wO / wI
+        log_z = -np.log1p(-aO / bO)
+        z_pow = np.exp(weight_ratio * log_z)
+        token_amount_in = np.expm1(weight_ratio * log_z) * bI / (1.0 - sF)
+        
+        d_log_z = bI * weight_ratio * z_pow / (1.0 - sF)
+        d_weight_ratio = bI * z_pow * log_z / (1.0 - sF)
+        greeks = {'token_balance_out': -d_log_z * aO / (bO * (bO - aO)),
+                  'token_balance_in': token_amount_in / bI,
+                  'token_amount_out': d_log_z / (bO - aO),
+                  'token_weight_in': -d_weight_ratio * weight_ratio / wI,
+                  'token_weight_out': d_weight_ratio / wI,
+                  'swap_fee': token_amount_in / (1.0 - sF)}
+        return BalancerMathGreeksResult(token_amount_in, token_amount_in * sF, greeks)
+
+    # pAo = pS * ( ( 1 + u )^nW - 1 ),  u = tAi * ( 1 - ( 1 - nW ) * sF ) / tBi,  nW = wI / tW
+    @staticmethod
+    def calc_pool_out_given_single_in(
+            token_balance_in,
+            token_weight_in,
+            pool_supply,
+            total_weight,
+            token_amount_in,
+            swap_fee):
+        bI, wI, pS, tW, aI, sF = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in 
+                                                      (token_balance_in, token_weight_in, pool_supply, total_weight, token_amount_in, swap_fee)])
+        normalized_weight = wI / tW
+        zaz = (1.0 - normalized_weight) * sF
+        fee = aI * zaz
+        u = (aI - fee) / bI
+        log_ratio = np.log1p(u)
+        ratio_pow = np.exp(normalized_weight * log_ratio)
+        pool_amount_out = np.expm1(normalized_weight * log_ratio) * pS
+        
+        d_u = pS * normalized_weight * ratio_pow / (1.0 + u)
+        d_normalized_weight = pS * ratio_pow * log_ratio + d_u * aI * sF / bI
+        greeks = {'token_balance_in': -d_u * u / bI,
+                  'token_weight_in': d_normalized_weight / tW,
+                  'pool_supply': pool_amount_out / pS,
+                  'total_weight': -d_normalized_weight * normalized_weight / tW,
+                  'token_amount_in': d_u * (1.0 - zaz) / bI,
+                  'swap_fee': -d_u * aI * (1.0 - normalized_weight) / bI}
+        return BalancerMathGreeksResult(pool_amount_out, fee, greeks)
+
+    # tAi = ( ( 1 + pAo / pS )^( 1 / nW ) - 1 ) * bI / ( 1 - ( 1 - nW ) * sF ),  nW = wI / tW
+    @staticmethod
+    def calc_single_in_given_pool_out(
+            token_balance_in,
+            token_weight_in,
+            pool_supply,
+            total_weight,
+            pool_amount_out,
+            swap_fee):
+        bI, wI, pS, tW, pAo, sF = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in 
+                                                       (token_balance_in, token_weight_in, pool_supply, total_weight, pool_amount_out, swap_fee)])
+        normalized_weight = wI / tW
+        log_ratio = np.log1p(pAo / pS)
+        ratio_pow = np.exp(log_ratio / normalized_weight)
+        token_amount_in_after_fee = np.expm1(log_ratio / normalized_weight) * bI
+        zar = (1.0 - normalized_weight) * sF
+        token_amount_in = token_amount_in_after_fee / (1.0 - zar)
+        
+        d_log_ratio = bI * ratio_pow / (normalized_weight * (1.0 - zar))
+        d_normalized_weight = (-d_log_ratio * log_ratio / normalized_weight 
+                               - token_amount_in * sF / (1.0 - zar))
+        greeks = {'token_balance_in': token_amount_in / bI,
+                  'token_weight_in': d_normalized_weight / tW,
+                  'pool_supply': -d_log_ratio * pAo / (pS * (pS + pAo)),
+                  'total_weight': -d_normalized_weight * normalized_weight / tW,
+                  'pool_amount_out': d_log_ratio / (pS + pAo),
+                  'swap_fee': token_amount_in * (1.0 - normalized_weight) / (1.0 - zar)}
+        return BalancerMathGreeksResult(token_amount_in, token_amount_in * zar, greeks)
+
+    # tAo = bO * ( 1 - ( 1 - pAi * ( 1 - eF ) / pS )^( 1 / nW ) ) * ( 1 - ( 1 - nW ) * sF ),  nW = wO / tW
+    @staticmethod
+    def calc_single_out_given_pool_in(
+            token_balance_out,
+            token_weight_out,
+            pool_supply,
+            total_weight,
+            pool_amount_in,
+            swap_fee):
+        bO, wO, pS, tW, pAi, sF = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in 
+                                                       (token_balance_out, token_weight_out, pool_supply, total_weight, pool_amount_in, swap_fee)])
+        normalized_weight = wO / tW
+        pool_amount_in_after_exit_fee = pAi * (1.0 - EXIT_FEE)
+        log_ratio = np.log1p(-pool_amount_in_after_exit_fee / pS)
+        ratio_pow = np.exp(log_ratio / normalized_weight)
+        token_amount_out_before_swap_fee = -np.expm1(log_ratio / normalized_weight) * bO
+        zaz = (1.0 - normalized_weight) * sF
+        fee = token_amount_out_before_swap_fee * zaz
+        token_amount_out = token_amount_out_before_swap_fee - fee
+        
+        d_log_ratio = -bO * ratio_pow * (1.0 - zaz) / normalized_weight
+        d_normalized_weight = (-d_log_ratio * log_ratio / normalized_weight 
+                               + token_amount_out_before_swap_fee * sF)
+        greeks = {'token_balance_out': token_amount_out / bO,
+                  'token_weight_out': d_normalized_weight / tW,
+                  'pool_supply': d_log_ratio * pool_amount_in_after_exit_fee / (pS * (pS - pool_amount_in_after_exit_fee)),
+                  'total_weight': -d_normalized_weight * normalized_weight / tW,
+                  'pool_amount_in': -d_log_ratio * (1.0 - EXIT_FEE) / (pS - pool_amount_in_after_exit_fee),
+                  'swap_fee': -token_amount_out_before_swap_fee * (1.0 - normalized_weight)}
+        return BalancerMathGreeksResult(token_amount_out, fee, greeks)
+
+    # pAi = pS * ( 1 - ( 1 - T / bO )^nW ) / ( 1 - eF ),  T = tAo / ( 1 - ( 1 - nW ) * sF ),  nW = wO / tW
+    @staticmethod
+    def calc_pool_in_given_single_out(
+            token_balance_out,
+            token_weight_out,
+            pool_supply,
+            total_weight,
+            token_amount_out,
+            swap_fee):
+        bO, wO, pS, tW, aO, sF = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in 
+                                                      (token_balance_out, token_weight_out, pool_supply, total_weight, token_amount_out, swap_fee)])
+        normalized_weight = wO / tW
+        zar = (1.0 - normalized_weight) * sF
+        token_amount_out_before_swap_fee = aO / (1.0 - zar)
+        log_ratio = np.log1p(-token_amount_out_before_swap_fee / bO)
+        ratio_pow = np.exp(normalized_weight * log_ratio)
+        pool_amount_in = -np.expm1(normalized_weight * log_ratio) * pS / (1.0 - EXIT_FEE)
+        
+        d_log_ratio = -pS * normalized_weight * ratio_pow / (1.0 - EXIT_FEE)
+        d_before_fee = -d_log_ratio / (bO - token_amount_out_before_swap_fee)
+        d_zar = d_before_fee * token_amount_out_before_swap_fee / (1.0 - zar)
+        d_normalized_weight = -pS * ratio_pow * log_ratio / (1.0 - EXIT_FEE) - d_zar * sF
+        greeks = {'token_balance_out': d_log_ratio * token_amount_out_before_swap_fee / (bO * (bO - token_amount_out_before_swap_fee)),
+                  'token_weight_out': d_normalized_weight / tW,
+                  'pool_supply': pool_amount_in / pS,
+                  'total_weight': -d_normalized_weight * normalized_weight / tW,
+                  'token_amount_out': d_before_fee / (1.0 - zar),
+                  'swap_fee': d_zar * (1.0 - normalized_weight)}
+        return BalancerMathGreeksResult(pool_amount_in, token_amount_out_before_swap_fee * zar, greeks)
@@ -0,0 +1,266 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from fractions import Fraction
+from ..exchg import balancer_constants
+from ..exchg.result import BalancerMathResult
+
+BONE = 10**18
+EXIT_FEE = int(balancer_constants.EXIT_FEE * BONE)
+MIN_BPOW_BASE = int(balancer_constants.MIN_BPOW_BASE * BONE)
+MAX_BPOW_BASE = int(balancer_constants.MAX_BPOW_BASE * BONE)
+BPOW_PRECISION = int(balancer_constants.BPOW_PRECISION * BONE)
+
+class BalancerMathInt:
+
+    """ 
+        Integer (18-decimal wei) implementation of the Balancer V1 weighted math, mirroring 
+        BNum.sol and BMath.sol operation for operation (bmul/bdiv rounding, bpowi, bpowApprox), 
+        so results match the on-chain pool bit-for-bit
+        
+        All calc_* arguments and BalancerMathResult outputs are wei integers (1.0 == BONE); 
+        to_num/to_float convert from/to token units for use as a BalancerExchange backend
+    """  
+
+    @staticmethod
+    def to_num(value):
+        if isinstance(value, int):
+            return value * BONE
+        numer, denom = Fraction(value).as_integer_ratio()
+        return numer * BONE // denom
+
+    @staticmethod
+    def to_float(value):
+        return value / BONE
+
+    @staticmethod
+    def btoi(a):
+        return a // BONE
+
+    @staticmethod
+    def bfloor(a):
+        return (a // BONE) * BONE
+
+    @staticmethod
+    def badd(a, b):
+        return a + b
+
+    @staticmethod
+    def bsub(a, b):
+        assert a >= b, 'Balancer V1: ERR_SUB_UNDERFLOW'
+        return a - b
+
+    @staticmethod
+    def bsub_sign(a, b):
+        if a >= b:
+            return a - b, False
+        return b - a, True
+
+    @staticmethod
+    def bmul(a, b):
+        return (a * b + BONE // 2) // BONE
+
+    @staticmethod
+    def bdiv(a, b):
+        assert b != 0, 'Balancer V1: ERR_DIV_ZERO'
+        return (a * BONE + b // 2) // b
+
+    @staticmethod
+    def bpowi(a, n):
+        bmul = BalancerMathInt.bmul
+        z = a if n % 2 != 0 else BONE
+        n //= 2
+        while n != 0:
+            a = bmul(a, a)
+            if n % 2 != 0:
+                z = bmul(z, a)
+            n //= 2
+        return z
+
+    @staticmethod
+    def bpow(base, exp):
+        assert base >= MIN_BPOW_BASE, 'Balancer V1: ERR_BPOW_BASE_TOO_LOW'
+        assert base <= MAX_BPOW_BASE, 'Balancer V1: ERR_BPOW_BASE_TOO_HIGH'
+        whole = BalancerMathInt.bfloor(exp)
+        remain = exp - whole
+        whole_pow = BalancerMathInt.bpowi(base, BalancerMathInt.btoi(whole))
+        if remain == 0:
+            return whole_pow
+        partial_result = BalancerMathInt.bpow_approx(base, remain, BPOW_PRECISION)
+        return BalancerMathInt.bmul(whole_pow, partial_result)
+
+    @staticmethod
+    def bpow_approx(base, exp, precision):
+        bmul = BalancerMathInt.bmul
+        a = exp
+        x, xneg = BalancerMathInt.bsub_sign(base, BONE)
+        term = BONE
+        total = term
+        negative = False
+        i = 1
+        # term(k) = numer / denom 
+        #         = (product(a - i - 1, i=1-->k) * x^k) / (k!)
+        # each iteration, multiply previous term by (a-(k-1)) * x / k
+        # continue until term is less than precision
+        while term >= precision:
+            big_k = i * BONE
+            c, cneg = BalancerMathInt.bsub_sign(a, big_k - BONE)
+            term = bmul(term, bmul(c, x))
+            term = BalancerMathInt.bdiv(term, big_k)
+            if term == 0:
+                break
+            if xneg:
+                negative = not negative
+            if cneg:
+                negative = not negative
+            if negative:
+                total = BalancerMathInt.bsub(total, term)
+            else:
+                total = total + term
+            i += 1
+        return total
+
+    @staticmethod
+    def calc_spot_price(
+            token_balance_in: int,
+            token_weight_in: int,
+            token_balance_out: int,
+            token_weight_out: int,
+            swap_fee: int):
+        bdiv = BalancerMathInt.bdiv
+        numer = bdiv(token_balance_in, token_weight_in)
+        denom = bdiv(token_balance_out, token_weight_out)
+        ratio = bdiv(numer, denom)
+        scale = bdiv(BONE, BalancerMathInt.bsub(BONE, swap_fee))
+        return BalancerMathInt.bmul(ratio, scale)
+
+    @staticmethod
+    def calc_out_given_in(
+            token_amount_in: int,
+            token_balance_in: int,
+            token_weight_in: int,
+            token_balance_out: int,
+            token_weight_out: int,
+            swap_fee: int) -> BalancerMathResult:
+        bdiv, bmul, bsub = BalancerMathInt.bdiv, BalancerMathInt.bmul, BalancerMathInt.bsub
+        weight_ratio = bdiv(token_weight_in, token_weight_out)
+        adjusted_in = bmul(token_amount_in, bsub(BONE, swap_fee))
+        y = bdiv(token_balance_in, token_balance_in + adjusted_in)
+        foo = BalancerMathInt.bpow(y, weight_ratio)
+        bar = bsub(BONE, foo)
+        token_amount_out = bmul(token_balance_out, bar)
+        return BalancerMathResult(token_amount_out, token_amount_in - adjusted_in)
+
+    @staticmethod
+    def calc_in_given_out(
+            token_balance_out: int,
+            token_balance_in: int,
+            token_amount_out: int,
+            token_weight_in: int,
+            token_weight_out: int,
+            swap_fee: int):
+        bdiv, bmul, bsub = BalancerMathInt.bdiv, BalancerMathInt.bmul, BalancerMathInt.bsub
+        weight_ratio = bdiv(token_weight_out, token_weight_in)
+        diff = bsub(token_balance_out, token_amount_out)
+        y = bdiv(token_balance_out, diff)
+        foo = BalancerMathInt.bpow(y, weight_ratio)
+        foo = bsub(foo, BONE)
+        token_amount_in_no_fee = bmul(token_balance_in, foo)
+        token_amount_in = bdiv(token_amount_in_no_fee, bsub(BONE, swap_fee))
+        return BalancerMathResult(token_amount_in, token_amount_in - token_amount_in_no_fee)
+
+    @staticmethod
+    def calc_pool_out_given_single_in(
+            token_balance_in: int,
+            token_weight_in: int,
+            pool_supply: int,
+            total_weight: int,
+            token_amount_in: int,
+            swap_fee: int):
+        bdiv, bmul, bsub = BalancerMathInt.bdiv, BalancerMathInt.bmul, BalancerMathInt.bsub
+        normalized_weight = bdiv(token_weight_in, total_weight)
+        zaz = bmul(bsub(BONE, normalized_weight), swap_fee)
+        token_amount_in_after_fee = bmul(token_amount_in, bsub(BONE, zaz))
+        new_token_balance_in = token_balance_in + token_amount_in_after_fee
+        token_in_ratio = bdiv(new_token_balance_in, token_balance_in)
+        pool_ratio = BalancerMathInt.bpow(token_in_ratio, normalized_weight)
+        new_pool_supply = bmul(pool_ratio, pool_supply)
+        pool_amount_out = bsub(new_pool_supply, pool_supply)
+        return BalancerMathResult(pool_amount_out, token_amount_in - token_amount_in_after_fee)
+
+    @staticmethod
+    def calc_single_in_given_pool_out(
+            token_balance_in: int,
+            token_weight_in: int,
+            pool_supply: int,
+            total_weight: int,
+            pool_amount_out: int,
+            swap_fee: int):
+        bdiv, bmul, bsub = BalancerMathInt.bdiv, BalancerMathInt.bmul, BalancerMathInt.bsub
+        normalized_weight = bdiv(token_weight_in, total_weight)
+        new_pool_supply = pool_supply + pool_amount_out
+        pool_ratio = bdiv(new_pool_supply, pool_supply)
+        boo = bdiv(BONE, normalized_weight)
+        token_in_ratio = BalancerMathInt.bpow(pool_ratio, boo)
+        new_token_balance_in = bmul(token_in_ratio, token_balance_in)
+        token_amount_in_after_fee = bsub(new_token_balance_in, token_balance_in)
+        zar = bmul(bsub(BONE, normalized_weight), swap_fee)
+        token_amount_in = bdiv(token_amount_in_after_fee, bsub(BONE, zar))
+        return BalancerMathResult(token_amount_in, token_amount_in - token_amount_in_after_fee)
+
+    @staticmethod
+    def calc_single_out_given_pool_in(
+            token_balance_out: int,
+            token_weight_out: int,
+            pool_supply: int,
+            total_weight: int,
+            pool_amount_in: int,
+            swap_fee: int
+    ):
+        bdiv, bmul, bsub = BalancerMathInt.bdiv, BalancerMathInt.bmul, BalancerMathInt.bsub
+        normalized_weight = bdiv(token_weight_out, total_weight)
+        pool_amount_in_after_exit_fee = bmul(pool_amount_in, bsub(BONE, EXIT_FEE))
+        new_pool_supply = bsub(pool_supply, pool_amount_in_after_exit_fee)
+        pool_ratio = bdiv(new_pool_supply, pool_supply)
+        token_out_ratio = BalancerMathInt.bpow(pool_ratio, bdiv(BONE, normalized_weight))
+        new_token_balance_out = bmul(token_out_ratio, token_balance_out)
+        token_amount_out_before_swap_fee = bsub(token_balance_out, new_token_balance_out)
+        zaz = bmul(bsub(BONE, normalized_weight), swap_fee)
+        token_amount_out = bmul(token_amount_out_before_swap_fee, bsub(BONE, zaz))
+        return BalancerMathResult(token_amount_out, token_amount_out_before_swap_fee - token_amount_out)
+
+    @staticmethod
+    def calc_pool_in_given_single_out(
+            token_balance_out: int,
+            token_weight_out: int,
+            pool_supply: int,
+            total_weight: int,
+            token_amount_out: int,
+            swap_fee: int
+    ):
+        bdiv, bmul, bsub = BalancerMathInt.bdiv, BalancerMathInt.bmul, BalancerMathInt.bsub
+        normalized_weight = bdiv(token_weight_out, total_weight)
+        zar = bmul(bsub(BONE, normalized_weight), swap_fee)
+        token_amount_out_before_swap_fee = bdiv(token_amount_out, bsub(BONE, zar))
+        new_token_balance_out = bsub(token_balance_out, token_amount_out_before_swap_fee)
+        token_out_ratio = bdiv(new_token_balance_out, token_balance_out)
+        pool_ratio = BalancerMathInt.bpow(token_out_ratio, normalized_weight)
+        new_pool_supply = bmul(pool_ratio, pool_supply)
+        pool_amount_in_after_exit_fee = bsub(pool_supply, new_pool_supply)
+        pool_amount_in = bdiv(pool_amount_in_after_exit_fee, bsub(BONE, EXIT_FEE))
+        return BalancerMathResult(pool_amount_in, token_amount_out_before_swap_fee - token_amount_out)
@@ -1,2 +1,6 @@
 from .BalancerExchange import BalancerExchange
-from .BalancerMath import BalancerMath
\ No newline at end of file
+from .BalancerMath import BalancerMath
+from .BalancerMathFloat import BalancerMathFloat
+from .BalancerMathArray import BalancerMathArray
+from .BalancerMathInt import BalancerMathInt
+from .BalancerMathGreeks import BalancerMathGreeks
\ No newline at end of file
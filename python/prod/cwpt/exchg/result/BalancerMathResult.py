@@ -26,7 +26,7 @@
 from attr import dataclass
 from decimal import Decimal
 
-@dataclass
+@dataclass(slots=True)
 class BalancerMathResult:
     # The relevant result of the operation
     result: Decimal
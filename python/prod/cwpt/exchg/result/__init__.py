@@ -1 +1,2 @@
-from .BalancerMathResult import BalancerMathResult
\ No newline at end of file
+from .BalancerMathResult import BalancerMathResult
+from .BalancerMathGreeksResult import BalancerMathGreeksResult
\ No newline at end of file
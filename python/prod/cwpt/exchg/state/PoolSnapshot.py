@@ -0,0 +1,55 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+class PoolSnapshot:
+    
+    """ 
+        Mutable part of a BalancerExchange captured by snapshot() and written back by 
+        restore(); weights and token metadata are not captured
+        
+        Parameters
+        ---------------
+        self.tkn_totals : tuple
+            ERC20 token_total per vault token (vault order)
+        self.reserves : np.ndarray
+            Copy of pool reserves
+        self.fees : np.ndarray
+            Copy of collected fees 
+        self.pool_shares : float
+            Total pool shares
+        self.pool_providers : dictionary
+            Copy of pool shares referenced by provider
+        self.last_pool_deposit : float
+            Last minted share amount
+        self.joined : bool
+            Pool joined indicator
+        self.tkn_ledgers : tuple
+            Copy of the ERC20 per-address ledger per vault token (None without ledger)
+    """  
+    
+    __slots__ = ('tkn_totals', 'reserves', 'fees', 'pool_shares', 'pool_providers', 'last_pool_deposit', 'joined', 'tkn_ledgers')
+    
+    def __init__(self, tkn_totals, reserves, fees, pool_shares, pool_providers, last_pool_deposit, joined, tkn_ledgers = None):
+        self.tkn_totals = tkn_totals
+        self.reserves = reserves
+        self.fees = fees
+        self.pool_shares = pool_shares
+        self.pool_providers = pool_providers
+        self.last_pool_deposit = last_pool_deposit
+        self.joined = joined
+        self.tkn_ledgers = (None,)*len(tkn_totals) if tkn_ledgers is None else tkn_ledgers
@@ -0,0 +1,133 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from .StateView import StateView
+
+class PoolState:
+    
+    """ 
+        Compact array-backed state of a Balancer pool; token balances, denormalized 
+        weights, normalized weights and collected fees live in contiguous float64 arrays 
+        indexed through a token-index map
+        
+        Parameters
+        ---------------
+        self.tkn_nms : tuple
+            Token names in vault order
+        self.tkn_index : dictionary
+            Array index referenced by token name
+        self.reserves : np.ndarray
+            Pool reserves per token 
+        self.denorm_wts : np.ndarray
+            Denormalized weights per token (mirror of vault)
+        self.norm_wts : np.ndarray
+            Normalized weights per token (mirror of vault)
+        self.fees : np.ndarray
+            Collected fees per token 
+        self.version : int
+            Vault version the weights were loaded from
+    """  
+    
+    __slots__ = ('tkn_nms', 'tkn_index', 'reserves', 'denorm_wts', 'norm_wts', 'fees', 'version')
+    
+    def __init__(self, tkn_nms):
+        n_tkns = len(tkn_nms)
+        self.tkn_nms = tuple(tkn_nms)
+        self.tkn_index = {tkn_nm: k for k, tkn_nm in enumerate(self.tkn_nms)}
+        self.reserves = np.zeros(n_tkns)
+        self.denorm_wts = np.zeros(n_tkns)
+        self.norm_wts = np.zeros(n_tkns)
+        self.fees = np.zeros(n_tkns)
+        self.version = -1
+        
+    def load_weights(self, vault):
+        
+        """ load_weights
+
+            Copy denormalized and normalized weights from vault
+                
+            Parameters
+            -----------------
+            vault : BalancerVault
+                Vault holding token weights
+        """          
+        
+        denorm_wts = vault.get_denorm_weights()
+        norm_wts = vault.get_norm_weights()
+        for tkn_nm, k in self.tkn_index.items():
+            self.denorm_wts[k] = denorm_wts[tkn_nm]
+            self.norm_wts[k] = norm_wts[tkn_nm]
+        self.version = vault.version
+        
+    def load_balances(self, vault):
+        
+        """ load_balances
+
+            Copy token balances from vault into reserves
+                
+            Parameters
+            -----------------
+            vault : BalancerVault
+                Vault holding ERC20 tokens
+        """          
+        
+        balances = vault.get_balances_view()
+        for tkn_nm, k in self.tkn_index.items():
+            self.reserves[k] = balances[tkn_nm]
+            
+    def copy(self):
+        
+        """ copy
+
+            Copy of the state with its own arrays; token names and index are shared
+                
+            Returns
+            -----------------
+            state : PoolState
+                Independent pool state                
+        """          
+        
+        state = PoolState.__new__(PoolState)
+        state.tkn_nms = self.tkn_nms
+        state.tkn_index = self.tkn_index
+        state.reserves = self.reserves.copy()
+        state.denorm_wts = self.denorm_wts.copy()
+        state.norm_wts = self.norm_wts.copy()
+        state.fees = self.fees.copy()
+        state.version = self.version
+        return state
+            
+    def view(self, arr):
+        
+        """ view
+
+            Name-based dictionary facade over one of the state arrays
+                
+            Parameters
+            -----------------
+            arr : np.ndarray
+                reserves, denorm_wts, norm_wts or fees
+                
+            Returns
+            -----------------
+            view : StateView
+                Read-only mapping of token name to array entry                
+        """          
+        
+        return StateView(self.tkn_index, arr)
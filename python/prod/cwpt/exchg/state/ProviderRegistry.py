@@ -0,0 +1,170 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from collections.abc import MutableMapping
+
+class ProviderRegistry(MutableMapping):
+    
+    """ 
+        Indexed registry of pool providers; each user is mapped to a slot of a 
+        float64 share array (grown by doubling, freed slots reused), so that 
+        per-provider accounting can run as array operations over the slots. 
+        Behaves as a dictionary of shares referenced by user
+        
+        Parameters
+        ---------------
+        self.slots : dictionary
+            Slot referenced by user
+        self.users : list
+            User per slot (None for a free slot)
+        self.shares : np.ndarray
+            Shares per slot (0 for a free slot); capacity >= size
+        self.size : int
+            Number of slots in use or freed (slots >= size are unused)
+        self.free : list
+            Freed slots available for reuse
+    """  
+    
+    __slots__ = ('slots', 'users', 'shares', 'size', 'free')
+    
+    def __init__(self, capacity = 16):
+        self.slots = {}
+        self.users = []
+        self.shares = np.zeros(max(1, capacity))
+        self.size = 0
+        self.free = []
+        
+    def slot(self, user):
+        
+        """ slot
+
+            Slot of a user, allocated on first use
+                
+            Parameters
+            -----------------
+            user : str
+                User name/address
+                
+            Returns
+            -----------------
+            slot : int
+                Index into shares                
+        """          
+        
+        slot = self.slots.get(user)
+        if slot is None:
+            if self.free:
+                slot = self.free.pop()
+                self.users[slot] = user
+            else:
+                slot = self.size
+                if slot == len(self.shares):
+                    shares = np.zeros(2*slot)
+                    shares[:slot] = self.shares
+                    self.shares = shares
+                self.users.append(user)
+                self.size += 1
+            self.slots[user] = slot
+        return slot
+        
+    def __getitem__(self, user):
+        return float(self.shares[self.slots[user]])
+    
+    def __setitem__(self, user, value):
+        slot = self.slot(user)
+        self.shares[slot] = value
+        
+    def __delitem__(self, user):
+        slot = self.slots.pop(user)
+        self.shares[slot] = 0
+        self.users[slot] = None
+        self.free.append(slot)
+    
+    def __iter__(self):
+        return iter(self.slots)
+    
+    def __len__(self):
+        return len(self.slots)
+    
+    def __repr__(self):
+        return repr(dict(self.items()))
+    
+    def active(self):
+        
+        """ active
+
+            Slots currently held by a user
+                
+            Returns
+            -----------------
+            out : tuple
+                (users list, slot index array), in slot order                
+        """          
+        
+        if not self.free:
+            return list(self.users), np.arange(self.size)
+        idx = np.array([slot for slot, user in enumerate(self.users) if user is not None], dtype=np.intp)
+        return [self.users[slot] for slot in idx.tolist()], idx
+    
+    def set_shares(self, idx, values):
+        
+        """ set_shares
+
+            Write shares of many slots in place (used to undo array operations)
+                
+            Parameters
+            -----------------
+            idx : np.ndarray
+                Slot indices
+            values : np.ndarray
+                Shares per slot                
+        """          
+        
+        self.shares[idx] = values
+    
+    def load(self, registry):
+        
+        """ load
+
+            Overwrite this registry in place with the contents of another, so holders 
+            of this object see the loaded providers
+                
+            Parameters
+            -----------------
+            registry : ProviderRegistry
+                Registry to copy from                
+        """          
+        
+        self.slots = dict(registry.slots)
+        self.users = list(registry.users)
+        self.shares = registry.shares.copy()
+        self.size = registry.size
+        self.free = list(registry.free)
+    
+    def total(self):
+        return float(self.shares[:self.size].sum())
+    
+    def copy(self):
+        registry = ProviderRegistry.__new__(ProviderRegistry)
+        registry.slots = dict(self.slots)
+        registry.users = list(self.users)
+        registry.shares = self.shares.copy()
+        registry.size = self.size
+        registry.free = list(self.free)
+        return registry
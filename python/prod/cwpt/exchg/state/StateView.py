@@ -0,0 +1,56 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from collections.abc import Mapping
+
+class StateView(Mapping):
+    
+    """ 
+        Read-only name-based dictionary facade over a PoolState array; reads return 
+        python floats, and the array is held through a non-writeable numpy view so 
+        pool state only changes through the (journaled) exchange methods
+        
+        Parameters
+        ---------------
+        self.tkn_index : dictionary
+            Array index referenced by token name
+        self.arr : np.ndarray
+            Non-writeable view of the backing array
+    """  
+    
+    __slots__ = ('tkn_index', 'arr')
+    
+    def __init__(self, tkn_index, arr):
+        self.tkn_index = tkn_index
+        self.arr = arr.view()
+        self.arr.setflags(write = False)
+        
+    def __getitem__(self, tkn_name):
+        return float(self.arr[self.tkn_index[tkn_name]])
+    
+    def __iter__(self):
+        return iter(self.tkn_index)
+    
+    def __len__(self):
+        return len(self.tkn_index)
+    
+    def __repr__(self):
+        return repr(self.copy())
+    
+    def copy(self):
+        return {tkn_nm: float(self.arr[k]) for tkn_nm, k in self.tkn_index.items()}
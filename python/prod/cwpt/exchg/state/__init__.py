@@ -0,0 +1,4 @@
+from .StateView import StateView
+from .PoolState import PoolState
+from .PoolSnapshot import PoolSnapshot
+from .ProviderRegistry import ProviderRegistry
\ No newline at end of file
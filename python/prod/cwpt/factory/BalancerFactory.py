@@ -34,6 +34,10 @@ class BalancerFactory(IExchangeFactory):
             Token name 
         self.address : str
             Address name            
+        self.exchanges_from_tkn : dictionary
+            Deployed exchanges referenced by token name
+        self.exchanges_from_pair : dictionary
+            Token adjacency index; exchanges referenced by [tkn_a_nm][tkn_b_nm]            
     """       
       
     def __init__(self, name: str, address: str) -> None:
@@ -41,6 +45,8 @@ class BalancerFactory(IExchangeFactory):
         self.address = address
         self.exchange_from_token = {}
         self.token_from_exchange = {} 
+        self.exchanges_from_tkn = {}
+        self.exchanges_from_pair = {}
         self.parent_lp = None
         
     def deploy(self, exchg_data : BalancerExchangeData):   
@@ -67,14 +73,80 @@ class BalancerFactory(IExchangeFactory):
         assert symbol not in self.token_from_exchange, 'BalancerFactory: EXCHANGE_CREATED'            
             
         factory_struct = FactoryData(self.token_from_exchange,  self.parent_lp, self.name, self.address)
-        exchg_struct = BalancerExchangeData(vault = vault, symbol=symbol, address=address)
+        exchg_struct = BalancerExchangeData(vault = vault, symbol=symbol, address=address, math_mode=exchg_data.math_mode, validation=exchg_data.validation, 
+                                            swap_fee=exchg_data.swap_fee)
         exchange = BalancerExchange(factory_struct, exchg_struct)             
             
         self.exchange_from_token[vault.get_name()] = exchange
-        self.token_from_exchange[exchange.name] = vault.get_dict()
+        self.token_from_exchange[exchange.name] = dict(vault.get_dict())
+        self._index_exchange(exchange, vault.get_names_view())
         
         return exchange  
     
+    def _index_exchange(self, exchange, tkn_nms):
+        
+        """ _index_exchange
+
+            Add a newly deployed exchange to the token and pair indexes
+                
+            Parameters
+            -----------------
+            exchange : BalancerExchange
+                Newly created exchange    
+            tkn_nms : list
+                Names of the pool tokens                  
+        """          
+        
+        for tkn_nm in tkn_nms:
+            self.exchanges_from_tkn.setdefault(tkn_nm, []).append(exchange)
+            pairs = self.exchanges_from_pair.setdefault(tkn_nm, {})
+            for opp_tkn_nm in tkn_nms:
+                if opp_tkn_nm != tkn_nm:
+                    pairs.setdefault(opp_tkn_nm, []).append(exchange)
+                    
+    def get_exchanges(self, tkn_nm, opp_tkn_nm = None):
+        
+        """ get_exchanges
+
+            Get every deployed exchange holding a token, or holding both tokens 
+            of a pair when opp_tkn_nm is given
+                
+            Parameters
+            -----------------
+            tkn_nm : str
+                Token name  
+            opp_tkn_nm : str
+                Opposing token name (optional)
+                
+            Returns
+            -----------------
+            exchanges : list
+                Exchanges in order of deployment                    
+        """          
+        
+        if opp_tkn_nm is None:
+            return self.exchanges_from_tkn.get(tkn_nm, [])
+        return self.exchanges_from_pair.get(tkn_nm, {}).get(opp_tkn_nm, [])
+    
+    def get_neighbors(self, tkn_nm):
+        
+        """ get_neighbors
+
+            Get names of the tokens sharing at least one exchange with a token
+                
+            Parameters
+            -----------------
+            tkn_nm : str
+                Token name  
+                
+            Returns
+            -----------------
+            tkn_nms : dict_keys
+                Names of adjacent tokens                    
+        """          
+        
+        return self.exchanges_from_pair.get(tkn_nm, {}).keys()
+    
     def get_exchange(self, token):
         
         """ get_exchange
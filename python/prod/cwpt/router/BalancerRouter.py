@@ -0,0 +1,339 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from ...cwpt.exchg import BalancerMathArray
+from ...constants.balancer_constants import MAX_IN_RATIO
+from ...constants.balancer_constants import MAX_OUT_RATIO
+
+class BalancerRouter:
+    
+    """ 
+        Order router over the exchanges deployed by one or more BalancerFactory 
+        registries; enumerates token paths through the factory adjacency index 
+        (kept up to date on every deploy), splits each hop across the parallel 
+        pools of that pair so their marginal rates are equal (within each pool's 
+        MAX_IN_RATIO/MAX_OUT_RATIO caps), and returns the single path with the 
+        largest output; the amount is not split across different paths, and a pool 
+        is used on at most one hop of a path (float math, see BalancerMathArray)
+        
+        Parameters
+        ---------------
+        self.factories : list
+            BalancerFactory registries routed over
+        self.max_hops : int
+            Default maximum number of hops per path
+    """       
+    
+    def __init__(self, factories = None, max_hops = 2):
+        self.factories = []
+        self.max_hops = max_hops
+        for factory in factories or []:
+            self.add_factory(factory)
+            
+    def add_factory(self, factory):
+        
+        """ add_factory
+
+            Route over the exchanges of another factory
+                
+            Parameters
+            -----------------
+            factory : BalancerFactory
+                Factory registry      
+        """          
+        
+        assert factory not in self.factories, 'BalancerRouter: FACTORY_ADDED'
+        self.factories.append(factory)
+        
+    def get_pools(self, tkn_in_nm, tkn_out_nm):
+        
+        """ get_pools
+
+            Get the joined exchanges trading a token pair, across all factories
+                
+            Parameters
+            -----------------
+            tkn_in_nm : str
+                Input token name  
+            tkn_out_nm : str
+                Output token name  
+                
+            Returns
+            -----------------
+            pools : list
+                Exchanges holding both tokens                    
+        """          
+        
+        return [lp for factory in self.factories 
+                for lp in factory.get_exchanges(tkn_in_nm, tkn_out_nm) if lp.joined]
+    
+    def get_neighbors(self, tkn_nm):
+        
+        """ get_neighbors
+
+            Get names of the tokens one hop away from a token, across all factories
+                
+            Parameters
+            -----------------
+            tkn_nm : str
+                Token name  
+                
+            Returns
+            -----------------
+            tkn_nms : set
+                Names of adjacent tokens                    
+        """          
+        
+        if len(self.factories) == 1:
+            return self.factories[0].get_neighbors(tkn_nm)
+        return set().union(*(factory.get_neighbors(tkn_nm) for factory in self.factories))
+        
+    def get_paths(self, tkn_in_nm, tkn_out_nm, max_hops = None):
+        
+        """ get_paths
+
+            Enumerate the token paths (no repeated token) from tkn_in_nm to 
+            tkn_out_nm of at most max_hops hops
+                
+            Parameters
+            -----------------
+            tkn_in_nm : str
+                Input token name  
+            tkn_out_nm : str
+                Output token name  
+            max_hops : int
+                Maximum number of hops (default self.max_hops)
+                
+            Returns
+            -----------------
+            paths : list
+                Tuples of token names, shortest first                    
+        """          
+        
+        max_hops = self.max_hops if max_hops is None else max_hops
+        paths = []
+        stack = [(tkn_in_nm,)]
+        while stack:
+            path = stack.pop()
+            neighbors = self.get_neighbors(path[-1])
+            if tkn_out_nm in neighbors:
+                paths.append(path + (tkn_out_nm,))
+            if len(path) < max_hops:
+                stack.extend(path + (tkn_nm,) for tkn_nm in neighbors 
+                             if tkn_nm != tkn_out_nm and tkn_nm not in path)
+                
+        paths.sort(key = len)
+        return paths
+    
+    @staticmethod
+    def calc_max_in(token_balance_in, token_weight_in, token_weight_out, swap_fee):
+        
+        """ calc_max_in
+
+            Largest input per pool allowed by MAX_IN_RATIO (aI <= bI * MAX_IN_RATIO) 
+            and MAX_OUT_RATIO (aO <= bO * MAX_OUT_RATIO)
+                
+            Parameters
+            -----------------
+            token_balance_in : array_like
+                Input balance per pool
+            token_weight_in : array_like
+                Input denormalized weight per pool
+            token_weight_out : array_like
+                Output denormalized weight per pool
+            swap_fee : array_like
+                Swap fee per pool
+                
+            Returns
+            -----------------
+            amts_tkn_in : np.ndarray
+                Maximum input amount per pool                    
+        """          
+        
+        ratio = np.divide(token_weight_in, token_weight_out)
+        gamma = 1.0 - np.asarray(swap_fee, dtype=np.float64)
+        max_out_in = np.expm1(-np.log1p(-float(MAX_OUT_RATIO)) / ratio) / gamma
+        return np.asarray(token_balance_in, dtype=np.float64) * np.minimum(float(MAX_IN_RATIO), max_out_in)
+    
+    @staticmethod
+    def split(amt_tkn_in, token_balance_in, token_weight_in, token_balance_out, token_weight_out, swap_fee, tol = 1e-12, max_iter = 64):
+        
+        """ split
+
+            Optimal split of amt_tkn_in across parallel weighted pools; each pool 
+            receives x such that its marginal output 
+            
+                bO * r * g * bI^r * ( bI + g * x )^-(r+1),  r = wI / wO,  g = 1 - sF
+            
+            equals a common rate lam (zero for pools whose spot rate is below lam, 
+            and the pool's cap, see calc_max_in, for pools that cannot reach lam).
+            log(lam) is found by safeguarded Newton on sum(x) = amt_tkn_in
+                
+            Parameters
+            -----------------
+            amt_tkn_in : float
+                Total amount to route
+            token_balance_in : array_like
+                Input balance per pool
+            token_weight_in : array_like
+                Input denormalized weight per pool
+            token_balance_out : array_like
+                Output balance per pool
+            token_weight_out : array_like
+                Output denormalized weight per pool
+            swap_fee : array_like
+                Swap fee per pool
+            tol : float
+                Relative tolerance on the total
+            max_iter : int
+                Maximum number of iterations
+                
+            Returns
+            -----------------
+            amts_tkn_in : np.ndarray
+                Input amount per pool, each within its cap and summing to amt_tkn_in; 
+                None when amt_tkn_in exceeds the sum of the pool caps                    
+        """          
+        
+        bal_in = np.asarray(token_balance_in, dtype=np.float64)
+        caps = np.broadcast_to(BalancerRouter.calc_max_in(bal_in, token_weight_in, token_weight_out, swap_fee), bal_in.shape)
+        if amt_tkn_in > caps.sum():
+            return None
+        if bal_in.size == 1 or amt_tkn_in <= 0:
+            return np.full(bal_in.shape, float(amt_tkn_in))
+        
+        ratio = np.divide(token_weight_in, token_weight_out)
+        ratio1 = ratio + 1.0
+        gamma = 1.0 - np.asarray(swap_fee, dtype=np.float64)
+        log_k = np.log(np.multiply(token_balance_out, ratio * gamma)) + ratio * np.log(bal_in)
+        
+        # lam bracket: all pools idle at the best spot rate; at the worst rate of each 
+        # pool filled to min(amt_tkn_in, cap), the pools together take amt_tkn_in
+        hi = np.max(log_k - ratio1 * np.log(bal_in))
+        lo = np.min(log_k - ratio1 * np.log(bal_in + gamma * np.minimum(amt_tkn_in, caps)))
+        log_lam = 0.5 * (lo + hi)
+        for _ in range(max_iter):
+            level = np.exp((log_k - log_lam) / ratio1)
+            amts = np.clip((level - bal_in) / gamma, 0.0, caps)
+            resid = amts.sum() - amt_tkn_in
+            if abs(resid) <= tol * amt_tkn_in:
+                break
+            if resid > 0:
+                lo = log_lam
+            else:
+                hi = log_lam
+            slope = -np.sum(np.where((amts > 0) & (amts < caps), level / (gamma * ratio1), 0.0))
+            step = log_lam - resid / slope if slope < 0 else lo
+            log_lam = step if lo < step < hi else 0.5 * (lo + hi)
+        
+        # close the residual: rescale the pools below their cap, clip to the caps and 
+        # repeat (each pass pins at least one more pool); pools still idle take what 
+        # is left in proportion to their headroom
+        for _ in range(bal_in.size):
+            free = amts < caps
+            if not free.any() or amts[free].sum() <= 0:
+                break
+            scaled = amts[free] * ((amt_tkn_in - amts[~free].sum()) / amts[free].sum())
+            amts[free] = np.minimum(scaled, caps[free])
+            if np.all(scaled <= caps[free]):
+                break
+        resid = amt_tkn_in - amts.sum()
+        if resid > tol * amt_tkn_in:
+            amts = np.minimum(amts + (caps - amts) * (resid / (caps - amts).sum()), caps)
+        if abs(amts.sum() - amt_tkn_in) > tol * amt_tkn_in:
+            return None
+        return amts
+    
+    def quote_path(self, amt_tkn_in, path):
+        
+        """ quote_path
+
+            Quote amt_tkn_in along a token path, splitting each hop optimally 
+            across the parallel pools of that pair; pools used on an earlier hop 
+            are skipped, so every hop is quoted against unchanged balances
+                
+            Parameters
+            -----------------
+            amt_tkn_in : float
+                Amount of input token
+            path : tuple
+                Token names from input to output token
+                
+            Returns
+            -----------------
+            out : dict
+                tkn_out_amt, path and hops (per hop, list of (exchange, amt_in, amt_out)); 
+                hops is None when a hop has no unused pool or exceeds the pool caps                    
+        """          
+        
+        amt = float(amt_tkn_in)
+        hops = []
+        used = set()
+        for tkn_in_nm, tkn_out_nm in zip(path[:-1], path[1:]):
+            pools = [lp for lp in self.get_pools(tkn_in_nm, tkn_out_nm) if id(lp) not in used]
+            if not pools:
+                return {'tkn_out_amt': 0.0, 'path': path, 'hops': None}
+            consts = np.empty((5, len(pools)))
+            for k, lp in enumerate(pools):
+                balances = lp.vault.get_balances_view()
+                tkn_wts = lp.vault.get_denorm_weights()
+                consts[:, k] = (balances[tkn_in_nm], tkn_wts[tkn_in_nm], 
+                                balances[tkn_out_nm], tkn_wts[tkn_out_nm], lp.swap_fee)
+            amts_in = self.split(amt, *consts)
+            if amts_in is None:
+                return {'tkn_out_amt': 0.0, 'path': path, 'hops': None}
+            used.update(id(lp) for lp, amt_in in zip(pools, amts_in.tolist()) if amt_in > 0)
+            amts_out = BalancerMathArray.calc_out_given_in(amts_in, *consts).result
+            hops.append([(lp, a_in, a_out) for lp, a_in, a_out in 
+                         zip(pools, amts_in.tolist(), amts_out.tolist()) if a_in > 0])
+            amt = float(amts_out.sum())
+            
+        return {'tkn_out_amt': amt, 'path': path, 'hops': hops}
+    
+    def quote(self, amt_tkn_in, tkn_in, tkn_out, max_hops = None):
+        
+        """ quote
+
+            Best route for swapping amt_tkn_in of tkn_in into tkn_out
+                
+            Parameters
+            -----------------
+            amt_tkn_in : float
+                Amount of input token
+            tkn_in : ERC20
+                Input token   
+            tkn_out : ERC20
+                Output token  
+            max_hops : int
+                Maximum number of hops (default self.max_hops)
+                
+            Returns
+            -----------------
+            out : dict
+                tkn_out_amt, path and hops of the best route (see quote_path); 
+                hops is None when no route exists                    
+        """          
+        
+        best = {'tkn_out_amt': 0.0, 'path': None, 'hops': None}
+        for path in self.get_paths(tkn_in.token_name, tkn_out.token_name, max_hops):
+            out = self.quote_path(amt_tkn_in, path)
+            if out['tkn_out_amt'] > best['tkn_out_amt']:
+                best = out
+                
+        return best
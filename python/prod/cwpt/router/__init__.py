@@ -0,0 +1 @@
+from .BalancerRouter import BalancerRouter
\ No newline at end of file
@@ -1 +1,4 @@
-from .Proc import Proc
\ No newline at end of file
+from .Proc import Proc
+from .MathMode import MathMode
+from .Validation import Validation
+from .EventKind import EventKind
\ No newline at end of file
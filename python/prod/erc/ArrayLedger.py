@@ -0,0 +1,126 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+
+class ArrayLedger:
+    
+    """ Per-address token balances for dense integer user ids (0, 1, 2, ...), held in 
+        a float64 array that grows by doubling; negative or non-integer ids (eg, user 
+        names) are rejected rather than wrapped or converted
+
+        Parameters
+        ---------------
+        self.balances : np.ndarray
+            Balance indexed by user id (capacity >= highest id + 1)
+    """   
+    
+    __slots__ = ('balances',)
+    
+    def __init__(self, capacity = 1024):
+        self.balances = np.zeros(max(1, capacity))
+        
+    @staticmethod
+    def _check_id(addr):
+        assert isinstance(addr, (int, np.integer)) and not isinstance(addr, bool) and addr >= 0, 'ERC20: INVALID LEDGER ID'
+        
+    @staticmethod
+    def _check_ids(addrs):
+        addrs = np.asarray(addrs)
+        if addrs.size == 0:
+            return addrs.astype(np.intp)
+        assert addrs.dtype.kind in 'iu' and addrs.min() >= 0, 'ERC20: INVALID LEDGER ID'
+        return addrs.astype(np.intp, copy=False)
+        
+    def _grow(self, addr):
+        capacity = len(self.balances)
+        while capacity <= addr:
+            capacity *= 2
+        balances = np.zeros(capacity)
+        balances[:len(self.balances)] = self.balances
+        self.balances = balances
+        
+    def add(self, addr, value):
+        
+        """ add
+
+            Add value (may be negative) to the balance of addr
+                
+            Parameters
+            ---------------
+            addr : int
+                user id   
+            value : float
+                delta to add to balance                
+        """  
+        
+        self._check_id(addr)
+        if addr >= len(self.balances):
+            self._grow(addr)
+        self.balances[addr] += value
+        
+    def get(self, addr):
+        self._check_id(addr)
+        return float(self.balances[addr]) if addr < len(self.balances) else 0.0
+    
+    def gets(self, addrs):
+        
+        """ gets
+
+            Balances of many user ids in one gather
+                
+            Parameters
+            ---------------
+            addrs : array_like
+                user ids   
+                
+            Returns
+            ---------------
+            balances : np.ndarray
+                Balance per id (0 for ids never credited)                
+        """  
+        
+        addrs = self._check_ids(addrs)
+        out = np.zeros(addrs.shape)
+        known = addrs < len(self.balances)
+        out[known] = self.balances[addrs[known]]
+        return out
+    
+    def adds(self, addrs, values):
+        
+        """ adds
+
+            Add values to many user ids (repeated ids accumulate)
+                
+            Parameters
+            ---------------
+            addrs : array_like
+                user ids   
+            values : array_like
+                deltas to add                
+        """  
+        
+        addrs = self._check_ids(addrs)
+        if len(addrs) and addrs.max() >= len(self.balances):
+            self._grow(int(addrs.max()))
+        np.add.at(self.balances, addrs, values)
+    
+    def copy(self):
+        ledger = ArrayLedger.__new__(ArrayLedger)
+        ledger.balances = self.balances.copy()
+        return ledger
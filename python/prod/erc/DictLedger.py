@@ -0,0 +1,76 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+
+class DictLedger:
+    
+    """ Per-address token balances keyed by any hashable address
+
+        Parameters
+        ---------------
+        self.balances : dictionary
+            Balance referenced by address 
+    """   
+    
+    __slots__ = ('balances',)
+    
+    def __init__(self, balances = None):
+        self.balances = {} if balances is None else dict(balances)
+        
+    def add(self, addr, value):
+        
+        """ add
+
+            Add value (may be negative) to the balance of addr
+                
+            Parameters
+            ---------------
+            addr : str
+                user address   
+            value : float
+                delta to add to balance                
+        """  
+        
+        self.balances[addr] = self.balances.get(addr, 0) + value
+        
+    def get(self, addr):
+        return self.balances.get(addr, 0)
+    
+    def gets(self, addrs):
+        
+        """ gets
+
+            Balances of many addresses
+                
+            Parameters
+            ---------------
+            addrs : list
+                user addresses   
+                
+            Returns
+            ---------------
+            balances : np.ndarray
+                Balance per address (0 for unknown addresses)                
+        """  
+        
+        get = self.balances.get
+        return np.fromiter((get(addr, 0) for addr in addrs), dtype=np.float64, count=len(addrs))
+    
+    def copy(self):
+        return DictLedger(self.balances)
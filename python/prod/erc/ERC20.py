@@ -28,13 +28,37 @@ class ERC20:
             Token address  
         self.token_total : float
             Token holdings 
+        self.ledger : DictLedger or ArrayLedger
+            Optional per-address balances (None, the default, skips address bookkeeping)
+            
+        With a ledger, deposit debits _from and transfer credits _to in the same call; 
+        None addresses (eg, initial pool funding) only change token_total          
     """   
+    
+    __slots__ = ('token_name', 'token_addr', 'token_supply', 'token_total', 'type', 'ledger')
+    
     def __init__(self, name: str, addr: str) -> None:
         self.token_name = name
         self.token_addr = addr
         self.token_supply = 1_000_000_000
         self.token_total = 0
         self.type = 'standard'
+        self.ledger = None
+        
+    def set_ledger(self, ledger = None):
+        
+        """ set_ledger
+
+            Attach a per-address ledger (DictLedger for arbitrary addresses, ArrayLedger 
+            for dense integer user ids), or detach it with None
+                
+            Parameters
+            ---------------
+            ledger : DictLedger or ArrayLedger
+                Per-address balances                
+        """  
+        
+        self.ledger = ledger
 
     def deposit(self, _from, value):
         
@@ -51,6 +75,8 @@ class ERC20:
         """           
         
         self.token_total += value
+        if self.ledger is not None and _from is not None:
+            self.ledger.add(_from, -value)
 
     def transfer(self, _to, value):
         
@@ -67,4 +93,64 @@ class ERC20:
         """         
         
         self.token_total -= value
+        if self.ledger is not None and _to is not None:
+            self.ledger.add(_to, value)
+            
+    def credit(self, _to, value):
+        
+        """ credit
+
+            Credit an address from outside the pool (eg, fund a user wallet); 
+            token_total is unchanged
+                
+            Parameters
+            ---------------
+            _to : str
+                user address   
+            value : float
+                amount to credit                
+        """  
+        
+        assert self.ledger is not None, 'ERC20: NO LEDGER'
+        self.ledger.add(_to, value)
+            
+    def balance_of(self, addr):
+        
+        """ balance_of
+
+            Balance held by an address
+                
+            Parameters
+            ---------------
+            addr : str
+                user address   
+                
+            Returns
+            ---------------
+            balance : float
+                balance of addr (0 if unknown)                
+        """  
+        
+        assert self.ledger is not None, 'ERC20: NO LEDGER'
+        return self.ledger.get(addr)
+    
+    def balances_of(self, addrs):
+        
+        """ balances_of
+
+            Balances held by many addresses
+                
+            Parameters
+            ---------------
+            addrs : list
+                user addresses   
+                
+            Returns
+            ---------------
+            balances : np.ndarray
+                balance per address                
+        """  
+        
+        assert self.ledger is not None, 'ERC20: NO LEDGER'
+        return self.ledger.gets(addrs)
         
@@ -1 +1,3 @@
-from .ERC20 import ERC20
\ No newline at end of file
+from .ERC20 import ERC20
+from .DictLedger import DictLedger
+from .ArrayLedger import ArrayLedger
\ No newline at end of file
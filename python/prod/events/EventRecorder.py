@@ -0,0 +1,203 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from ..enums import EventKind
+
+EVENT_COLUMNS = (('step', np.int64), ('kind', np.int8), ('tkn_in', np.int16), ('tkn_out', np.int16), 
+                 ('amt_in', np.float64), ('amt_out', np.float64), ('fee', np.float64), ('shares', np.float64))
+EVENT_KINDS = {EventKind.SWAP: 'swap', EventKind.JOIN: 'join', EventKind.EXIT: 'exit', 
+               EventKind.MINT: 'mint', EventKind.BURN: 'burn'}
+
+class EventRecorder:
+    
+    """ 
+        Opt-in columnar log of pool operations; attach with BalancerExchange.set_recorder
+        
+        Each event is one row across preallocated NumPy column buffers (doubled when 
+        full): step (set via tick), kind (EventKind), tkn_in and tkn_out (token index 
+        in tkn_nms, -1 if none), amt_in and amt_out (token amounts into / out of the 
+        pool), fee and shares. Share movements are logged only on mint and burn rows 
+        (every join is followed by a mint, every exit by a burn), and join / exit rows 
+        carry the token flows with shares 0, so summing the shares of mint rows minus 
+        burn rows gives the change in pool shares. All-asset join_pool / exit_pool log 
+        one join / exit row per token. Events of a rolled-back transaction are discarded
+        
+        Parameters
+        ---------------
+        self.tkn_nms : tuple
+            Token names the token indices refer to
+        self.step : int
+            Current step stamped on new events
+        self.size : int
+            Number of recorded events
+        self.buffers : dictionary
+            Column buffers referenced by column name (capacity >= size)
+    """     
+    
+    def __init__(self, capacity = 1024, tkn_nms = ()):
+        self.tkn_nms = tuple(tkn_nms)
+        self.step = 0
+        self.size = 0
+        self.buffers = {col: np.empty(max(1, capacity), dtype=dtype) for col, dtype in EVENT_COLUMNS}
+        
+    def __len__(self):
+        return self.size
+        
+    def tick(self, step = None):
+        
+        """ tick
+
+            Advance the step stamped on subsequent events (or set it)
+                
+            Parameters
+            -----------------
+            step : int
+                New step (default current step + 1)
+        """          
+        
+        self.step = self.step + 1 if step is None else step
+        
+    def record(self, kind, tkn_in, tkn_out, amt_in, amt_out, fee, shares):
+        
+        """ record
+
+            Append one event
+                
+            Parameters
+            -----------------
+            kind : int
+                EventKind
+            tkn_in : int
+                Index of token into the pool (-1 if none)
+            tkn_out : int
+                Index of token out of the pool (-1 if none)
+            amt_in : float
+                Token amount into the pool
+            amt_out : float
+                Token amount out of the pool
+            fee : float
+                Fee collected
+            shares : float
+                Pool shares minted or burned
+        """          
+        
+        k = self.size
+        buffers = self.buffers
+        if k == len(buffers['step']):
+            self._grow(2*k)
+            buffers = self.buffers
+        buffers['step'][k] = self.step
+        buffers['kind'][k] = kind
+        buffers['tkn_in'][k] = tkn_in
+        buffers['tkn_out'][k] = tkn_out
+        buffers['amt_in'][k] = amt_in
+        buffers['amt_out'][k] = amt_out
+        buffers['fee'][k] = fee
+        buffers['shares'][k] = shares
+        self.size = k + 1
+        
+    def _grow(self, capacity):
+        for col, buf in self.buffers.items():
+            new_buf = np.empty(capacity, dtype=buf.dtype)
+            new_buf[:self.size] = buf[:self.size]
+            self.buffers[col] = new_buf
+        
+    def truncate(self, size):
+        
+        """ truncate
+
+            Drop events recorded after the first size events
+                
+            Parameters
+            -----------------
+            size : int
+                Number of events kept
+        """          
+        
+        self.size = min(self.size, size)
+        
+    def clear(self):
+        self.size = 0
+        
+    def columns(self):
+        
+        """ columns
+
+            Recorded events as column views (no copy)
+                
+            Returns
+            -----------------
+            columns : dictionary
+                np.ndarray of length size referenced by column name                
+        """          
+        
+        return {col: buf[:self.size] for col, buf in self.buffers.items()}
+    
+    def to_structured(self):
+        
+        """ to_structured
+
+            Recorded events as one structured array
+                
+            Returns
+            -----------------
+            events : np.ndarray
+                Structured array with EVENT_COLUMNS fields                
+        """          
+        
+        events = np.empty(self.size, dtype=list(EVENT_COLUMNS))
+        for col, buf in self.buffers.items():
+            events[col] = buf[:self.size]
+        return events
+    
+    def save(self, path):
+        
+        """ save
+
+            Write recorded events to a .npz file (one array per column, plus tkn_nms)
+                
+            Parameters
+            -----------------
+            path : str
+                Output file path
+        """          
+        
+        np.savez(path, tkn_nms=np.array(self.tkn_nms, dtype=str), **self.columns())
+        
+    def to_parquet(self, path):
+        
+        """ to_parquet
+
+            Write recorded events to a Parquet file; kind and token indices are 
+            written as names. Requires pandas with pyarrow or fastparquet
+                
+            Parameters
+            -----------------
+            path : str
+                Output file path
+        """          
+        
+        import pandas as pd
+        columns = self.columns()
+        tkn_nms = np.array(self.tkn_nms + ('',), dtype=object)
+        frame = pd.DataFrame(columns)
+        frame['kind'] = pd.Categorical.from_codes(columns['kind'], [EVENT_KINDS[k] for k in sorted(EVENT_KINDS)])
+        frame['tkn_in'] = tkn_nms[columns['tkn_in']]
+        frame['tkn_out'] = tkn_nms[columns['tkn_out']]
+        frame.to_parquet(path, index=False)
@@ -0,0 +1 @@
+from .EventRecorder import EventRecorder
\ No newline at end of file
@@ -0,0 +1,108 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import json
+import numpy as np
+from .HistorySink import HISTORY_MAGIC
+from .HistorySink import HISTORY_HEADER
+
+class HistoryReader:
+    
+    """ 
+        Zero-copy reader of a HistorySink file; rows and columns are read-only 
+        np.memmap views, paged in from disk on access
+        
+        Parameters
+        ---------------
+        self.path : str
+            History file path
+        self.columns : tuple
+            Column names
+        self.rows : np.memmap
+            Array of shape (n_rows, n_columns)
+    """     
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, header_size, n_cols, n_rows = HISTORY_HEADER.unpack(f.read(HISTORY_HEADER.size))
+            assert magic == HISTORY_MAGIC, 'HistoryReader: NOT A HISTORY FILE'
+            self.columns = tuple(json.loads(f.read(header_size - HISTORY_HEADER.size)))
+        self._index = {col: k for k, col in enumerate(self.columns)}
+        self.rows = (np.memmap(path, dtype='<f8', mode='r', offset=header_size, shape=(n_rows, n_cols)) 
+                     if n_rows > 0 else np.empty((0, n_cols)))
+        
+    def __len__(self):
+        return len(self.rows)
+        
+    def __getitem__(self, col):
+        
+        """ __getitem__
+
+            Column view by name
+                
+            Parameters
+            -----------------
+            col : str
+                Column name, eg 'reserve_DAI'
+                
+            Returns
+            -----------------
+            col : np.ndarray
+                Strided view of length n_rows                
+        """          
+        
+        return self.rows[:, self._index[col]]
+    
+    def select(self, prefix):
+        
+        """ select
+
+            Block of columns sharing a prefix, eg 'reserve_', 'price_' or 'fee_'
+                
+            Parameters
+            -----------------
+            prefix : str
+                Column name prefix
+                
+            Returns
+            -----------------
+            out : tuple
+                (names, view of shape (n_rows, n_selected)); a view as the 
+                columns of a prefix are contiguous
+        """          
+        
+        ks = [k for k, col in enumerate(self.columns) if col.startswith(prefix)]
+        if not ks:
+            return (), self.rows[:, 0:0]
+        return tuple(self.columns[k] for k in ks), self.rows[:, ks[0]:ks[-1]+1]
+    
+    def to_structured(self):
+        
+        """ to_structured
+
+            Rows viewed as a structured array with one float64 field per column (no copy)
+                
+            Returns
+            -----------------
+            rows : np.ndarray
+                Structured array of length n_rows                
+        """          
+        
+        dtype = np.dtype([(col, '<f8') for col in self.columns])
+        return self.rows.view(dtype).reshape(len(self.rows))
@@ -0,0 +1,129 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import os
+import json
+import struct
+import numpy as np
+
+HISTORY_MAGIC = b'BALHIST1'
+HISTORY_HEADER = struct.Struct('<8sIIQ')
+HISTORY_ALIGN = 64
+
+class HistorySink:
+    
+    """ 
+        Stream per-step state of a BalancerExchange into a memory-mapped file of 
+        fixed-width float64 rows, for backtests whose history does not fit in RAM
+        
+        File layout: a header (magic, header size, column count, row count, then the 
+        column names as JSON, padded to a multiple of 64 bytes) followed by row-major 
+        little-endian float64 rows. Columns are step, reserve_<tkn> per vault token, 
+        pool_shares, price_<tkn> per token other than the first (get_price, 
+        denominated in the first token) and fee_<tkn> per token (accumulated tkn_fees). 
+        The file grows by doubling; the row count in the header is updated on flush 
+        and close. Read back with HistoryReader
+        
+        Parameters
+        ---------------
+        self.path : str
+            Output file path
+        self.lp : BalancerExchange
+            Exchange being recorded
+        self.columns : tuple
+            Column names
+        self.size : int
+            Number of rows written
+    """     
+    
+    def __init__(self, path, lp, capacity = 65536):
+        self.path = path
+        self.lp = lp
+        tkn_nms = lp.state.tkn_nms
+        self.columns = (('step',) + tuple(f'reserve_{tkn_nm}' for tkn_nm in tkn_nms) + ('pool_shares',) + 
+                        tuple(f'price_{tkn_nm}' for tkn_nm in tkn_nms[1:]) + tuple(f'fee_{tkn_nm}' for tkn_nm in tkn_nms))
+        names = json.dumps(self.columns).encode()
+        self.header_size = -(-(HISTORY_HEADER.size + len(names)) // HISTORY_ALIGN) * HISTORY_ALIGN
+        self.size = 0
+        
+        with open(path, 'wb') as f:
+            f.write(HISTORY_HEADER.pack(HISTORY_MAGIC, self.header_size, len(self.columns), 0))
+            f.write(names.ljust(self.header_size - HISTORY_HEADER.size, b' '))
+        self._map(max(1, capacity))
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+        
+    def _map(self, capacity):
+        row_bytes = 8*len(self.columns)
+        with open(self.path, 'r+b') as f:
+            f.truncate(self.header_size + capacity*row_bytes)
+        self.capacity = capacity
+        self._rows = np.memmap(self.path, dtype='<f8', mode='r+', offset=self.header_size, 
+                               shape=(capacity, len(self.columns)))
+        self._buf = self._rows.view(np.ndarray)
+        
+    def record(self, step = None):
+        
+        """ record
+
+            Append the current pool state as one row
+                
+            Parameters
+            -----------------
+            step : float
+                Step stamp (default row number)
+        """          
+        
+        if self.size == self.capacity:
+            self._rows.flush()
+            self._map(2*self.capacity)
+            
+        lp = self.lp
+        tkns = lp.vault.get_tokens()
+        self._buf[self.size] = ([self.size if step is None else step] + lp.state.reserves.tolist() + [lp.pool_shares] + 
+                                [lp.get_price(tkns[0], tkn) for tkn in tkns[1:]] + lp.state.fees.tolist())
+        self.size += 1
+        
+    def flush(self):
+        
+        """ flush
+
+            Write buffered rows to disk and update the header row count
+        """          
+        
+        self._rows.flush()
+        with open(self.path, 'r+b') as f:
+            f.write(HISTORY_HEADER.pack(HISTORY_MAGIC, self.header_size, len(self.columns), self.size))
+            
+    def close(self):
+        
+        """ close
+
+            Flush, release the mapping and trim the file to the rows written
+        """          
+        
+        if self._rows is None:
+            return
+        self.flush()
+        self._rows = self._buf = None
+        with open(self.path, 'r+b') as f:
+            f.truncate(self.header_size + self.size*8*len(self.columns))
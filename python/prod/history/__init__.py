@@ -0,0 +1,2 @@
+from .HistorySink import HistorySink
+from .HistoryReader import HistoryReader
\ No newline at end of file
@@ -17,8 +17,6 @@
 # limitations under the License
 
 from ...enums import Proc 
-from uniswappy import TokenDeltaModel
-from uniswappy import EventSelectionModel
 
 class AddLiquidity():
      
@@ -31,10 +29,14 @@ class AddLiquidity():
         ev : EventSelectionModel
             EventSelectionModel object to randomly generate buy vs sell events
         tDel : TokenDeltaModel
-            TokenDeltaModel to randomly generate token amounts        
+            TokenDeltaModel to randomly generate token amounts     
+            
+        uniswappy is imported on first instantiation rather than at module import   
     """     
 
     def __init__(self, kind = None, init_price = None, ev = None, tDel = None):
+        from uniswappy import TokenDeltaModel
+        from uniswappy import EventSelectionModel
         self.kind = Proc.ADDTKN if kind == None else kind
         self.ev = EventSelectionModel() if ev  == None else ev
         self.tDel = TokenDeltaModel(50) if tDel == None else tDel
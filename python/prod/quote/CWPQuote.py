@@ -16,12 +16,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
-from decimal import Decimal
-from ..cwpt.exchg.BalancerMath import BalancerMath 
 from ..constants.balancer_constants import EXIT_FEE
 from ..constants.balancer_constants import MAX_OUT_RATIO
-
-SWAP_FEE = 0.0025
+from ..cwpt.exchg import BalancerMathArray
+import numpy as np
 
 class CWPQuote():
     
@@ -51,20 +49,20 @@ class CWPQuote():
         """            
         
         assert lp.vault.get_token(tkn.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        tkn = lp.vault.get_token(tkn.token_name)
 
         if(amount_shares_in > 0):
-            total_weight = lp.vault.get_total_denorm_weight()
-            tkn_denorm_wts = lp.vault.get_denorm_weights()
+            tkn_weight, total_weight, swap_fee = lp.get_token_constants(tkn)
             
-            exit_swap = BalancerMath.calc_single_out_given_pool_in(
-                token_balance_out=Decimal(tkn.token_total),
-                token_weight_out=Decimal(tkn_denorm_wts[tkn.token_name]),
-                pool_supply=Decimal(lp.pool_shares),
-                total_weight=Decimal(total_weight),
-                pool_amount_in=Decimal(amount_shares_in),
-                swap_fee=Decimal(SWAP_FEE))   
+            exit_swap = lp.math.calc_single_out_given_pool_in(
+                token_balance_out=lp.math.to_num(tkn.token_total),
+                token_weight_out=tkn_weight,
+                pool_supply=lp.math.to_num(lp.pool_shares),
+                total_weight=total_weight,
+                pool_amount_in=lp.math.to_num(amount_shares_in),
+                swap_fee=swap_fee)   
             
-            amt_out = float(exit_swap.result)
+            amt_out = lp.math.to_float(exit_swap.result)
         else:
             amt_out = 0
             
@@ -92,23 +90,122 @@ class CWPQuote():
         """          
         
         assert lp.vault.get_token(tkn.token_name), 'Balancer V1: TOKEN NOT PART OF GROUP'
+        tkn = lp.vault.get_token(tkn.token_name)
         
         if(amount_in > 0):
-            total_weight = lp.vault.get_total_denorm_weight()
-            tkn_denorm_wts = lp.vault.get_denorm_weights()
+            tkn_weight, total_weight, swap_fee = lp.get_token_constants(tkn)
             
-            exit_swap = BalancerMath.calc_pool_in_given_single_out(
-                    token_balance_out=Decimal(tkn.token_total),
-                    token_weight_out=Decimal(tkn_denorm_wts[tkn.token_name]),
-                    pool_supply=Decimal(lp.pool_shares),
-                    total_weight=Decimal(total_weight),
-                    token_amount_out=Decimal(amount_in),
-                    swap_fee=Decimal(SWAP_FEE))
+            exit_swap = lp.math.calc_pool_in_given_single_out(
+                    token_balance_out=lp.math.to_num(tkn.token_total),
+                    token_weight_out=tkn_weight,
+                    pool_supply=lp.math.to_num(lp.pool_shares),
+                    total_weight=total_weight,
+                    token_amount_out=lp.math.to_num(amount_in),
+                    swap_fee=swap_fee)
             
-            lp_amt = float(exit_swap.result)
+            lp_amt = lp.math.to_float(exit_swap.result)
         else:
             lp_amt = 0
-        return lp_amt   
-             
+        return lp_amt
     
-    
\ No newline at end of file
+    def _pool_arrays(self, lp, tkns):
+        
+        """ _pool_arrays
+
+            One float snapshot of the pool state used by the batch quotes
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            tkns: list
+                Tokens from CWPT set (None for every vault token)
+
+            Returns
+            -----------------
+            out: tuple
+                (balances, weights, total_weight, pool_supply, swap_fee); balances 
+                and weights are arrays in tkns order
+        """            
+        
+        tkn_nms = lp.vault.get_names_view() if tkns is None else [tkn.token_name for tkn in tkns]
+        balances = lp.vault.get_balances_view()
+        tkn_denorm_wts = lp.vault.get_denorm_weights()
+        for tkn_nm in tkn_nms:
+            assert tkn_nm in balances, 'Balancer V1: TOKEN NOT PART OF GROUP'
+        return (np.array([balances[tkn_nm] for tkn_nm in tkn_nms], dtype=np.float64),
+                np.array([tkn_denorm_wts[tkn_nm] for tkn_nm in tkn_nms], dtype=np.float64),
+                float(lp.vault.get_total_denorm_weight()), float(lp.pool_shares), float(lp.swap_fee))
+    
+    def get_amounts_from_shares(self, lp, amounts_shares_in, tkns = None):
+        
+        """ get_amounts_from_shares
+
+            Batch version of get_amount_from_shares; redeemable amount of each token 
+            for each share amount, from one snapshot of the pool (float math, see 
+            BalancerMathArray)
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            amounts_shares_in: array_like
+                Amounts of input shares, shape (n,)
+            tkns: list
+                Tokens from CWPT set, m of them (default every vault token, in vault order)
+
+            Returns
+            -----------------
+            amts_out: np.ndarray
+                Matrix of shape (n, m) of token amounts (0 where shares <= 0)
+        """            
+        
+        balances, weights, total_weight, pool_supply, swap_fee = self._pool_arrays(lp, tkns)
+        shares = np.asarray(amounts_shares_in, dtype=np.float64).reshape(-1, 1)
+        
+        exit_swap = BalancerMathArray.calc_single_out_given_pool_in(
+            token_balance_out=balances,
+            token_weight_out=weights,
+            pool_supply=pool_supply,
+            total_weight=total_weight,
+            pool_amount_in=np.maximum(shares, 0.0),
+            swap_fee=swap_fee)
+        
+        return np.where(shares > 0, exit_swap.result, 0.0)
+    
+    def get_shares_from_amounts(self, lp, amounts_in, tkns = None):
+        
+        """ get_shares_from_amounts
+
+            Batch version of get_shares_from_amount; pool shares needed to withdraw 
+            each amount of each token, from one snapshot of the pool (float math, see 
+            BalancerMathArray)
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            amounts_in: array_like
+                Token amounts, shape (n,) (same amount for every token) or (n, m)
+            tkns: list
+                Tokens from CWPT set, m of them (default every vault token, in vault order)
+
+            Returns
+            -----------------
+            lp_amts: np.ndarray
+                Matrix of shape (n, m) of pool shares (0 where amount <= 0)
+        """            
+        
+        balances, weights, total_weight, pool_supply, swap_fee = self._pool_arrays(lp, tkns)
+        amounts = np.asarray(amounts_in, dtype=np.float64)
+        amounts = amounts.reshape(-1, 1) if amounts.ndim < 2 else amounts
+        
+        exit_swap = BalancerMathArray.calc_pool_in_given_single_out(
+            token_balance_out=balances,
+            token_weight_out=weights,
+            pool_supply=pool_supply,
+            total_weight=total_weight,
+            token_amount_out=np.maximum(amounts, 0.0),
+            swap_fee=swap_fee)
+        
+        return np.broadcast_to(np.where(amounts > 0, exit_swap.result, 0.0), (len(amounts), len(balances))).copy()
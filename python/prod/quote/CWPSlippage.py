@@ -0,0 +1,257 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from ..constants.balancer_constants import MAX_IN_RATIO
+from ..constants.balancer_constants import MAX_OUT_RATIO
+from ..cwpt.exchg import BalancerMathArray
+import numpy as np
+
+class CWPSlippage():
+    
+    """ 
+        Constant weighted product liquidity pool slippage, in closed form and vectorized
+        
+        For a trade of aI = x * bI with r = wI / wO and g = 1 - sF, the pool moves to 
+        bI' = bI * ( 1 + x ) and bO' = bO * ( 1 + g * x )^-r, so the spot price changes by
+        
+            sP' / sP = ( 1 + x ) * ( 1 + g * x )^r
+        
+        Without fee the trade for a price impact s is x = ( 1 + s )^( 1 / ( 1 + r ) ) - 1; 
+        with fee there is no closed form and Newton's method is run on the log of the 
+        ratio, starting from the fee-less solution. Trades are capped by MAX_IN_RATIO 
+        and MAX_OUT_RATIO
+    """       
+    
+    @staticmethod
+    def calc_price_after(token_amount_in, token_balance_in, token_weight_in, token_balance_out, token_weight_out, swap_fee):
+        
+        """ calc_price_after
+
+            Spot price of the output token (in units of the input token) after a 
+            trade of token_amount_in (vectorized)
+                
+            Parameters
+            -----------------
+            token_amount_in : array_like
+                Amount of input token
+            token_balance_in : array_like
+                Balance of input token
+            token_weight_in : array_like
+                Weight of input token
+            token_balance_out : array_like
+                Balance of output token
+            token_weight_out : array_like
+                Weight of output token
+            swap_fee : float
+                Swap fee
+
+            Returns
+            -----------------
+            price : ndarray
+                Spot price after the trade
+        """            
+        
+        token_amount_in = np.asarray(token_amount_in, dtype=np.float64)
+        weight_ratio = token_weight_in / token_weight_out
+        log_out = -weight_ratio * np.log1p(token_amount_in * (1.0 - swap_fee) / token_balance_in)
+        balance_out = token_balance_out * np.exp(log_out)
+        return ((token_balance_in + token_amount_in) / token_weight_in) / (balance_out / token_weight_out) / (1.0 - swap_fee)
+    
+    @staticmethod
+    def calc_max_in(slippage, token_balance_in, token_weight_in, token_balance_out, token_weight_out, swap_fee, 
+                    tol = 1e-14, max_iter = 50):
+        
+        """ calc_max_in
+
+            Largest amount of input token whose trade moves the spot price by at most 
+            slippage, capped by MAX_IN_RATIO and MAX_OUT_RATIO (vectorized)
+                
+            Parameters
+            -----------------
+            slippage : array_like
+                Price impact bound, as a fraction (ie, 0.01 for 1%)
+            token_balance_in : array_like
+                Balance of input token
+            token_weight_in : array_like
+                Weight of input token
+            token_balance_out : array_like
+                Balance of output token
+            token_weight_out : array_like
+                Weight of output token
+            swap_fee : float
+                Swap fee
+            tol : float
+                Relative Newton step tolerance
+            max_iter : int
+                Maximum Newton iterations
+
+            Returns
+            -----------------
+            token_amount_in : ndarray
+                Maximum amount of input token
+        """            
+        
+        weight_ratio = np.asarray(token_weight_in / token_weight_out, dtype=np.float64)
+        gamma = 1.0 - swap_fee
+        
+        # the ratio caps bound the price impact too, so an unbounded slippage maps onto them
+        x_max = np.minimum(float(MAX_IN_RATIO), np.expm1(-np.log1p(-float(MAX_OUT_RATIO)) / weight_ratio) / gamma)
+        target_max = np.log1p(x_max) + weight_ratio * np.log1p(gamma * x_max)
+        target = np.minimum(np.log1p(np.asarray(slippage, dtype=np.float64)), target_max)
+        
+        # Newton from the left converges monotonically: log ratio is increasing and concave in x
+        x = np.expm1(target / (1.0 + weight_ratio))
+        if swap_fee > 0:
+            for _ in range(max_iter):
+                g = np.log1p(x) + weight_ratio * np.log1p(gamma * x) - target
+                dg = 1.0 / (1.0 + x) + weight_ratio * gamma / (1.0 + gamma * x)
+                step = g / dg
+                x = x - step
+                if np.all(np.abs(step) <= tol * np.abs(x)):
+                    break
+        
+        return token_balance_in * np.clip(x, 0.0, x_max)
+    
+    def _pair_arrays(self, lp, tkn_in, tkn_out):
+        
+        """ _pair_arrays
+
+            Float snapshot of a token pair used by the slippage quotes
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            tkn_in: ERC20
+                Input token 
+            tkn_out: ERC20
+                Output token
+
+            Returns
+            -----------------
+            out: tuple
+                (token_balance_in, token_weight_in, token_balance_out, token_weight_out, swap_fee)
+        """            
+        
+        balances = lp.vault.get_balances_view()
+        tkn_denorm_wts = lp.vault.get_denorm_weights()
+        assert tkn_in.token_name in balances and tkn_out.token_name in balances, 'Balancer V1: TOKEN NOT PART OF GROUP'
+        return (float(balances[tkn_in.token_name]), float(tkn_denorm_wts[tkn_in.token_name]), 
+                float(balances[tkn_out.token_name]), float(tkn_denorm_wts[tkn_out.token_name]), float(lp.swap_fee))
+    
+    def get_price_after(self, lp, amount_in, tkn_in, tkn_out):
+        
+        """ get_price_after
+
+            Spot price of tkn_out (in units of tkn_in) after swapping amount_in of tkn_in
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            amount_in: array_like
+                Amount(s) of input token
+            tkn_in: ERC20
+                Input token 
+            tkn_out: ERC20
+                Output token
+
+            Returns
+            -----------------
+            price: ndarray
+                Spot price after each trade
+        """            
+        
+        return self.calc_price_after(amount_in, *self._pair_arrays(lp, tkn_in, tkn_out))
+    
+    def get_max_trade(self, lp, slippage, tkn_in, tkn_out):
+        
+        """ get_max_trade
+
+            Largest swap of tkn_in into tkn_out that keeps the price impact within slippage
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            slippage: array_like
+                Price impact bound(s), as a fraction (ie, 0.01 for 1%)
+            tkn_in: ERC20
+                Input token 
+            tkn_out: ERC20
+                Output token
+
+            Returns
+            -----------------
+            out: dict
+                tkn_in_amt, tkn_out_amt, price_after and slippage (the impact reached, 
+                below the bound when a ratio cap binds)
+        """            
+        
+        bal_in, wt_in, bal_out, wt_out, swap_fee = self._pair_arrays(lp, tkn_in, tkn_out)
+        amt_in = self.calc_max_in(slippage, bal_in, wt_in, bal_out, wt_out, swap_fee)
+        return self._trade_arrays(amt_in, bal_in, wt_in, bal_out, wt_out, swap_fee)
+    
+    def get_slippage_curve(self, lp, tkn_in, tkn_out, n_points = 100, max_slippage = None):
+        
+        """ get_slippage_curve
+
+            Sample price impact and effective price over trade sizes, from zero up to the 
+            largest trade allowed by MAX_IN_RATIO/MAX_OUT_RATIO (or by max_slippage)
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP    
+            tkn_in: ERC20
+                Input token 
+            tkn_out: ERC20
+                Output token
+            n_points: int
+                Number of trade sizes
+            max_slippage: float
+                Price impact of the largest sampled trade (default the ratio caps)
+
+            Returns
+            -----------------
+            out: dict
+                tkn_in_amt, tkn_out_amt, price_after, slippage and effective_price 
+                arrays of length n_points
+        """            
+        
+        bal_in, wt_in, bal_out, wt_out, swap_fee = self._pair_arrays(lp, tkn_in, tkn_out)
+        max_in = self.calc_max_in(np.inf if max_slippage is None else max_slippage, bal_in, wt_in, bal_out, wt_out, swap_fee)
+        out = self._trade_arrays(np.linspace(0.0, float(max_in), n_points), bal_in, wt_in, bal_out, wt_out, swap_fee)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spot = BalancerMathArray.calc_spot_price(bal_in, wt_in, bal_out, wt_out, swap_fee)
+            out['effective_price'] = np.where(out['tkn_out_amt'] > 0, out['tkn_in_amt'] / out['tkn_out_amt'], spot)
+        return out
+    
+    def _trade_arrays(self, amt_in, bal_in, wt_in, bal_out, wt_out, swap_fee):
+        
+        """ _trade_arrays
+
+            Output amount, price after and price impact of input trades (vectorized)
+        """            
+        
+        amt_in = np.asarray(amt_in, dtype=np.float64)
+        swap = BalancerMathArray.calc_out_given_in(amt_in, bal_in, wt_in, bal_out, wt_out, swap_fee)
+        spot = BalancerMathArray.calc_spot_price(bal_in, wt_in, bal_out, wt_out, swap_fee)
+        price_after = self.calc_price_after(amt_in, bal_in, wt_in, bal_out, wt_out, swap_fee)
+        return {'tkn_in_amt': amt_in, 'tkn_out_amt': swap.result, 'price_after': price_after, 
+                'slippage': price_after / spot - 1.0}
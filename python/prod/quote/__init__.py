@@ -1 +1,2 @@
-from .CWPQuote import CWPQuote
\ No newline at end of file
+from .CWPQuote import CWPQuote
+from .CWPSlippage import CWPSlippage
\ No newline at end of file
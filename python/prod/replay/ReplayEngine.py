@@ -0,0 +1,268 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import os
+import json
+import time
+import pickle
+
+LOG_SWAP = 'LOG_SWAP'
+LOG_JOIN = 'LOG_JOIN'
+LOG_EXIT = 'LOG_EXIT'
+EVENT_FIELDS = ('event', 'caller', 'token_in', 'token_out', 'amount_in', 'amount_out')
+
+class ReplayEngine:
+    
+    """ 
+        Rebuild pool state by replaying recorded Balancer V1 events into a BalancerExchange
+        
+        Events are streamed from a CSV (header event,caller,token_in,token_out,amount_in,
+        amount_out; blank fields for unused values) or JSON-lines file, one line at a time, 
+        so memory stays constant. They map onto the exchange as
+        
+            LOG_SWAP -> swap_exact_amount_in(amount_in, token_in, token_out, caller)
+            LOG_JOIN -> join_swap_extern_amount_in(amount_in, token_in, caller)
+            LOG_EXIT -> exit_swap_extern_amount_out(amount_out, token_out, caller)
+        
+        Every checkpoint_every events, the event count, the file offset and a pool 
+        snapshot (see BalancerExchange.snapshot) are pickled to checkpoint_path; 
+        run(..., resume = True) restores that snapshot and seeks past the replayed 
+        events. Each event runs in a transaction, so with on_error = 'skip' a failing 
+        event (including a malformed line or an unknown token) is rolled back, 
+        counted and skipped
+        
+        Parameters
+        ---------------
+        self.lp : BalancerExchange
+            Exchange being rebuilt (tokens named as in the event file)
+        self.checkpoint_path : str
+            Checkpoint file (None disables checkpoints)
+        self.checkpoint_every : int
+            Events between checkpoints
+        self.on_error : str
+            'raise' or 'skip'
+    """     
+    
+    def __init__(self, lp, checkpoint_path = None, checkpoint_every = 100000, on_error = 'raise'):
+        assert on_error in ('raise', 'skip'), 'ReplayEngine: UNKNOWN ERROR POLICY'
+        assert checkpoint_every >= 1, 'ReplayEngine: INVALID CHECKPOINT INTERVAL'
+        self.lp = lp
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.on_error = on_error
+        
+    @staticmethod
+    def read_lines(path, offset = 0):
+        
+        """ read_lines
+
+            Lazily read the non-empty, non-header lines of an event file from a byte offset
+                
+            Parameters
+            -----------------
+            path : str
+                CSV or JSON-lines event file
+            offset : int
+                Byte offset to start reading from
+                
+            Returns
+            -----------------
+            lines : generator
+                (offset after the line, line bytes)                
+        """          
+        
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                offset += len(line)
+                line = line.strip()
+                if not line or line.startswith(b'event'):
+                    continue
+                yield offset, line
+                
+    @staticmethod
+    def parse_event(line):
+        
+        """ parse_event
+
+            Parse one CSV or JSON line (raises ValueError/TypeError when malformed)
+                
+            Parameters
+            -----------------
+            line : bytes
+                Event line
+                
+            Returns
+            -----------------
+            event : tuple
+                (event, caller, token_in, token_out, amount_in, amount_out)                
+        """          
+        
+        if line[:1] == b'{':
+            rec = json.loads(line)
+            fields = [rec.get(field) for field in EVENT_FIELDS]
+        else:
+            fields = line.decode().split(',')
+        event, caller, tkn_in_nm, tkn_out_nm, amt_in, amt_out = fields
+        return (event, caller, tkn_in_nm or None, tkn_out_nm or None, 
+                float(amt_in) if amt_in not in ('', None) else None, 
+                float(amt_out) if amt_out not in ('', None) else None)
+    
+    @staticmethod
+    def read_events(path, offset = 0):
+        
+        """ read_events
+
+            Lazily parse an event file from a byte offset
+                
+            Parameters
+            -----------------
+            path : str
+                CSV or JSON-lines event file
+            offset : int
+                Byte offset to start reading from
+                
+            Returns
+            -----------------
+            events : generator
+                (offset after the event, event, caller, token_in, token_out, amount_in, amount_out)                
+        """          
+        
+        for offset, line in ReplayEngine.read_lines(path, offset):
+            yield (offset,) + ReplayEngine.parse_event(line)
+        
+    def apply(self, event, caller, tkn_in_nm, tkn_out_nm, amt_in, amt_out):
+        
+        """ apply
+
+            Apply one event to the exchange
+                
+            Parameters
+            -----------------
+            event : str
+                LOG_SWAP, LOG_JOIN or LOG_EXIT
+            caller : str
+                User name/address
+            tkn_in_nm : str
+                Name of token into the pool
+            tkn_out_nm : str
+                Name of token out of the pool
+            amt_in : float
+                Token amount into the pool
+            amt_out : float
+                Token amount out of the pool
+        """          
+        
+        lp = self.lp
+        if event == LOG_SWAP:
+            lp.swap_exact_amount_in(amt_in, lp.vault.get_token(tkn_in_nm), lp.vault.get_token(tkn_out_nm), caller)
+        elif event == LOG_JOIN:
+            lp.join_swap_extern_amount_in(amt_in, lp.vault.get_token(tkn_in_nm), caller)
+        elif event == LOG_EXIT:
+            lp.exit_swap_extern_amount_out(amt_out, lp.vault.get_token(tkn_out_nm), caller)
+        else:
+            raise ValueError(f'ReplayEngine: UNKNOWN EVENT {event}')
+        
+    def save_checkpoint(self, n_events, offset):
+        
+        """ save_checkpoint
+
+            Atomically write event count, file offset and pool snapshot
+                
+            Parameters
+            -----------------
+            n_events : int
+                Events replayed so far
+            offset : int
+                Byte offset of the next event
+        """          
+        
+        tmp_path = f'{self.checkpoint_path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'n_events': n_events, 'offset': offset, 'snapshot': self.lp.snapshot()}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.checkpoint_path)
+        
+    def load_checkpoint(self):
+        
+        """ load_checkpoint
+
+            Restore the pool from the last checkpoint
+                
+            Returns
+            -----------------
+            out : tuple
+                (n_events, offset); (0, 0) when there is no checkpoint                
+        """          
+        
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return 0, 0
+        with open(self.checkpoint_path, 'rb') as f:
+            checkpoint = pickle.load(f)
+        self.lp.restore(checkpoint['snapshot'])
+        return checkpoint['n_events'], checkpoint['offset']
+        
+    def run(self, path, resume = False, max_events = None):
+        
+        """ run
+
+            Replay an event file (or what is left of it after the last checkpoint)
+                
+            Parameters
+            -----------------
+            path : str
+                CSV or JSON-lines event file
+            resume : bool
+                Continue from the last checkpoint
+            max_events : int
+                Stop after this many events in this run (default all)
+                
+            Returns
+            -----------------
+            out : dict
+                events (total replayed, including before resume), replayed (this run), 
+                skipped, elapsed (seconds) and events_per_sec                
+        """          
+        
+        n_events, offset = self.load_checkpoint() if resume else (0, 0)
+        replayed = skipped = 0
+        skip = self.on_error == 'skip'
+        every = self.checkpoint_every if self.checkpoint_path is not None else 0
+        
+        start = time.perf_counter()
+        for offset, line in self.read_lines(path, offset):
+            if skip:
+                try:
+                    with self.lp.transaction():
+                        self.apply(*self.parse_event(line))
+                except (AssertionError, ArithmeticError, LookupError, TypeError, ValueError):
+                    skipped += 1
+            else:
+                self.apply(*self.parse_event(line))
+            n_events += 1
+            replayed += 1
+            if every and n_events % every == 0:
+                self.save_checkpoint(n_events, offset)
+            if replayed == max_events:
+                break
+        elapsed = time.perf_counter() - start
+        
+        if every:
+            self.save_checkpoint(n_events, offset)
+        
+        return {'events': n_events, 'replayed': replayed, 'skipped': skipped, 'elapsed': elapsed, 
+                'events_per_sec': replayed / elapsed if elapsed > 0 else float('inf')}
@@ -0,0 +1 @@
+from .ReplayEngine import ReplayEngine
\ No newline at end of file
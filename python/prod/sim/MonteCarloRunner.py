@@ -0,0 +1,154 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from ..erc import ERC20
+from ..vault import BalancerVault
+from ..cwpt.factory import BalancerFactory
+from ..process.join import Join
+from ..utils.data import BalancerExchangeData
+from ..utils.data import BalancerPoolData
+
+class MonteCarloRunner:
+    
+    """ 
+        Run independent BalancerExchange scenarios in parallel across worker processes
+        
+        Workers only receive the pool spec (a few names and floats) and rebuild a 
+        fresh pool for every run; run i is driven by np.random.default_rng seeded 
+        with child i of SeedSequence(seed).spawn(n_runs), so results do not depend 
+        on n_workers or chunk_size
+        
+        Parameters
+        ---------------
+        self.pool_data : BalancerPoolData
+            Pool spec (vault tokens, weights and initial join)
+        self.scenario : function
+            scenario(lp, rng) -> float or array_like; must be picklable (module level)
+        self.n_workers : int
+            Worker processes; 0 or 1 runs in-process (default os.cpu_count())
+        self.chunk_size : int
+            Runs per task sent to a worker (default spreads n_runs ~4 tasks per worker)
+    """       
+    
+    def __init__(self, pool_data: BalancerPoolData, scenario, n_workers = None, chunk_size = None):
+        self.pool_data = pool_data
+        self.scenario = scenario
+        self.n_workers = os.cpu_count() if n_workers is None else n_workers
+        self.chunk_size = chunk_size
+        
+    @staticmethod
+    def build_pool(pool_data: BalancerPoolData):
+        
+        """ build_pool
+
+            Deploy and join a fresh pool from a pool spec
+                
+            Parameters
+            -----------------
+            pool_data : BalancerPoolData
+                Pool spec
+                
+            Returns
+            -----------------
+            lp : BalancerExchange
+                Joined exchange                    
+        """          
+        
+        vault = BalancerVault()
+        for tkn_nm, tkn_amt, tkn_wt in zip(pool_data.tkn_nms, pool_data.tkn_amts, pool_data.tkn_wts):
+            tkn = ERC20(tkn_nm, pool_data.address)
+            tkn.deposit(None, tkn_amt)
+            vault.add_token(tkn, tkn_wt)
+            
+        factory = BalancerFactory(f"{pool_data.symbol} factory", pool_data.address)
+        exchg_data = BalancerExchangeData(vault = vault, symbol = pool_data.symbol, address = pool_data.address, 
+                                          math_mode = pool_data.math_mode, validation = pool_data.validation, 
+                                          swap_fee = pool_data.swap_fee)
+        lp = factory.deploy(exchg_data)
+        Join().apply(lp, pool_data.user_nm, pool_data.init_shares)
+        return lp
+    
+    @staticmethod
+    def run_chunk(pool_data, scenario, seed_seqs):
+        
+        """ run_chunk
+
+            Run one scenario per seed, each on a fresh pool (worker entry point)
+                
+            Parameters
+            -----------------
+            pool_data : BalancerPoolData
+                Pool spec
+            scenario : function
+                scenario(lp, rng) -> float or array_like
+            seed_seqs : list
+                np.random.SeedSequence per run
+                
+            Returns
+            -----------------
+            results : np.ndarray
+                Stacked scenario outputs, one row per run                    
+        """          
+        
+        results = [np.asarray(scenario(MonteCarloRunner.build_pool(pool_data), np.random.default_rng(seed_seq)), dtype=np.float64) 
+                   for seed_seq in seed_seqs]
+        return np.stack(results)
+        
+    def run(self, n_runs, seed = None):
+        
+        """ run
+
+            Run n_runs independent scenarios
+                
+            Parameters
+            -----------------
+            n_runs : int
+                Number of runs
+            seed : int
+                Root seed (None draws fresh entropy; the used entropy is returned)
+                
+            Returns
+            -----------------
+            out : dict
+                results (np.ndarray, one row per run in run order), entropy, 
+                elapsed (seconds) and runs_per_sec                    
+        """          
+        
+        assert n_runs > 0, 'MonteCarloRunner: NO RUNS'
+        
+        root = np.random.SeedSequence(seed)
+        seed_seqs = root.spawn(n_runs)
+        
+        start = time.perf_counter()
+        if self.n_workers <= 1:
+            results = self.run_chunk(self.pool_data, self.scenario, seed_seqs)
+        else:
+            chunk_size = self.chunk_size or max(1, -(-n_runs // (4 * self.n_workers)))
+            chunks = [seed_seqs[k:k + chunk_size] for k in range(0, n_runs, chunk_size)]
+            with ProcessPoolExecutor(max_workers = min(self.n_workers, len(chunks))) as executor:
+                parts = executor.map(self.run_chunk, [self.pool_data] * len(chunks), 
+                                     [self.scenario] * len(chunks), chunks)
+                results = np.concatenate(list(parts))
+        elapsed = time.perf_counter() - start
+        
+        return {'results': results, 'entropy': root.entropy, 'elapsed': elapsed, 
+                'runs_per_sec': n_runs / elapsed if elapsed > 0 else float('inf')}
@@ -0,0 +1 @@
+from .MonteCarloRunner import MonteCarloRunner
\ No newline at end of file
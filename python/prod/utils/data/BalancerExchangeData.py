@@ -22,4 +22,7 @@ from ...vault import BalancerVault
 
 @dataclass
 class BalancerExchangeData(ExchangeData):
-    vault: BalancerVault
\ No newline at end of file
+    vault: BalancerVault
+    math_mode: str = None
+    validation: str = None
+    swap_fee: float = None
\ No newline at end of file
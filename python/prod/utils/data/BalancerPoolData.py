@@ -0,0 +1,31 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+from dataclasses import dataclass
+
+@dataclass
+class BalancerPoolData:
+    tkn_nms: tuple
+    tkn_amts: tuple
+    tkn_wts: tuple
+    init_shares: float
+    user_nm: str = 'user'
+    symbol: str = 'LP'
+    address: str = '0x0'
+    math_mode: str = None
+    validation: str = None
+    swap_fee: float = None
@@ -1,3 +1,4 @@
 from .ExchangeData import ExchangeData
 from .FactoryData import FactoryData
-from .BalancerExchangeData import BalancerExchangeData
\ No newline at end of file
+from .BalancerExchangeData import BalancerExchangeData
+from .BalancerPoolData import BalancerPoolData
\ No newline at end of file
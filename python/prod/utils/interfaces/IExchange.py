@@ -20,6 +20,8 @@ from abc import *
 
 class IExchange(ABC):
     
+    __slots__ = ()
+    
     @abstractmethod        
     def summary(self, agents):
         pass
@@ -0,0 +1,114 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+
+class CWPValuation():
+    
+    """ 
+        Constant weighted product liquidity pool mark-to-market valuation over 
+        price paths, evaluated for all steps in one pass
+        
+        With normalized weights w_i, invariant V = prod_i( B_i^w_i ) and external 
+        prices p_i (in a common numeraire), the arbitrage-free reserves are
+        
+            B_i = ( w_i / p_i ) * L,   L = V * prod_j( ( p_j / w_j )^w_j )
+        
+        where L is the pool value. Impermanent loss compares the LP position against 
+        holding the reserves it started from; fee income is either swap_fee times a 
+        given traded volume, or swap_fee times the value of the tokens arbitrageurs 
+        put in to move the pool between consecutive equilibria
+    """       
+    
+    @staticmethod
+    def calc_equilibrium_reserves(prices, token_weights, log_invariant):
+        
+        """ calc_equilibrium_reserves
+
+            Arbitrage-free reserves of a weighted pool at given prices (vectorized)
+                
+            Parameters
+            -----------------
+            prices : array_like
+                Token prices, shape (..., n)
+            token_weights : array_like
+                Normalized token weights, shape (n,)
+            log_invariant : float
+                log of V = prod_i( B_i^w_i )
+
+            Returns
+            -----------------
+            out : tuple
+                (reserves of shape (..., n), pool value of shape (...))
+        """            
+        
+        log_prices = np.log(prices)
+        log_wts = np.log(token_weights)
+        log_value = log_invariant + np.sum(token_weights * (log_prices - log_wts), axis=-1)
+        reserves = np.exp(log_wts - log_prices + log_value[..., None])
+        return reserves, np.exp(log_value)
+    
+    def value(self, lp, prices, shares = None, volumes = None):
+        
+        """ value
+
+            Mark an LP position to market along a price path
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP (current reserves are the starting point)
+            prices : array_like
+                Price of every vault token (vault order) per step, shape (T, n), or 
+                (P, T, n) for P paths
+            shares : float
+                Pool shares of the position (default all pool shares)
+            volumes : array_like
+                Traded volume in the numeraire per step, shape (T,) or (P, T); 
+                default uses arbitrage flows between steps
+
+            Returns
+            -----------------
+            out : dict
+                reserves (..., T, n), pool_value, lp_value, hold_value, 
+                impermanent_loss (lp_value / hold_value - 1), fee_income and 
+                cum_fee_income (each ..., T)
+        """            
+        
+        assert lp.pool_shares > 0, 'Balancer V1: POOL NOT JOINED'
+        
+        tkn_nms = lp.vault.get_names_view()
+        norm_wts = lp.vault.get_norm_weights()
+        balances = lp.vault.get_balances_view()
+        wts = np.array([norm_wts[tkn_nm] for tkn_nm in tkn_nms], dtype=np.float64)
+        start = np.array([balances[tkn_nm] for tkn_nm in tkn_nms], dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        assert prices.shape[-1] == len(tkn_nms), 'Balancer V1: ONE PRICE PER VAULT TOKEN'
+        
+        fraction = 1.0 if shares is None else shares / lp.pool_shares
+        reserves, pool_value = self.calc_equilibrium_reserves(prices, wts, np.sum(wts * np.log(start)))
+        hold_value = prices @ start
+        
+        if volumes is None:
+            prev = np.concatenate([np.broadcast_to(start, reserves[..., :1, :].shape), reserves[..., :-1, :]], axis=-2)
+            volumes = np.sum(np.maximum(reserves - prev, 0.0) * prices, axis=-1)
+        fee_income = lp.swap_fee * np.asarray(volumes, dtype=np.float64) * fraction
+        
+        return {'reserves': reserves, 'pool_value': pool_value, 'lp_value': pool_value * fraction, 
+                'hold_value': hold_value * fraction, 'impermanent_loss': pool_value / hold_value - 1.0, 
+                'fee_income': fee_income, 'cum_fee_income': np.cumsum(fee_income, axis=-1)}
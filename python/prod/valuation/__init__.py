@@ -0,0 +1 @@
+from .CWPValuation import CWPValuation
\ No newline at end of file
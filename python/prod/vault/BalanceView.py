@@ -0,0 +1,62 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from collections.abc import Mapping
+
+class BalanceView(Mapping):
+    
+    """ 
+        Read-only live view of vault token balances referenced by token name; 
+        lookups read ERC20.token_total directly, so nothing is rebuilt per call
+        
+        Parameters
+        ---------------
+        self.tkn_dic : dictionary
+            Dictionary of ERC20 tokens referenced by token name (shared with vault)
+    """  
+    
+    __slots__ = ('tkn_dic',)
+    
+    def __init__(self, tkn_dic):
+        self.tkn_dic = tkn_dic
+        
+    def __getitem__(self, tkn_name):
+        return self.tkn_dic[tkn_name].token_total
+    
+    def __iter__(self):
+        return iter(self.tkn_dic)
+    
+    def __len__(self):
+        return len(self.tkn_dic)
+    
+    def __repr__(self):
+        return repr(self.copy())
+    
+    def copy(self):
+        
+        """ copy
+
+            Snapshot of current balances
+                    
+            Returns
+            -----------------
+            tkn_balances : dict
+                Dictionary of token balances
+        """          
+        
+        return {tkn_nm: tkn.token_total for tkn_nm, tkn in self.tkn_dic.items()}
@@ -17,7 +17,12 @@
 # limitations under the License
 
 import numpy as np
+from types import MappingProxyType
 from ..erc import ERC20
+from ..constants.balancer_constants import MIN_WEIGHT
+from ..constants.balancer_constants import MAX_WEIGHT
+from ..constants.balancer_constants import MAX_TOTAL_WEIGHT
+from .BalanceView import BalanceView
 
 class BalancerVault:
     
@@ -33,7 +38,17 @@ class BalancerVault:
         self.tkn_denorm_wts : dictionary
             Dictionary of denormalization weights referenced by token name
         self.tkn_bounds : dictionary
-            Dictionary of booleans (indicating token bound) referenced by token name             
+            Dictionary of booleans (indicating token bound) referenced by token name      
+        self.version : int
+            Counter bumped on every token, weight or bound change          
+        self.shared : bool
+            Weight and bound dictionaries are shared with a fork (copied on next write)
+            
+        Names, total weight and normalized weights are cached and refreshed only in 
+        add_token, set_weight, set_weights and set_bound; weight and bound getters return 
+        read-only views, so weights and bounds must be changed through those methods. 
+        get_names and get_balances return new lists/dicts; get_names_view and 
+        get_balances_view return the cached names and a live balance view without copying       
     """       
   
     def __init__(self) -> None:
@@ -41,6 +56,70 @@ class BalancerVault:
         self.tkn_dic = {}   
         self.tkn_denorm_wts = {}
         self.tkn_bounds = {}
+        self.tkn_nms = ()
+        self.tkn_norm_wts = {}
+        self.total_denorm_wt = 0
+        self.version = 0
+        self.shared = False
+        self._init_views()
+        
+    def _init_views(self):
+        self._dic_view = MappingProxyType(self.tkn_dic)
+        self._balance_view = BalanceView(self.tkn_dic)
+        self._denorm_wts_view = MappingProxyType(self.tkn_denorm_wts)
+        self._norm_wts_view = MappingProxyType(self.tkn_norm_wts)
+        self._bounds_view = MappingProxyType(self.tkn_bounds)
+        
+    def __getstate__(self):
+        return {key: val for key, val in self.__dict__.items() if not key.endswith('_view')}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('shared', False)
+        self._init_views()
+        
+    def fork(self):
+        
+        """ fork
+
+            Copy of the vault holding its own ERC20 balances; weight and bound 
+            dictionaries stay shared with this vault until either side changes them
+                
+            Returns
+            -----------------
+            vault : BalancerVault
+                Forked vault                
+        """          
+        
+        self.shared = True
+        vault = BalancerVault.__new__(BalancerVault)
+        vault.__dict__.update(self.__getstate__())
+        vault.tkns = [self._copy_token(tkn) for tkn in self.tkns]
+        vault.tkn_dic = {tkn.token_name: tkn for tkn in vault.tkns}
+        vault._init_views()
+        return vault
+    
+    @staticmethod
+    def _copy_token(tkn):
+        tkn_copy = ERC20.__new__(type(tkn))
+        for attr in ERC20.__slots__:
+            setattr(tkn_copy, attr, getattr(tkn, attr))
+        if tkn.ledger is not None:
+            tkn_copy.ledger = tkn.ledger.copy()
+        return tkn_copy
+    
+    def _unshare(self):
+        
+        """ _unshare
+
+            Take private copies of the weight and bound dictionaries before a write                     
+        """  
+        
+        self.tkn_denorm_wts = dict(self.tkn_denorm_wts)
+        self.tkn_bounds = dict(self.tkn_bounds)
+        self.tkn_norm_wts = dict(self.tkn_norm_wts)
+        self.shared = False
+        self._init_views()
         
     def add_token(self, tkn: ERC20, weight: float, bound: bool = True):
         
@@ -58,13 +137,122 @@ class BalancerVault:
                 Indicator of whether token is bound to pool                        
         """          
         
+        if self.shared:
+            self._unshare()
         if tkn.token_name not in self.tkn_dic:    
             self.tkns.append(tkn) 
             self.tkn_dic[tkn.token_name] = tkn
             self.tkn_denorm_wts[tkn.token_name] = weight
             self.tkn_bounds[tkn.token_name] = bound
+            self.tkn_nms = self.tkn_nms + (tkn.token_name,)
+            self._update_weights()
         else:
             print('ERROR: token already exists within group')
+            
+    def set_weight(self, tkn_name, weight):
+        
+        """ set_weight
+
+            Change denormalized weight of a token and refresh weight aggregates; the 
+            weight is validated as in set_weights before it is written
+                
+            Parameters
+            -----------------
+            tkn_name : str
+                Token name symbol   
+            weight : float
+                New denormalized weight in pool                       
+        """   
+        
+        self._check_weights({tkn_name: weight}, self.tkn_bounds)
+        
+        if self.shared:
+            self._unshare()
+        self.tkn_denorm_wts[tkn_name] = weight
+        self._update_weights()
+        
+    def set_weights(self, weights):
+        
+        """ set_weights
+
+            Change denormalized weights of several tokens and refresh weight aggregates 
+            once (ie, one version bump per step of a weight schedule); weights are 
+            validated against MIN_WEIGHT, MAX_WEIGHT and MAX_TOTAL_WEIGHT (bound tokens) 
+            before anything is written
+                
+            Parameters
+            -----------------
+            weights : dictionary
+                New denormalized weights referenced by token name                       
+        """   
+        
+        self._check_weights(weights, self.tkn_bounds)
+        
+        if self.shared:
+            self._unshare()
+        self.tkn_denorm_wts.update(weights)
+        self._update_weights()
+        
+    def set_bound(self, tkn_name, bound):
+        
+        """ set_bound
+
+            Bind or unbind a token and refresh weight aggregates; a bound token's 
+            weight and the total bound weight are validated as in set_weights
+                
+            Parameters
+            -----------------
+            tkn_name : str
+                Token name symbol   
+            bound : boolean
+                Indicator of whether token is bound to pool                       
+        """   
+        
+        assert tkn_name in self.tkn_dic, 'Balancer V1: TOKEN NOT PART OF GROUP'
+        assert isinstance(bound, bool), 'Balancer V1: BOUND NOT BOOLEAN'
+        if bound:
+            self._check_weights({tkn_name: self.tkn_denorm_wts[tkn_name]}, {**self.tkn_bounds, tkn_name: True})
+        
+        if self.shared:
+            self._unshare()
+        self.tkn_bounds[tkn_name] = bound
+        self._update_weights()
+        
+    def _check_weights(self, weights, bounds):
+        
+        """ _check_weights
+
+            Validate new weights against MIN_WEIGHT and MAX_WEIGHT, and the resulting 
+            total bound weight against MAX_TOTAL_WEIGHT, without writing anything
+                
+            Parameters
+            -----------------
+            weights : dictionary
+                New denormalized weights referenced by token name  
+            bounds : dictionary
+                Bound indicators the total is taken over, referenced by token name                       
+        """   
+        
+        for tkn_name, weight in weights.items():
+            assert tkn_name in self.tkn_dic, 'Balancer V1: TOKEN NOT PART OF GROUP'
+            assert weight >= float(MIN_WEIGHT), 'Balancer V1: ERR_MIN_WEIGHT'
+            assert weight <= float(MAX_WEIGHT), 'Balancer V1: ERR_MAX_WEIGHT'
+        total = sum(weights.get(tkn_nm, wt) for tkn_nm, wt in self.tkn_denorm_wts.items() if bounds[tkn_nm])
+        assert total <= float(MAX_TOTAL_WEIGHT), 'Balancer V1: ERR_MAX_TOTAL_WEIGHT'
+            
+    def _update_weights(self):
+        
+        """ _update_weights
+
+            Recompute total bound weight and normalized weights after a token, 
+            weight or bound change, and bump version                       
+        """  
+        
+        self.total_denorm_wt = sum(wt for tkn_nm, wt in self.tkn_denorm_wts.items() if self.tkn_bounds[tkn_nm])
+        total = sum(self.tkn_denorm_wts.values())
+        for tkn_nm, weight in self.tkn_denorm_wts.items():
+            self.tkn_norm_wts[tkn_nm] = weight / total
+        self.version += 1
 
     def check_tkn(self, tkn):
         
@@ -83,8 +271,7 @@ class BalancerVault:
                 Indicator of whether token is contained in vault                         
         """             
         
-        tkn_nms = self.get_names()
-        return tkn.token_name in tkn_nms         
+        return tkn.token_name in self.tkn_dic         
             
     def get_name(self):
         
@@ -98,12 +285,10 @@ class BalancerVault:
                 Token names delimited by hyphen
         """          
         
-        tkn_nms = self.get_names()
-        return "-".join(tkn_nms)  
+        return "-".join(self.tkn_nms)  
     
     def get_coins_str(self):
-        tkn_nms = self.get_names()
-        return "-".join(tkn_nms)    
+        return "-".join(self.tkn_nms)    
  
     def get_token(self, tkn_name):
         
@@ -147,13 +332,24 @@ class BalancerVault:
             Returns
             -----------------
             tkn_nms : list
-                Token string names
+                Token string names (a new list; see get_names_view)
+        """           
+        
+        return list(self.tkn_nms)
+    
+    def get_names_view(self):
+        
+        """ get_names_view
+
+            Get token string names without copying
+                    
+            Returns
+            -----------------
+            tkn_nms : tuple
+                Cached token string names (replaced when a token is added)
         """           
         
-        tkn_nms = []
-        for tkn in self.tkns:
-            tkn_nms.append(tkn.token_name) 
-        return tkn_nms    
+        return self.tkn_nms    
     
     def get_dict(self):
         
@@ -163,14 +359,11 @@ class BalancerVault:
                     
             Returns
             -----------------
-            tkn_dict : dict
-                Dictionary of tokens
+            tkn_dict : mappingproxy
+                Read-only dictionary of tokens
         """          
         
-        tkn_dict = {}
-        for tkn in self.tkns:
-            tkn_dict[tkn.token_name] = tkn
-        return tkn_dict      
+        return self._dic_view      
     
     def get_balances(self):
         
@@ -181,13 +374,24 @@ class BalancerVault:
             Returns
             -----------------
             tkn_balances : dict
-                Dictionary of token balances
+                Dictionary of token balances (a new dict; see get_balances_view)
+        """          
+        
+        return {tkn.token_name: tkn.token_total for tkn in self.tkns}
+    
+    def get_balances_view(self):
+        
+        """ get_balances_view
+
+            Get token balances referenced by token name without copying
+                    
+            Returns
+            -----------------
+            tkn_balances : BalanceView
+                Read-only live dictionary of token balances (copy() for a snapshot)
         """          
         
-        tkn_balances = {}
-        for tkn in self.tkns:
-            tkn_balances[tkn.token_name] = tkn.token_total
-        return tkn_balances   
+        return self._balance_view   
     
     def get_norm_weights(self):
         
@@ -197,14 +401,11 @@ class BalancerVault:
                     
             Returns
             -----------------
-            norm_wts_dict : dict
-                Dictionary of token normalized weights 
+            norm_wts_dict : mappingproxy
+                Read-only dictionary of token normalized weights 
         """          
         
-        tkn_denorm_wts = self.get_denorm_weights()
-        norm_wts = self.normalize_float_arr(list(tkn_denorm_wts.values()))
-        norm_wts_dict = {e:norm_wts[k] for k, e in enumerate(tkn_denorm_wts)} 
-        return norm_wts_dict        
+        return self._norm_wts_view        
    
     def get_denorm_weights(self):
         
@@ -214,11 +415,11 @@ class BalancerVault:
                     
             Returns
             -----------------
-            norm_wts_dict : dict
-                Dictionary of token denormalized weights 
+            norm_wts_dict : mappingproxy
+                Read-only dictionary of token denormalized weights 
         """          
         
-        return self.tkn_denorm_wts   
+        return self._denorm_wts_view   
     
     def get_bounds(self):
         
@@ -228,11 +429,11 @@ class BalancerVault:
                     
             Returns
             -----------------
-            norm_wts_dict : dict
-                Dictionary of token bounds indicating whether token is bound to pool
+            norm_wts_dict : mappingproxy
+                Read-only dictionary of token bounds indicating whether token is bound to pool
         """          
         
-        return self.tkn_bounds       
+        return self._bounds_view       
         
     def get_base_token(self):
         return self.base_tkn
@@ -241,11 +442,7 @@ class BalancerVault:
         return self.base_tkn.token_name   
     
     def get_total_denorm_weight(self):
-        total_weight = 0
-        for tkn in self.tkns:
-            if self.tkn_bounds[tkn.token_name]:
-                total_weight += self.tkn_denorm_wts[tkn.token_name] 
-        return total_weight 
+        return self.total_denorm_wt 
     
     def normalize_float_arr(self, float_arr):
         return list(float_arr/np.sum(float_arr))    
@@ -0,0 +1,173 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2025 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+from ..constants.balancer_constants import MIN_WEIGHT
+from ..constants.balancer_constants import MAX_WEIGHT
+from ..constants.balancer_constants import MAX_TOTAL_WEIGHT
+
+class WeightSchedule:
+    
+    """ 
+        Gradual update of denormalized weights between a start and an end block, as used 
+        by liquidity bootstrapping pools (LBPs)
+        
+        Parameters
+        ---------------
+        self.tkn_nms : tuple
+            Names of the scheduled tokens
+        self.start_wts : ndarray
+            Denormalized weights at (and before) start_block, in tkn_nms order
+        self.end_wts : ndarray
+            Denormalized weights at (and after) end_block, in tkn_nms order
+        self.start_block : int
+            Block where the update begins
+        self.end_block : int
+            Block where the update ends
+        self.curve : function
+            Maps progress in [0, 1] (array) to the fraction of the weight change applied; 
+            None for a linear schedule
+            
+        Weights are evaluated for any array of blocks at once (get_weights, calc_price_path); 
+        apply writes one step into a vault through set_weights, which bumps the vault 
+        version so exchange weight caches reload on their next use
+    """       
+  
+    def __init__(self, start_wts, end_wts, start_block, end_block, curve = None):
+        
+        assert start_wts.keys() == end_wts.keys(), 'Balancer V1: SCHEDULE TOKEN MISMATCH'
+        assert end_block > start_block, 'Balancer V1: ERR_BAD_SCHEDULE'
+        
+        self.tkn_nms = tuple(start_wts)
+        self.start_wts = np.array([start_wts[tkn_nm] for tkn_nm in self.tkn_nms], dtype=np.float64)
+        self.end_wts = np.array([end_wts[tkn_nm] for tkn_nm in self.tkn_nms], dtype=np.float64)
+        for wts in (self.start_wts, self.end_wts):
+            assert np.all(wts >= float(MIN_WEIGHT)), 'Balancer V1: ERR_MIN_WEIGHT'
+            assert np.all(wts <= float(MAX_WEIGHT)), 'Balancer V1: ERR_MAX_WEIGHT'
+            assert wts.sum() <= float(MAX_TOTAL_WEIGHT), 'Balancer V1: ERR_MAX_TOTAL_WEIGHT'
+        self.start_block = start_block
+        self.end_block = end_block
+        self.curve = curve
+        
+    def get_progress(self, blocks):
+        
+        """ get_progress
+
+            Fraction of the weight change applied at each block
+                
+            Parameters
+            -----------------
+            blocks : array_like
+                Block numbers  
+                
+            Returns
+            -----------------
+            progress : ndarray
+                Values in [0, 1], shaped like blocks
+        """  
+        
+        t = np.clip((np.asarray(blocks, dtype=np.float64) - self.start_block) / (self.end_block - self.start_block), 0.0, 1.0)
+        return t if self.curve is None else np.asarray(self.curve(t), dtype=np.float64)
+    
+    def get_weights(self, blocks):
+        
+        """ get_weights
+
+            Denormalized weights at each block (vectorized)
+                
+            Parameters
+            -----------------
+            blocks : array_like
+                Block numbers  
+                
+            Returns
+            -----------------
+            weights : ndarray
+                Weights of shape blocks.shape + (n,), in tkn_nms order
+        """  
+        
+        progress = self.get_progress(blocks)[..., None]
+        return self.start_wts + progress * (self.end_wts - self.start_wts)
+    
+    def apply(self, vault, block):
+        
+        """ apply
+
+            Set the scheduled weights of a block in a vault (one version bump); the 
+            vault is left unchanged if the resulting weights are out of range
+                
+            Parameters
+            -----------------
+            vault : BalancerVault
+                Vault holding the scheduled tokens
+            block : int
+                Current block number  
+                
+            Returns
+            -----------------
+            changed : bool
+                False when the weights were already at their scheduled values
+        """  
+        
+        weights = self.get_weights(block)
+        tkn_denorm_wts = vault.get_denorm_weights()
+        if all(tkn_denorm_wts[tkn_nm] == wt for tkn_nm, wt in zip(self.tkn_nms, weights)):
+            return False
+        
+        vault.set_weights({tkn_nm: float(wt) for tkn_nm, wt in zip(self.tkn_nms, weights)})
+        return True
+    
+    def calc_price_path(self, lp, blocks, reserves = None):
+        
+        """ calc_price_path
+
+            Spot price of every vault token in units of the first vault token along 
+            the schedule, for all blocks in one pass and without touching the pool
+                
+            Parameters
+            -----------------
+            lp : BalancerExchange
+                Balancer LP  
+            blocks : array_like
+                Block numbers, shape (T,)
+            reserves : array_like
+                Reserves in vault order, shape (n,) or (T, n) (ie, from a HistoryReader); 
+                default the current reserves
+
+            Returns
+            -----------------
+            prices : ndarray
+                Prices of shape (T, n), in vault order
+        """  
+        
+        tkn_nms = lp.vault.get_names_view()
+        tkn_denorm_wts = lp.vault.get_denorm_weights()
+        if reserves is None:
+            balances = lp.vault.get_balances_view()
+            reserves = [balances[tkn_nm] for tkn_nm in tkn_nms]
+        reserves = np.asarray(reserves, dtype=np.float64)
+        
+        blocks = np.asarray(blocks)
+        weights = np.tile(np.array([tkn_denorm_wts[tkn_nm] for tkn_nm in tkn_nms], dtype=np.float64), blocks.shape + (1,))
+        cols = [tkn_nms.index(tkn_nm) for tkn_nm in self.tkn_nms]
+        weights[..., cols] = self.get_weights(blocks)
+        
+        ratios = reserves / weights
+        prices = ratios[..., :1] / ratios / (1.0 - float(lp.swap_fee))
+        prices[..., 0] = 1.0
+        return prices
@@ -1 +1,3 @@
-from .BalancerVault import BalancerVault
\ No newline at end of file
+from .BalanceView import BalanceView
+from .BalancerVault import BalancerVault
+from .WeightSchedule import WeightSchedule
\ No newline at end of file
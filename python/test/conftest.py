@@ -0,0 +1,27 @@
+import pytest
+from balancerpy import ERC20, BalancerVault, BalancerFactory, BalancerExchangeData, Join, MathMode
+
+AMT_DAI = 10000000
+AMT_WETH = 67738.6361731024
+
+def make_pool(math_mode = MathMode.FLOAT, ledger = None, user_nm = 'user', shares = 100):
+    dai = ERC20('DAI', '0x111')
+    weth = ERC20('WETH', '0x09')
+    if ledger is not None:
+        dai.set_ledger(ledger())
+        weth.set_ledger(ledger())
+        dai.credit(user_nm, AMT_DAI)
+        weth.credit(user_nm, AMT_WETH)
+    dai.deposit(None, AMT_DAI)
+    weth.deposit(None, AMT_WETH)
+    vault = BalancerVault()
+    vault.add_token(dai, 10)
+    vault.add_token(weth, 40)
+    exchg_data = BalancerExchangeData(vault = vault, symbol = 'LP', address = '0x011', math_mode = math_mode)
+    lp = BalancerFactory('WETH pool factory', '0x2').deploy(exchg_data)
+    Join().apply(lp, user_nm, shares)
+    return lp, dai, weth
+
+@pytest.fixture
+def pool():
+    return make_pool()
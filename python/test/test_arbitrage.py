@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from balancerpy import CWPArbitrage, BalancerMathArray
+from conftest import AMT_DAI, AMT_WETH
+
+def brute_force(price_out, bal_in, wt_in, bal_out, wt_out, fee):
+    amts = np.linspace(0.0, 0.5 * bal_in, 200001)
+    profit = price_out * BalancerMathArray.calc_out_given_in(amts, bal_in, wt_in, bal_out, wt_out, fee).result - amts
+    k = int(np.argmax(profit))
+    return amts[k], profit[k], amts[1]
+
+@pytest.mark.parametrize('price_out, wt_in, wt_out, fee', [(700.0, 10, 40, 0.0025), (0.2, 25, 25, 0.01), (3.0, 40, 10, 0.003)])
+def test_closed_form_matches_brute_force(price_out, wt_in, wt_out, fee):
+    bal_in, bal_out = 1e6, 2e5 if price_out < 1 else 1e6 / 590
+    amt_in, amt_out, profit = CWPArbitrage.calc_optimal_in(price_out, bal_in, wt_in, bal_out, wt_out, fee)
+    best_in, best_profit, step = brute_force(price_out, bal_in, wt_in, bal_out, wt_out, fee)
+    assert profit >= best_profit - 1e-9 * abs(best_profit)
+    assert abs(amt_in - best_in) <= step
+    assert profit == pytest.approx(price_out * amt_out - amt_in)
+
+def test_get_arb_trades_pool_to_external_price(pool):
+    lp, dai, weth = pool
+    arb = CWPArbitrage()
+    spot = lp.get_price(dai, weth)
+    res = arb.get_arb(lp, weth, dai, 1.05 * spot)
+    assert res['tkn_in'].token_name == 'DAI' and res['tkn_out'].token_name == 'WETH' and res['profit'] > 0
+    out = lp.swap_exact_amount_in(res['tkn_in_amt'], dai, weth, 'arb')
+    assert out['tkn_out_amt'] == pytest.approx(res['tkn_out_amt'], rel = 1e-12)
+    assert arb.get_arb(lp, weth, dai, 1.05 * spot)['profit'] == pytest.approx(0.0, abs = 1e-6)
+
+def test_no_trade_inside_fee_band(pool):
+    lp, dai, weth = pool
+    spot = lp.get_price(dai, weth)
+    res = CWPArbitrage().get_arb(lp, weth, dai, spot * (1 - 0.001))
+    assert res['tkn_in'] is None and res['profit'] == 0.0
+    res = CWPArbitrage().calc_arb([spot * 0.999, spot * 0.5, spot * 2], AMT_WETH, 40, AMT_DAI, 10, 0.0025)
+    assert res['profit'][0] == 0.0 and (res['profit'][1:] > 0).all()
+    assert res['dx'][1] > 0 and res['dx'][2] < 0
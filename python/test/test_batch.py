@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from balancerpy import MathMode, ERC20
+from conftest import make_pool
+
+def state(lp):
+    return (lp.state.reserves.tolist(), lp.state.fees.tolist(), lp.pool_shares, dict(lp.pool_providers))
+
+@pytest.mark.parametrize('math_mode', [MathMode.FLOAT, MathMode.DECIMAL])
+def test_batches_match_sequential_calls(math_mode):
+    lp, dai, weth = make_pool(math_mode = math_mode)
+    seq, sdai, sweth = make_pool(math_mode = math_mode)
+    swaps = [(1000, dai, weth, 't'), (2.5, weth, dai, 't'), (30000, dai, weth, 'u')]
+    out = lp.swap_batch(swaps)
+    ref = [seq.swap_exact_amount_in(amt, tkn_in, tkn_out, to) for amt, tkn_in, tkn_out, to in swaps]
+    assert out.tolist() == [[r['tkn_out_amt'], r['tkn_in_fee']] for r in ref]
+    out = lp.join_batch([(5000, dai, 'a'), (3, weth, 'b')])
+    ref = [seq.join_swap_extern_amount_in(5000, sdai, 'a'), seq.join_swap_extern_amount_in(3, sweth, 'b')]
+    assert out[:, 0].tolist() == [r['shares_in_amt'] for r in ref]
+    out = lp.exit_batch([(0.01, weth, 'a'), (0.005, dai, 'b')])
+    ref = [seq.exit_swap_pool_amount_in(0.01, sweth, 'a'), seq.exit_swap_pool_amount_in(0.005, sdai, 'b')]
+    assert out[:, 0].tolist() == [r['tkn_out_amt'] for r in ref]
+    assert state(lp) == state(seq)
+
+def test_swap_batch_is_atomic(pool):
+    lp, dai, weth = pool
+    before = state(lp)
+    with pytest.raises(AssertionError, match = 'INSUFFICIENT_INPUT_AMOUNT'):
+        lp.swap_batch([(1000, dai, weth, 't'), (0, dai, weth, 't')])
+    assert state(lp) == before
+    with pytest.raises(AssertionError, match = 'TOKEN NOT PART OF GROUP'):
+        lp.swap_batch([(1000, dai, ERC20('USDC', '0x0'), 't')])
+    assert state(lp) == before
@@ -0,0 +1,31 @@
+from decimal import Decimal
+import pytest
+from balancerpy import MathMode
+from conftest import make_pool
+
+def test_constants_are_memoized(pool):
+    lp, dai, weth = pool
+    assert lp.get_pair_constants(dai, weth) is lp.get_pair_constants(dai, weth)
+    assert lp.get_token_constants(dai) is lp.get_token_constants(dai)
+    assert lp.get_pair_constants(dai, weth) == (10.0, 40.0, 0.0025)
+    assert lp.get_token_constants(weth) == (40.0, 50.0, 0.0025)
+
+def test_cache_follows_weight_fee_and_math_mode_changes(pool):
+    lp, dai, weth = pool
+    lp.get_pair_constants(dai, weth)
+    lp.vault.set_weight('WETH', 30)
+    assert lp.get_pair_constants(dai, weth) == (10.0, 30.0, 0.0025)
+    assert lp.get_token_constants(dai) == (10.0, 40.0, 0.0025)
+    lp.set_swap_fee(0.003)
+    assert lp.get_pair_constants(dai, weth)[2] == 0.003
+    lp.set_math_mode(MathMode.DECIMAL)
+    assert all(isinstance(c, Decimal) for c in lp.get_pair_constants(dai, weth))
+
+def test_quotes_after_weight_change_match_fresh_pool(pool):
+    lp, dai, weth = pool
+    lp.get_amount_out(1000, dai, weth)
+    lp.vault.set_weight('WETH', 30)
+    ref, rdai, rweth = make_pool()
+    ref.vault.set_weight('WETH', 30)
+    assert lp.get_amount_out(1000, dai, weth) == ref.get_amount_out(1000, rdai, rweth)
+    assert lp.swap_exact_amount_in(1000, dai, weth, 't') == ref.swap_exact_amount_in(1000, rdai, rweth, 't')
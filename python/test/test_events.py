@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from balancerpy import EventRecorder, EventKind
+
+def share_flow(recorder):
+    cols = recorder.columns()
+    sign = np.select([cols['kind'] == EventKind.MINT, cols['kind'] == EventKind.BURN], [1.0, -1.0], 0.0)
+    return float(np.sum(sign * cols['shares']))
+
+def test_shares_logged_once_per_join_and_exit(pool):
+    lp, dai, weth = pool
+    recorder = EventRecorder()
+    lp.set_recorder(recorder)
+    shares = lp.pool_shares
+    lp.swap_exact_amount_in(1000, dai, weth, 'user')
+    lp.join_swap_extern_amount_in(5000, dai, 'a')
+    lp.exit_swap_extern_amount_out(2, weth, 'a')
+    lp.exit_pool(10, 'user')
+    lp.exit_pool_all(0.5)
+    cols = recorder.columns()
+    assert not cols['shares'][np.isin(cols['kind'], [EventKind.JOIN, EventKind.EXIT, EventKind.SWAP])].any()
+    assert share_flow(recorder) == pytest.approx(lp.pool_shares - shares)
+
+def test_rolled_back_events_dropped(pool):
+    lp, dai, weth = pool
+    recorder = EventRecorder()
+    lp.set_recorder(recorder)
+    lp.swap_exact_amount_in(1000, dai, weth, 'user')
+    with pytest.raises(RuntimeError):
+        with lp.transaction():
+            lp.join_swap_extern_amount_in(5000, dai, 'a')
+            raise RuntimeError
+    assert len(recorder) == 1
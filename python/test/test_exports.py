@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+def test_star_import_exposes_public_classes():
+    namespace = {}
+    exec('from balancerpy import *', namespace)
+    for name in ('ERC20', 'BalancerExchange', 'CWPQuote', 'CWPSlippage', 'CWPArbitrage', 'CWPValuation', 
+                 'BalancerMathGreeks', 'BalancerMathGreeksResult', 'WeightSchedule', 'ReplayEngine'):
+        assert name in namespace
+
+def test_subpackages_resolve_on_attribute_access():
+    # fresh interpreter, so no subpackage has been imported yet
+    code = ('import balancerpy\n'
+            'assert balancerpy.erc.ERC20 is balancerpy.ERC20\n'
+            'assert balancerpy.cwpt.exchg.BalancerMathArray is balancerpy.BalancerMathArray\n'
+            'assert balancerpy.utils.data.BalancerPoolData is balancerpy.BalancerPoolData\n'
+            'try:\n    balancerpy.no_such_module\nexcept AttributeError:\n    pass\n'
+            'else:\n    raise SystemExit(1)\n')
+    subprocess.run([sys.executable, '-c', code], check = True)
@@ -0,0 +1,70 @@
+import pytest
+
+def test_sequential_swaps_on_fork_move_fork_price(pool):
+    lp, dai, weth = pool
+    before = (dai.token_total, weth.token_total, lp.get_price(dai, weth))
+    fk = lp.fork()
+    first = fk.swap_exact_amount_in(1000, dai, weth, 'trader')
+    second = fk.swap_exact_amount_in(1000, dai, weth, 'trader')
+    assert second['tkn_out_amt'] < first['tkn_out_amt']
+    assert fk.get_price(dai, weth) > before[2]
+    assert fk.get_reserve(dai) == fk.vault.get_token('DAI').token_total == before[0] + 2000
+    assert (dai.token_total, weth.token_total, lp.get_price(dai, weth)) == before
+    assert fk.audit() and lp.audit()
+
+def test_fork_matches_parent_trade_for_trade(pool):
+    lp, dai, weth = pool
+    fk = lp.fork()
+    for amt in (1000, 5000, 250):
+        assert fk.swap_exact_amount_in(amt, dai, weth, 'trader') == lp.swap_exact_amount_in(amt, dai, weth, 'trader')
+    assert fk.swap_exact_amount_out(2, weth, dai, 'trader') == lp.swap_exact_amount_out(2, weth, dai, 'trader')
+    assert fk.get_amounts_out([10, 100], dai, weth)['tkn_out_amt'].tolist() == lp.get_amounts_out([10, 100], dai, weth)['tkn_out_amt'].tolist()
+
+def test_fork_join_exit_leave_parent_untouched(pool):
+    lp, dai, weth = pool
+    shares = lp.pool_shares
+    fk = lp.fork()
+    fk.join_swap_extern_amount_in(5000, dai, 'a')
+    out = fk.exit_swap_pool_amount_in(fk.pool_providers['a'], weth, 'a')
+    assert out['tkn_out_amt'] > 0
+    assert fk.audit()
+    assert lp.pool_shares == shares and 'a' not in lp.pool_providers
+    assert lp.audit()
+
+def test_fork_weights_copy_on_write(pool):
+    lp, dai, weth = pool
+    fk = lp.fork()
+    fk.vault.set_weight('WETH', 20)
+    assert fk.tkn_weights['DAI'] == pytest.approx(1/3)
+    assert lp.tkn_weights['DAI'] == pytest.approx(0.2)
+
+def test_fork_share_quotes_use_fork_balances(pool):
+    from balancerpy import CWPQuote
+    lp, dai, weth = pool
+    fk = lp.fork()
+    fk.swap_exact_amount_in(100000, dai, weth, 'trader')
+    quote = CWPQuote()
+    single = [quote.get_amount_from_shares(fk, tkn, 5) for tkn in (dai, weth)]
+    batch = quote.get_amounts_from_shares(fk, [5], [dai, weth])[0]
+    assert single == pytest.approx(batch.tolist(), rel = 1e-12)
+    assert single[0] != pytest.approx(quote.get_amount_from_shares(lp, dai, 5), rel = 1e-6)
+    single = [quote.get_shares_from_amount(fk, tkn, 10) for tkn in (dai, weth)]
+    batch = quote.get_shares_from_amounts(fk, [10], [dai, weth])[0]
+    assert single == pytest.approx(batch.tolist(), rel = 1e-12)
+
+def test_restore_inside_transaction_rolls_back(pool):
+    lp, dai, weth = pool
+    snap = lp.snapshot()
+    lp.join_swap_extern_amount_in(5000, dai, 'a')
+    registry = lp.pool_providers
+    before = (dai.token_total, weth.token_total, lp.pool_shares, dict(registry))
+    with pytest.raises(RuntimeError):
+        with lp.transaction():
+            lp.restore(snap)
+            assert 'a' not in registry
+            raise RuntimeError
+    assert lp.pool_providers is registry
+    assert (dai.token_total, weth.token_total, lp.pool_shares, dict(registry)) == before
+    lp.restore(snap)
+    assert lp.pool_providers is registry and 'a' not in registry
+    assert lp.audit()
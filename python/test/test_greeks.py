@@ -0,0 +1,37 @@
+import inspect
+import numpy as np
+import pytest
+from balancerpy import BalancerMathGreeks, BalancerMathFloat
+
+POINTS = {
+    'calc_spot_price': dict(token_balance_in = 1e7, token_weight_in = 10.0, token_balance_out = 67738.6, token_weight_out = 40.0, swap_fee = 0.0025),
+    'calc_out_given_in': dict(token_amount_in = 25000.0, token_balance_in = 1e7, token_weight_in = 10.0, token_balance_out = 67738.6, token_weight_out = 40.0, swap_fee = 0.0025),
+    'calc_in_given_out': dict(token_balance_out = 67738.6, token_balance_in = 1e7, token_amount_out = 150.0, token_weight_in = 10.0, token_weight_out = 40.0, swap_fee = 0.0025),
+    'calc_pool_out_given_single_in': dict(token_balance_in = 1e7, token_weight_in = 10.0, pool_supply = 100.0, total_weight = 50.0, token_amount_in = 25000.0, swap_fee = 0.0025),
+    'calc_single_in_given_pool_out': dict(token_balance_in = 1e7, token_weight_in = 10.0, pool_supply = 100.0, total_weight = 50.0, pool_amount_out = 2.0, swap_fee = 0.0025),
+    'calc_single_out_given_pool_in': dict(token_balance_out = 67738.6, token_weight_out = 40.0, pool_supply = 100.0, total_weight = 50.0, pool_amount_in = 2.0, swap_fee = 0.0025),
+    'calc_pool_in_given_single_out': dict(token_balance_out = 67738.6, token_weight_out = 40.0, pool_supply = 100.0, total_weight = 50.0, token_amount_out = 150.0, swap_fee = 0.0025),
+}
+
+def result(fn, args):
+    res = getattr(BalancerMathFloat, fn)(**args)
+    return res if fn == 'calc_spot_price' else res.result
+
+@pytest.mark.parametrize('fn', list(POINTS))
+def test_greeks_match_central_differences(fn):
+    args = POINTS[fn]
+    res = getattr(BalancerMathGreeks, fn)(**args)
+    assert float(res.result) == pytest.approx(result(fn, args), rel = 1e-13)
+    assert set(res.greeks) == set(inspect.signature(getattr(BalancerMathFloat, fn)).parameters)
+    for name, value in args.items():
+        h = 1e-5 * value
+        up, dn = dict(args), dict(args)
+        up[name], dn[name] = value + h, value - h
+        numeric = (result(fn, up) - result(fn, dn)) / (2 * h)
+        assert float(res.greeks[name]) == pytest.approx(numeric, rel = 1e-6, abs = 1e-12 * abs(result(fn, args)) / value), name
+
+def test_greeks_broadcast_over_arrays():
+    amts = np.array([[1.0, 1e3], [1e5, 2e6]])
+    res = BalancerMathGreeks.calc_out_given_in(amts, 1e7, 10.0, 67738.6, 40.0, 0.0025)
+    assert res.result.shape == amts.shape and res.greeks['swap_fee'].shape == amts.shape
+    assert (res.greeks['token_amount_in'] > 0).all() and (np.diff(res.greeks['token_amount_in'].ravel()) < 0).all()
@@ -0,0 +1,48 @@
+import os
+import numpy as np
+import pytest
+from balancerpy import HistorySink, HistoryReader
+
+def test_round_trip_through_growth(pool, tmp_path):
+    lp, dai, weth = pool
+    path = str(tmp_path / 'hist.bin')
+    expected = []
+    with HistorySink(path, lp, capacity = 4) as sink:
+        for step in range(50):
+            lp.swap_exact_amount_in(100 + step, dai, weth, 'trader')
+            sink.record()
+            expected.append([step, dai.token_total, weth.token_total, lp.pool_shares, lp.get_price(dai, weth), 
+                             lp.tkn_fees['DAI'], lp.tkn_fees['WETH']])
+    reader = HistoryReader(path)
+    assert reader.columns == ('step', 'reserve_DAI', 'reserve_WETH', 'pool_shares', 'price_WETH', 'fee_DAI', 'fee_WETH')
+    assert len(reader) == 50
+    assert np.array_equal(np.asarray(reader.rows), np.array(expected))
+    assert os.path.getsize(path) % 8 == 0 and os.path.getsize(path) < 4096 + 50 * 7 * 8
+
+def test_reader_views_are_zero_copy(pool, tmp_path):
+    lp, dai, weth = pool
+    path = str(tmp_path / 'hist.bin')
+    with HistorySink(path, lp) as sink:
+        for step in range(10):
+            sink.record(step = 2 * step)
+    reader = HistoryReader(path)
+    assert np.shares_memory(reader['step'], reader.rows)
+    cols, reserves = reader.select('reserve_')
+    assert cols == ('reserve_DAI', 'reserve_WETH') and np.shares_memory(reserves, reader.rows)
+    assert reader.to_structured()['step'].tolist() == list(range(0, 20, 2))
+
+def test_flushed_rows_visible_before_close(pool, tmp_path):
+    lp, dai, weth = pool
+    path = str(tmp_path / 'hist.bin')
+    sink = HistorySink(path, lp)
+    sink.record()
+    sink.record()
+    sink.flush()
+    assert len(HistoryReader(path)) == 2
+    sink.close()
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'\0' * 128)
+    with pytest.raises(AssertionError, match = 'NOT A HISTORY FILE'):
+        HistoryReader(str(path))
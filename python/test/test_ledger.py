@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from balancerpy import ArrayLedger, DictLedger
+from conftest import make_pool, AMT_DAI, AMT_WETH
+
+def test_array_ledger_rejects_bad_ids():
+    ledger = ArrayLedger(capacity = 4)
+    for addr in (-1, 'u', '0', 1.0, True):
+        with pytest.raises(AssertionError):
+            ledger.add(addr, 1.0)
+    with pytest.raises(AssertionError):
+        ledger.adds([0, -1], [1.0, 1.0])
+    with pytest.raises(AssertionError):
+        ledger.adds(['u', 'v'], [1.0, 1.0])
+    with pytest.raises(AssertionError):
+        ledger.gets([-1])
+    assert ledger.balances.sum() == 0
+
+def test_array_ledger_grows_and_accumulates():
+    ledger = ArrayLedger(capacity = 2)
+    ledger.add(np.int64(0), 1.0)
+    ledger.adds([5, 5, 1], [1.0, 2.0, 4.0])
+    assert ledger.get(5) == 3.0
+    assert ledger.get(100) == 0.0
+    assert ledger.gets([0, 1, 5, 100]).tolist() == [1.0, 4.0, 3.0, 0.0]
+    ledger.adds([], [])
+
+@pytest.mark.parametrize('ledger, user', [(DictLedger, 'user'), (ArrayLedger, 0)])
+def test_swap_moves_ledger_balances(ledger, user):
+    lp, dai, weth = make_pool(ledger = ledger, user_nm = user)
+    out = lp.swap_exact_amount_in(1000, dai, weth, user)
+    assert dai.balance_of(user) == pytest.approx(AMT_DAI - 1000)
+    assert weth.balance_of(user) == pytest.approx(AMT_WETH + out['tkn_out_amt'])
+
+@pytest.mark.parametrize('ledger, user', [(DictLedger, 'user'), (ArrayLedger, 0)])
+def test_ledger_rolled_back_with_transaction(ledger, user):
+    lp, dai, weth = make_pool(ledger = ledger, user_nm = user)
+    before = (dai.balance_of(user), weth.balance_of(user))
+    with pytest.raises(RuntimeError):
+        with lp.transaction():
+            lp.swap_exact_amount_in(1000, dai, weth, user)
+            lp.join_swap_extern_amount_in(5000, dai, user)
+            raise RuntimeError
+    assert (dai.balance_of(user), weth.balance_of(user)) == pytest.approx(before)
+    assert lp.audit()
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from balancerpy import BalancerMathArray, BalancerMathFloat, MathMode
+from conftest import make_pool
+
+def test_kernels_match_float_elementwise():
+    rng = np.random.default_rng(7)
+    n = 50
+    bal_in, bal_out = rng.uniform(1e2, 1e8, n), rng.uniform(1e2, 1e8, n)
+    wt_in, wt_out = rng.uniform(1, 25, n), rng.uniform(1, 25, n)
+    fee = rng.uniform(1e-6, 0.1, n)
+    amt_in = bal_in * rng.uniform(1e-9, 0.5, n)
+    amt_out = bal_out * rng.uniform(1e-9, 0.33, n)
+    batch = [BalancerMathArray.calc_out_given_in(amt_in, bal_in, wt_in, bal_out, wt_out, fee),
+             BalancerMathArray.calc_in_given_out(bal_out, bal_in, amt_out, wt_in, wt_out, fee),
+             BalancerMathArray.calc_pool_out_given_single_in(bal_in, wt_in, 100.0, wt_in + wt_out, amt_in, fee),
+             BalancerMathArray.calc_pool_in_given_single_out(bal_out, wt_out, 100.0, wt_in + wt_out, amt_out, fee)]
+    for k in range(n):
+        single = [BalancerMathFloat.calc_out_given_in(amt_in[k], bal_in[k], wt_in[k], bal_out[k], wt_out[k], fee[k]),
+                  BalancerMathFloat.calc_in_given_out(bal_out[k], bal_in[k], amt_out[k], wt_in[k], wt_out[k], fee[k]),
+                  BalancerMathFloat.calc_pool_out_given_single_in(bal_in[k], wt_in[k], 100.0, wt_in[k] + wt_out[k], amt_in[k], fee[k]),
+                  BalancerMathFloat.calc_pool_in_given_single_out(bal_out[k], wt_out[k], 100.0, wt_in[k] + wt_out[k], amt_out[k], fee[k])]
+        for res, ref in zip(batch, single):
+            assert res.result[k] == pytest.approx(ref.result, rel = 1e-14)
+            assert res.fee[k] == pytest.approx(ref.fee, rel = 1e-14)
+
+def test_get_amounts_out_and_in_match_single_quotes():
+    lp, dai, weth = make_pool(math_mode = MathMode.DECIMAL)
+    amts = np.array([[1.0, 1e3], [1e5, 2.5e6]])
+    out = lp.get_amounts_out(amts, dai, weth)
+    assert out['tkn_out_amt'].shape == amts.shape
+    for amt, res in zip(amts.ravel(), out['tkn_out_amt'].ravel()):
+        assert res == pytest.approx(lp.get_amount_out(amt, dai, weth)['tkn_out_amt'], rel = 1e-13)
+    amts = np.array([0.5, 10.0, 1000.0])
+    out = lp.get_amounts_in(amts, weth, dai)
+    for amt, res in zip(amts, out['tkn_in_amt']):
+        assert res == pytest.approx(lp.get_amount_in(amt, weth, dai)['tkn_in_amt'], rel = 1e-13)
@@ -0,0 +1,37 @@
+import itertools
+import numpy as np
+import pytest
+from decimal import Decimal
+from balancerpy import BalancerMath, BalancerMathFloat
+from balancerpy.constants.balancer_constants import MAX_IN_RATIO, MAX_OUT_RATIO, MIN_FEE, MAX_FEE
+
+TOL = 1e-13
+RATIOS = np.geomspace(1e-12, float(MAX_IN_RATIO), 13)
+
+def rel_err(fast, ref):
+    return max(abs(float(fast.result) - float(ref.result)) / abs(float(ref.result)),
+               abs(float(fast.fee) - float(ref.fee)) / max(abs(float(ref.fee)), 1e-300))
+
+def cases(r, b, wi, wo, sf):
+    tw = wi + wo
+    out_r = min(r, float(MAX_OUT_RATIO))
+    yield 'calc_out_given_in', (r * b, b, wi, 3.7 * b, wo, sf)
+    yield 'calc_in_given_out', (3.7 * b, b, out_r * 3.7 * b, wi, wo, sf)
+    yield 'calc_pool_out_given_single_in', (b, wi, 100.0, tw, r * b, sf)
+    yield 'calc_single_in_given_pool_out', (b, wi, 100.0, tw, r * 100.0 * wi / tw, sf)
+    yield 'calc_single_out_given_pool_in', (b, wi, 100.0, tw, out_r * 100.0 * wi / tw, sf)
+    yield 'calc_pool_in_given_single_out', (b, wi, 100.0, tw, out_r * b, sf)
+
+@pytest.mark.parametrize('sf', [float(MIN_FEE), 0.003, float(MAX_FEE)])
+def test_float_matches_decimal_over_max_in_ratio_sweep(sf):
+    worst = 0.0
+    for r, b, (wi, wo) in itertools.product(RATIOS, [1e-2, 1.0, 1e6, 1e9], [(1, 40), (10, 40), (25, 25), (49, 1)]):
+        for fn, args in cases(r, b, wi, wo, sf):
+            ref = getattr(BalancerMath, fn)(*[Decimal(x) for x in args])
+            worst = max(worst, rel_err(getattr(BalancerMathFloat, fn)(*args), ref))
+    assert worst < TOL
+
+def test_float_spot_price_matches_decimal():
+    args = (1e7, 10.0, 67738.6361731024, 40.0, 0.0025)
+    ref = BalancerMath.calc_spot_price(*[Decimal(x) for x in args])
+    assert BalancerMathFloat.calc_spot_price(*args) == pytest.approx(float(ref), rel = TOL)
@@ -0,0 +1,37 @@
+import pytest
+from decimal import Decimal
+from balancerpy import BalancerMath, BalancerMathInt, MathMode
+from conftest import make_pool
+
+BONE = 10**18
+
+def test_bnum_rounding_matches_contract():
+    assert BalancerMathInt.bmul(1, BONE // 2) == 1
+    assert BalancerMathInt.bmul(1, BONE // 2 - 1) == 0
+    assert BalancerMathInt.bdiv(1, 2 * BONE) == 1
+    assert BalancerMathInt.bdiv(1, 2 * BONE + 2) == 0
+    assert BalancerMathInt.bpowi(2 * BONE, 10) == 1024 * BONE
+    with pytest.raises(AssertionError, match = 'ERR_BPOW_BASE_TOO_HIGH'):
+        BalancerMathInt.bpow(2 * BONE, BONE // 2)
+
+@pytest.mark.parametrize('base, exp', [(0.5, 0.25), (1.9, 3.7), (0.67, 0.8), (1.000001, 4.0)])
+def test_bpow_within_bpow_precision(base, exp):
+    res = BalancerMathInt.bpow(BalancerMathInt.to_num(base), BalancerMathInt.to_num(exp))
+    assert BalancerMathInt.to_float(res) == pytest.approx(base ** exp, rel = 1e-9)
+
+def test_formulas_return_wei_close_to_decimal():
+    to_num = BalancerMathInt.to_num
+    args = (1000, 1e7, 10, 67738.6361731024, 40, 0.0025)
+    res = BalancerMathInt.calc_out_given_in(*[to_num(x) for x in args])
+    ref = BalancerMath.calc_out_given_in(*[Decimal(x) for x in args])
+    assert isinstance(res.result, int) and isinstance(res.fee, int)
+    assert BalancerMathInt.to_float(res.result) == pytest.approx(float(ref.result), rel = 1e-9)
+    assert res.fee == to_num(1000) - BalancerMathInt.bmul(to_num(1000), BONE - to_num(0.0025))
+
+def test_integer_pool_swaps_like_decimal_pool():
+    lp_int, dai, weth = make_pool(math_mode = MathMode.INTEGER)
+    lp_dec, dai_dec, weth_dec = make_pool(math_mode = MathMode.DECIMAL)
+    out_int = lp_int.swap_exact_amount_in(1000, dai, weth, 'trader')
+    out_dec = lp_dec.swap_exact_amount_in(1000, dai_dec, weth_dec, 'trader')
+    assert out_int['tkn_out_amt'] == pytest.approx(out_dec['tkn_out_amt'], rel = 1e-9)
+    assert lp_int.audit()
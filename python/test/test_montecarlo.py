@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from balancerpy import MonteCarloRunner, BalancerPoolData, MathMode
+from conftest import AMT_DAI, AMT_WETH
+
+POOL = BalancerPoolData(tkn_nms = ('DAI', 'WETH'), tkn_amts = (AMT_DAI, AMT_WETH), tkn_wts = (10, 40), 
+                        init_shares = 100, math_mode = MathMode.FLOAT)
+
+def random_walk(lp, rng):
+    dai, weth = lp.vault.get_token('DAI'), lp.vault.get_token('WETH')
+    first = lp.swap_exact_amount_in(1000, dai, weth, 'trader')['tkn_out_amt']
+    for amt in rng.uniform(1, 5000, 20).tolist():
+        lp.swap_exact_amount_in(amt, dai, weth, 'trader')
+    return [first, lp.get_price(dai, weth)]
+
+def test_results_independent_of_workers_and_chunks():
+    ref = MonteCarloRunner(POOL, random_walk, n_workers = 0).run(12, seed = 7)
+    par = MonteCarloRunner(POOL, random_walk, n_workers = 2, chunk_size = 5).run(12, seed = 7)
+    assert ref['results'].shape == (12, 2)
+    assert np.array_equal(ref['results'], par['results'])
+    assert ref['entropy'] == 7
+
+def test_each_run_gets_a_fresh_pool_and_its_own_stream():
+    res = MonteCarloRunner(POOL, random_walk, n_workers = 0).run(5, seed = 1)['results']
+    assert np.all(res[:, 0] == res[0, 0])
+    assert len(np.unique(res[:, 1])) == 5
+
+def test_no_runs_rejected():
+    with pytest.raises(AssertionError, match = 'NO RUNS'):
+        MonteCarloRunner(POOL, random_walk, n_workers = 0).run(0)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from balancerpy import CWPQuote, MathMode, ERC20
+from conftest import make_pool
+
+def test_batch_share_quotes_match_single_quotes():
+    lp, dai, weth = make_pool(math_mode = MathMode.DECIMAL)
+    quote = CWPQuote()
+    shares = [0.0, -1.0, 0.5, 5.0, 30.0]
+    out = quote.get_amounts_from_shares(lp, shares)
+    assert out.shape == (5, 2)
+    for k, amt in enumerate(shares):
+        for j, tkn in enumerate((dai, weth)):
+            assert out[k, j] == pytest.approx(quote.get_amount_from_shares(lp, tkn, amt), rel = 1e-13)
+    amts = np.array([[0.0, 0.0], [1000.0, 2.0], [50000.0, -1.0]])
+    out = quote.get_shares_from_amounts(lp, amts, [dai, weth])
+    for k in range(3):
+        for j, tkn in enumerate((dai, weth)):
+            assert out[k, j] == pytest.approx(quote.get_shares_from_amount(lp, tkn, amts[k, j]), rel = 1e-13)
+
+def test_batch_token_subset_and_order(pool):
+    lp, dai, weth = pool
+    quote = CWPQuote()
+    both = quote.get_amounts_from_shares(lp, [1.0, 2.0])
+    assert np.array_equal(quote.get_amounts_from_shares(lp, [1.0, 2.0], [weth]), both[:, 1:])
+    assert np.array_equal(quote.get_shares_from_amounts(lp, [10.0], [weth, dai]), 
+                          quote.get_shares_from_amounts(lp, [10.0])[:, ::-1])
+    with pytest.raises(AssertionError, match = 'TOKEN NOT PART OF GROUP'):
+        quote.get_amounts_from_shares(lp, [1.0], [ERC20('USDC', '0x0')])
@@ -0,0 +1,58 @@
+import pytest
+from balancerpy import ReplayEngine
+from conftest import make_pool
+
+EVENTS = [
+    'event,caller,token_in,token_out,amount_in,amount_out',
+    'LOG_SWAP,t,DAI,WETH,1000,',
+    'LOG_SWAP,t,USDC,WETH,1000,',
+    'LOG_SWAP,t,DAI,WETH,not-a-number,',
+    'LOG_SWAP,t,DAI',
+    '{"event": "LOG_JOIN", "caller": "a", "token_in": "WETH", "amount_in": 2}',
+    '{"event": "LOG_EXIT", "caller": "a", "token_out": "LINK", "amount_out": 1}',
+    '{"event": "LOG_SWAP", "caller": "t", "token_in": "WETH"',
+    'LOG_BOGUS,t,DAI,WETH,1,',
+    'LOG_SWAP,t,WETH,DAI,1.5,',
+]
+
+@pytest.fixture
+def event_file(tmp_path):
+    path = tmp_path / 'events.csv'
+    path.write_text('\n'.join(EVENTS) + '\n')
+    return str(path)
+
+def expected_pool():
+    lp, dai, weth = make_pool()
+    lp.swap_exact_amount_in(1000, dai, weth, 't')
+    lp.join_swap_extern_amount_in(2, weth, 'a')
+    lp.swap_exact_amount_in(1.5, weth, dai, 't')
+    return lp
+
+def test_skip_mode_counts_bad_events(event_file):
+    lp, dai, weth = make_pool()
+    out = ReplayEngine(lp, on_error = 'skip').run(event_file)
+    assert (out['events'], out['skipped']) == (9, 6)
+    expected = expected_pool()
+    assert lp.state.reserves.tolist() == expected.state.reserves.tolist()
+    assert lp.pool_shares == expected.pool_shares
+    assert lp.audit()
+
+def test_raise_mode_stops_on_unknown_token(event_file):
+    lp, dai, weth = make_pool()
+    with pytest.raises(KeyError):
+        ReplayEngine(lp).run(event_file)
+
+def test_resume_from_checkpoint(event_file, tmp_path):
+    checkpoint = str(tmp_path / 'replay.ckpt')
+    lp, dai, weth = make_pool()
+    first = ReplayEngine(lp, checkpoint_path = checkpoint, checkpoint_every = 2, on_error = 'skip').run(event_file, max_events = 4)
+    assert first['events'] == 4
+    resumed, dai, weth = make_pool()
+    out = ReplayEngine(resumed, checkpoint_path = checkpoint, on_error = 'skip').run(event_file, resume = True)
+    assert out['events'] == 9 and out['replayed'] == 5
+    assert resumed.state.reserves.tolist() == expected_pool().state.reserves.tolist()
+
+def test_checkpoint_interval_must_be_positive(tmp_path):
+    lp, dai, weth = make_pool()
+    with pytest.raises(AssertionError, match = 'INVALID CHECKPOINT INTERVAL'):
+        ReplayEngine(lp, str(tmp_path / 'ckpt'), checkpoint_every = 0)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from balancerpy import ERC20, BalancerVault, BalancerFactory, BalancerExchangeData, BalancerRouter, Join, MathMode
+
+def deploy(factory, symbol, tkns):
+    vault = BalancerVault()
+    for tkn_nm, amt, weight in tkns:
+        tkn = ERC20(tkn_nm, '0x0')
+        tkn.deposit(None, amt)
+        vault.add_token(tkn, weight)
+    lp = factory.deploy(BalancerExchangeData(vault = vault, symbol = symbol, address = '0x0', math_mode = MathMode.FLOAT))
+    Join().apply(lp, 'user', 100)
+    return lp
+
+def test_split_respects_ratio_caps():
+    factory = BalancerFactory('factory', '0x2')
+    deploy(factory, 'LP1', [('DAI', 1e6, 25), ('WETH', 1e3, 25)])
+    deploy(factory, 'LP2', [('DAI', 2e5, 25), ('WETH', 2e2, 25)])
+    router = BalancerRouter([factory])
+    res = router.quote(5.5e5, ERC20('DAI', '0x0'), ERC20('WETH', '0x0'))
+    assert router.quote(6.1e5, ERC20('DAI', '0x0'), ERC20('WETH', '0x0'))['hops'] is None
+    hop = res['hops'][0]
+    assert sum(amt_in for _, amt_in, _ in hop) == pytest.approx(5.5e5)
+    for lp, amt_in, amt_out in hop:
+        assert amt_in <= lp.get_reserve(lp.vault.get_token('DAI')) * 0.5 * (1 + 1e-12)
+        lp.swap_exact_amount_in(amt_in, lp.vault.get_token('DAI'), lp.vault.get_token('WETH'), 'trader')
+
+def test_caps_include_max_out_ratio():
+    caps = BalancerRouter.calc_max_in(1e6, 40, 10, 0.0025)
+    out = BalancerRouter.split(caps, np.array([1e6]), np.array([40.0]), np.array([1e3]), np.array([10.0]), np.array([0.0025]))
+    assert out[0] == pytest.approx(caps)
+    assert BalancerRouter.split(caps * 1.01, np.array([1e6]), np.array([40.0]), np.array([1e3]), np.array([10.0]), np.array([0.0025])) is None
+
+def test_pool_not_reused_across_hops():
+    factory = BalancerFactory('factory', '0x2')
+    tri = deploy(factory, 'LP3', [('DAI', 1e6, 10), ('USDC', 1e6, 10), ('WETH', 1e3, 10)])
+    router = BalancerRouter([factory])
+    res = router.quote_path(1000, ('DAI', 'USDC', 'WETH'))
+    assert res['hops'] is None
+    direct = router.quote(1000, ERC20('DAI', '0x0'), ERC20('WETH', '0x0'))
+    assert direct['path'] == ('DAI', 'WETH')
+    assert direct['tkn_out_amt'] == pytest.approx(tri.get_amount_out(1000, tri.vault.get_token('DAI'), tri.vault.get_token('WETH'))['tkn_out_amt'])
+
+@pytest.mark.parametrize('max_iter', [1, 2, 3, 64])
+def test_split_rescale_stays_within_uneven_caps(max_iter):
+    bal_in = np.array([1e6, 2e5, 5e4])
+    args = (bal_in, np.array([25.0, 10.0, 40.0]), np.array([1e3, 3e2, 80.0]), np.array([25.0, 40.0, 10.0]), np.array([0.003, 0.001, 0.01]))
+    caps = BalancerRouter.calc_max_in(bal_in, args[1], args[3], args[4])
+    for amt in (0.9 * caps.sum(), 0.999 * caps.sum()):
+        amts = BalancerRouter.split(amt, *args, max_iter = max_iter)
+        assert np.all(amts <= caps)
+        assert amts.sum() == pytest.approx(amt, rel = 1e-12)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from balancerpy import CWPSlippage
+
+def test_price_after_matches_executed_swap(pool):
+    lp, dai, weth = pool
+    slip = CWPSlippage()
+    predicted = slip.get_price_after(lp, [25000.0], dai, weth)[0]
+    lp.swap_exact_amount_in(25000.0, dai, weth, 'trader')
+    assert predicted == pytest.approx(lp.get_price(dai, weth), rel = 1e-12)
+
+@pytest.mark.parametrize('fee', [1e-6, 0.0025, 0.1])
+def test_max_in_hits_the_slippage_bound(fee):
+    bounds = np.array([1e-6, 1e-3, 0.01, 0.2])
+    amt_in = CWPSlippage.calc_max_in(bounds, 1e7, 10.0, 67738.6, 40.0, fee)
+    after = CWPSlippage.calc_price_after(amt_in, 1e7, 10.0, 67738.6, 40.0, fee)
+    spot = CWPSlippage.calc_price_after(0.0, 1e7, 10.0, 67738.6, 40.0, fee)
+    assert after / spot - 1 == pytest.approx(bounds, rel = 1e-9)
+
+def test_no_fee_closed_form():
+    r = 10.0 / 40.0
+    amt_in = CWPSlippage.calc_max_in(0.05, 1e7, 10.0, 67738.6, 40.0, 0.0)
+    assert amt_in == pytest.approx(1e7 * (1.05 ** (1 / (1 + r)) - 1), rel = 1e-14)
+
+def test_max_trade_is_capped_and_executable(pool):
+    lp, dai, weth = pool
+    out = CWPSlippage().get_max_trade(lp, 10.0, dai, weth)
+    assert out['tkn_in_amt'] == pytest.approx(0.5 * dai.token_total)
+    assert out['slippage'] < 10.0
+    swap = lp.swap_exact_amount_in(float(out['tkn_in_amt']) * (1 - 1e-12), dai, weth, 'trader')
+    assert swap['tkn_out_amt'] == pytest.approx(float(out['tkn_out_amt']), rel = 1e-9)
+
+def test_slippage_curve_is_monotone(pool):
+    lp, dai, weth = pool
+    curve = CWPSlippage().get_slippage_curve(lp, dai, weth, n_points = 50, max_slippage = 0.05)
+    assert curve['tkn_in_amt'].shape == (50,)
+    assert curve['slippage'][0] == 0.0 and curve['slippage'][-1] == pytest.approx(0.05, rel = 1e-9)
+    assert (np.diff(curve['slippage']) > 0).all() and (np.diff(curve['effective_price']) > 0).all()
@@ -0,0 +1,20 @@
+import pytest
+
+def test_summary_prints_whole_reserves_as_integers(pool, capsys):
+    lp, dai, weth = pool
+    lp.summary()
+    out = capsys.readouterr().out
+    assert 'Reserves: DAI = 10000000, WETH = 67738.6361731024' in out
+    assert 'Weights: DAI = 0.2, WETH = 0.8' in out
+    assert 'Pool Shares: 100 ' in out
+
+def test_state_views_are_read_only(pool):
+    lp, dai, weth = pool
+    for view in (lp.tkn_reserves, lp.tkn_weights, lp.tkn_fees):
+        with pytest.raises(TypeError):
+            view['DAI'] = 0.0
+        with pytest.raises(ValueError):
+            view.arr[0] = 0.0
+    lp.swap_exact_amount_in(1000, dai, weth, 'trader')
+    assert lp.tkn_reserves['DAI'] == dai.token_total and lp.tkn_fees['DAI'] > 0
+    assert lp.audit()
@@ -0,0 +1,24 @@
+from decimal import Decimal
+import numpy as np
+import pytest
+from balancerpy import MathMode
+from balancerpy.valuation import CWPValuation
+from conftest import make_pool
+
+@pytest.mark.parametrize('math_mode', [MathMode.DECIMAL, MathMode.FLOAT])
+def test_decimal_swap_fee_is_stored_as_float(math_mode):
+    lp, dai, weth = make_pool(math_mode = math_mode)
+    lp.set_swap_fee(Decimal('0.003'))
+    assert type(lp.swap_fee) is float and lp.swap_fee == 0.003
+    out = lp.get_amounts_out([1000.0, 2000.0], dai, weth)['tkn_out_amt']
+    assert out[0] == pytest.approx(lp.get_amount_out(1000.0, dai, weth)['tkn_out_amt'], rel = 1e-12)
+    assert lp.get_amounts_in([1.0], weth, dai)['tkn_in_amt'][0] > 0
+    prices = np.column_stack([np.ones(3), [590.0, 600.0, 610.0]])
+    assert CWPValuation().value(lp, prices)['fee_income'].shape == (3,)
+
+def test_swap_fee_bounds(pool):
+    lp, dai, weth = pool
+    with pytest.raises(AssertionError, match = 'ERR_MIN_FEE'):
+        lp.set_swap_fee(0)
+    with pytest.raises(AssertionError, match = 'ERR_MAX_FEE'):
+        lp.set_swap_fee(Decimal('0.2'))
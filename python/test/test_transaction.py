@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+from balancerpy import DictLedger, ArrayLedger
+from conftest import make_pool
+
+def pool_state(lp):
+    return (tuple(tkn.token_total for tkn in lp.vault.tkns), tuple(lp.state.reserves), 
+            tuple(lp.state.fees), lp.pool_shares, dict(lp.pool_providers), lp.joined)
+
+def test_failed_swap_rolls_back(pool):
+    lp, dai, weth = pool
+    before = pool_state(lp)
+    with pytest.raises(AssertionError):
+        with lp.transaction():
+            lp.swap_exact_amount_in(1000, dai, weth, 'user')
+            lp.exit_pool(1000, 'user')
+    assert pool_state(lp) == before
+
+def test_provider_ops_and_exit_pool_all_roll_back(pool):
+    lp, dai, weth = pool
+    before = pool_state(lp)
+    registry = lp.pool_providers
+    with pytest.raises(RuntimeError):
+        with lp.transaction():
+            lp.join_swap_extern_amount_in(5000, dai, 'a')
+            lp.exit_pool_all(0.5)
+            lp.join_swap_extern_amount_in(2000, weth, 'b')
+            raise RuntimeError
+    assert lp.pool_providers is registry
+    assert dict(lp.pool_providers) == before[4]
+    assert lp.pool_shares == before[3]
+    assert lp.audit()
+
+def test_full_exit_rolls_back(pool):
+    lp, dai, weth = pool
+    lp.join_swap_extern_amount_in(5000, dai, 'a')
+    before = pool_state(lp)
+    with pytest.raises(RuntimeError):
+        with lp.transaction():
+            lp.exit_pool_all()
+            assert not lp.joined
+            raise RuntimeError
+    assert pool_state(lp) == before
+    assert lp.audit()
+
+@pytest.mark.parametrize('ledger, users', [(DictLedger, ('user', 'a')), (ArrayLedger, (0, 1))])
+def test_exit_pool_all_ledger_rolls_back(ledger, users):
+    lp, dai, weth = make_pool(ledger = ledger, user_nm = users[0])
+    dai.credit(users[1], 10000)
+    balances = lambda: [tkn.balance_of(user) for tkn in (dai, weth) for user in users]
+    before = balances()
+    with pytest.raises(RuntimeError):
+        with lp.transaction():
+            lp.join_swap_extern_amount_in(5000, dai, users[1])
+            lp.exit_pool_all(0.5)
+            raise RuntimeError
+    assert balances() == pytest.approx(before, abs = 1e-6)
+    assert lp.audit()
+
+def test_nested_transaction_rolls_back_to_its_entry(pool):
+    lp, dai, weth = pool
+    lp.swap_exact_amount_in(1000, dai, weth, 'user')
+    with lp.transaction():
+        lp.swap_exact_amount_in(1000, dai, weth, 'user')
+        middle = pool_state(lp)
+        with pytest.raises(RuntimeError):
+            with lp.transaction():
+                lp.exit_pool_all(0.25)
+                raise RuntimeError
+        assert pool_state(lp) == middle
+
+def test_exit_pool_all_on_empty_pool_raises(pool):
+    lp, dai, weth = pool
+    lp.exit_pool_all()
+    before = pool_state(lp)
+    with pytest.raises(AssertionError, match = 'POOL NOT JOINED'):
+        lp.exit_pool_all()
+    assert pool_state(lp) == before
+    assert not any(np.isnan(lp.state.reserves))
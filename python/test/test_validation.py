@@ -0,0 +1,39 @@
+import pytest
+from balancerpy import Validation
+from conftest import make_pool
+
+@pytest.mark.parametrize('validation', [Validation.OFF, Validation.CHEAP, Validation.FULL])
+def test_levels_agree_on_valid_swaps(validation):
+    lp, dai, weth = make_pool()
+    ref, _, _ = make_pool()
+    lp.set_validation(validation)
+    for amt, tkn_in, tkn_out in ((1000, dai, weth), (2.0, weth, dai), (50000, dai, weth)):
+        assert lp.swap_exact_amount_in(amt, tkn_in, tkn_out, 't') == ref.swap_exact_amount_in(amt, tkn_in, tkn_out, 't')
+        assert lp.swap_exact_amount_out(1.0, weth, dai, 't') == ref.swap_exact_amount_out(1.0, weth, dai, 't')
+    assert lp.audit()
+
+@pytest.mark.parametrize('validation, raises', [(Validation.OFF, False), (Validation.CHEAP, True), (Validation.FULL, True)])
+def test_swap_without_input_deposit(validation, raises):
+    lp, dai, weth = make_pool()
+    lp.set_validation(validation)
+    if raises:
+        with pytest.raises(AssertionError, match = 'INSUFFICIENT_INPUT_AMOUNT'):
+            lp.swap(1.0, 0.0, weth, dai, 't')
+    else:
+        lp.swap(1.0, 0.0, weth, dai, 't')
+
+def test_audit_detects_misaligned_state(pool):
+    lp, dai, weth = pool
+    assert lp.audit()
+    dai.token_total += 1
+    with pytest.raises(AssertionError, match = 'LP BALANCES NOT ALIGNED'):
+        lp.audit()
+    dai.token_total -= 1
+    lp.pool_providers['ghost'] = 1.0
+    with pytest.raises(AssertionError, match = 'POOL SHARES NOT ALIGNED'):
+        lp.audit()
+
+def test_unknown_level_rejected(pool):
+    lp, dai, weth = pool
+    with pytest.raises(AssertionError, match = 'UNKNOWN VALIDATION LEVEL'):
+        lp.set_validation('strict')
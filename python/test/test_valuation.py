@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from balancerpy.valuation import CWPValuation
+
+def eq_price(lp):
+    return (lp.tkn_reserves['DAI'] / 0.2) / (lp.tkn_reserves['WETH'] / 0.8)
+
+def test_equilibrium_reserves_keep_invariant_and_match_prices():
+    wts = np.array([0.2, 0.3, 0.5])
+    start = np.array([1e6, 2e3, 5e4])
+    prices = np.array([[1.0, 400.0, 7.0], [1.0, 650.0, 3.5]])
+    reserves, value = CWPValuation.calc_equilibrium_reserves(prices, wts, np.sum(wts * np.log(start)))
+    assert np.sum(wts * np.log(reserves), axis = -1) == pytest.approx([np.sum(wts * np.log(start))] * 2, rel = 1e-12)
+    assert value == pytest.approx(np.sum(reserves * prices, axis = -1), rel = 1e-12)
+    assert reserves[:, 0] / wts[0] / (reserves[:, 1] / wts[1]) == pytest.approx(prices[:, 1], rel = 1e-12)
+
+def test_impermanent_loss_matches_closed_form(pool):
+    lp, dai, weth = pool
+    p0 = eq_price(lp)
+    k = np.array([1.0, 0.5, 2.0, 4.0])
+    prices = np.column_stack([np.ones(4), p0 * k])
+    out = CWPValuation().value(lp, prices)
+    assert out['impermanent_loss'] == pytest.approx(k**0.8 / (0.8 * k + 0.2) - 1, abs = 1e-12)
+    assert out['lp_value'][0] == pytest.approx(out['hold_value'][0], rel = 1e-12)
+    assert out['fee_income'][0] == pytest.approx(0.0, abs = 1e-6)
+
+def test_position_share_volumes_and_paths(pool):
+    lp, dai, weth = pool
+    p0 = eq_price(lp)
+    prices = np.column_stack([np.ones(3), p0 * np.array([1.0, 1.1, 1.0])])
+    full = CWPValuation().value(lp, prices)
+    part = CWPValuation().value(lp, prices, shares = 25, volumes = [0.0, 1e5, 2e5])
+    assert part['lp_value'] == pytest.approx(full['lp_value'] / 4, rel = 1e-12)
+    assert part['cum_fee_income'] == pytest.approx(np.cumsum([0.0, 1e5, 2e5]) * lp.swap_fee / 4)
+    assert (full['fee_income'][1:] > 0).all()
+    paths = CWPValuation().value(lp, np.stack([prices, prices[::-1]]))
+    assert paths['reserves'].shape == (2, 3, 2)
+    assert paths['pool_value'][0] == pytest.approx(full['pool_value'], rel = 1e-12)
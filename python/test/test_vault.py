@@ -0,0 +1,17 @@
+def test_getters_return_copies(pool):
+    lp, dai, weth = pool
+    names = lp.vault.get_names()
+    balances = lp.vault.get_balances()
+    assert names == ['DAI', 'WETH'] and isinstance(balances, dict)
+    names.append('USDC')
+    balances['DAI'] = 0
+    lp.swap_exact_amount_in(1000, dai, weth, 'user')
+    assert lp.vault.get_names() == ['DAI', 'WETH']
+    assert balances['DAI'] == 0 and lp.vault.get_balances()['DAI'] == dai.token_total
+
+def test_views_are_live(pool):
+    lp, dai, weth = pool
+    view = lp.vault.get_balances_view()
+    lp.swap_exact_amount_in(1000, dai, weth, 'user')
+    assert view['DAI'] == dai.token_total
+    assert lp.vault.get_names_view() == ('DAI', 'WETH')
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from balancerpy import WeightSchedule
+
+def weights(lp):
+    return dict(lp.vault.get_denorm_weights()), dict(lp.vault.get_norm_weights())
+
+def test_linear_schedule_interpolates_and_clamps():
+    schedule = WeightSchedule({'WETH': 40, 'DAI': 10}, {'WETH': 10, 'DAI': 40}, 100, 200)
+    wts = schedule.get_weights([0, 100, 150, 200, 300])
+    assert wts.tolist() == [[40, 10], [40, 10], [25, 25], [10, 40], [10, 40]]
+
+def test_custom_curve():
+    schedule = WeightSchedule({'WETH': 40, 'DAI': 10}, {'WETH': 10, 'DAI': 40}, 0, 10, curve = lambda t: t**2)
+    assert schedule.get_weights(5).tolist() == [32.5, 17.5]
+
+def test_apply_updates_exchange_weights(pool):
+    lp, dai, weth = pool
+    schedule = WeightSchedule({'WETH': 40, 'DAI': 10}, {'WETH': 10, 'DAI': 40}, 0, 10)
+    version = lp.vault.version
+    assert schedule.apply(lp.vault, 5)
+    assert lp.vault.version == version + 1
+    assert lp.tkn_weights['WETH'] == 0.5
+    assert not schedule.apply(lp.vault, 5)
+    assert lp.vault.version == version + 1
+
+def test_price_path_matches_stepping(pool):
+    lp, dai, weth = pool
+    schedule = WeightSchedule({'WETH': 40, 'DAI': 10}, {'WETH': 10, 'DAI': 40}, 0, 20)
+    blocks = np.arange(-5, 26)
+    path = schedule.calc_price_path(lp, blocks)
+    stepped = []
+    for block in blocks:
+        schedule.apply(lp.vault, block)
+        stepped.append(lp.get_price(dai, weth))
+    assert path[:, 1] == pytest.approx(stepped, rel = 1e-12)
+
+def test_out_of_range_schedule_rejected():
+    with pytest.raises(AssertionError, match = 'ERR_MAX_TOTAL_WEIGHT'):
+        WeightSchedule({'WETH': 40, 'DAI': 10}, {'WETH': 30, 'DAI': 30}, 0, 10)
+    with pytest.raises(AssertionError, match = 'ERR_MIN_WEIGHT'):
+        WeightSchedule({'WETH': 40}, {'WETH': 0.5}, 0, 10)
+
+def test_apply_leaves_vault_unchanged_when_total_too_large(pool):
+    lp, dai, weth = pool
+    before = weights(lp)
+    schedule = WeightSchedule({'WETH': 40}, {'WETH': 45}, 0, 10)
+    with pytest.raises(AssertionError, match = 'ERR_MAX_TOTAL_WEIGHT'):
+        schedule.apply(lp.vault, 10)
+    assert weights(lp) == before
+    assert lp.tkn_weights['DAI'] == 0.2
+
+def test_set_weights_rejects_out_of_range(pool):
+    lp, dai, weth = pool
+    before = weights(lp)
+    for wts in ({'WETH': 60}, {'WETH': 0}, {'WETH': 39, 'DAI': 12}):
+        with pytest.raises(AssertionError):
+            lp.vault.set_weights(wts)
+    assert weights(lp) == before
+
+def test_set_weight_rejects_out_of_range(pool):
+    lp, dai, weth = pool
+    before = weights(lp)
+    for wt, err in ((0, 'ERR_MIN_WEIGHT'), (-5, 'ERR_MIN_WEIGHT'), (51, 'ERR_MAX_WEIGHT'), (45, 'ERR_MAX_TOTAL_WEIGHT')):
+        with pytest.raises(AssertionError, match = err):
+            lp.vault.set_weight('WETH', wt)
+    assert weights(lp) == before
+    lp.vault.set_weight('WETH', 30)
+    assert lp.tkn_weights['DAI'] == 0.25
+
+def test_set_bound_validates(pool):
+    lp, dai, weth = pool
+    with pytest.raises(AssertionError, match = 'BOUND NOT BOOLEAN'):
+        lp.vault.set_bound('DAI', 'yes')
+    lp.vault.set_bound('DAI', False)
+    lp.vault.set_weight('WETH', 45)
+    with pytest.raises(AssertionError, match = 'ERR_MAX_TOTAL_WEIGHT'):
+        lp.vault.set_bound('DAI', True)
+    assert lp.vault.get_bounds()['DAI'] is False
+    lp.vault.set_weight('WETH', 40)
+    lp.vault.set_bound('DAI', True)
+    assert lp.vault.get_total_denorm_weight() == 50
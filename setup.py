@@ -26,10 +26,18 @@ setup(name='BalancerPy',
           'balancerpy',
           'balancerpy.cwpt.exchg',
           'balancerpy.cwpt.exchg.result',
+          'balancerpy.cwpt.exchg.state',
           'balancerpy.cwpt.factory',
+          'balancerpy.cwpt.router',
           'balancerpy.erc',
           'balancerpy.vault',
           'balancerpy.quote',
+          'balancerpy.arb',
+          'balancerpy.valuation',
+          'balancerpy.sim',
+          'balancerpy.events',
+          'balancerpy.history',
+          'balancerpy.replay',
           'balancerpy.constants',
           'balancerpy.utils.interfaces',
           'balancerpy.utils.data',